@@ -0,0 +1,130 @@
+"""Measure what logging costs the mining loop under different logging setups."""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.logs import LOG_FORMAT, LOGGER_NAMES, configure_logging, stop_logging
+from blockchain.mining.mine import Miner
+from blockchain.wallet import Wallet
+
+LOGGING_BUDGET = 0.05  # Largest allowed throughput loss of the queued default setup
+SINK_LATENCY = 0.0002  # Seconds each write to the log sink blocks, like a busy terminal or disk
+
+class _SlowFileHandler(logging.FileHandler):
+    """File handler whose writes block for a fixed time."""
+
+    def __init__(self, path, latency):
+        super().__init__(path)
+        self.latency = latency
+
+    def emit(self, record):
+        super().emit(record)
+        time.sleep(self.latency)
+
+def _per_call(func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+def _blocks_per_second(seconds):
+    """Run a real mining loop at fixed difficulty 1 and count blocks."""
+    miner = Miner(Wallet(), Blockchain(difficulty=1), FractalCoordinate(100, 100, 100), auto_adjust_coords=False)
+    # Keep every round a handful of hashes, so the loop's own overhead dominates
+    miner.consensus.pofw._adjust_difficulty = lambda duration, score: None
+    miner.start()
+    time.sleep(seconds)
+    miner.stop()
+    return miner.stats.blocks_mined / seconds
+
+def _direct(handler, level):
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    for name in LOGGER_NAMES:
+        logger = logging.getLogger(name)
+        logger.addHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = False
+    return handler
+
+def _reset(handler=None):
+    stop_logging()
+    for name in LOGGER_NAMES:
+        logger = logging.getLogger(name)
+        if handler is not None:
+            logger.removeHandler(handler)
+        logger.setLevel(logging.WARNING)
+        logger.propagate = False
+    if handler is not None:
+        handler.close()
+
+def run(seconds, calls, latency, repeats):
+    logger = logging.getLogger("blockchain.core.transaction")
+    logger.setLevel(logging.INFO)
+    tx_id = "ab" * 32
+    eager = _per_call(lambda: logger.debug(f"Generated transaction ID: {tx_id[:8]}..."), calls)
+    lazy = _per_call(lambda: logger.debug("Generated transaction ID: %.8s...", tx_id), calls)
+    print("Disabled debug call in Transaction.__post_init__:")
+    print(f"  f-string            {eager * 1e9:>8.0f} ns")
+    print(f"  lazy %-formatting   {lazy * 1e9:>8.0f} ns")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "node.log")
+
+        def off():
+            pass
+
+        def direct_info():
+            return _direct(_SlowFileHandler(path, latency), logging.INFO)
+
+        def queued_debug():
+            configure_logging(logging.DEBUG, [_SlowFileHandler(path, latency)])
+
+        def queued_info():
+            configure_logging(logging.INFO, [_SlowFileHandler(path, latency)])
+
+        setups = {"off": off, "direct, INFO": direct_info, "queued, DEBUG": queued_debug, "queued, INFO": queued_info}
+        # Interleave the setups and keep each one's best run, the machine's noise only ever slows a run down
+        results = {name: 0.0 for name in setups}
+        for _ in range(repeats):
+            for name, setup in setups.items():
+                _reset()
+                handler = setup()
+                results[name] = max(results[name], _blocks_per_second(seconds))
+                _reset(handler)
+
+    print(f"\nMining loop throughput, best of {repeats} runs of {seconds:.0f}s per setup "
+          f"(sink writes block {latency * 1e6:.0f} us):")
+    baseline = results["off"]
+    for name, rate in results.items():
+        print(f"  {name:<20} {rate:>10.0f} blocks/s  {rate / baseline - 1:>+8.1%}")
+
+    loss = 1 - results["queued, INFO"] / baseline
+    within = loss <= LOGGING_BUDGET
+    print(f"\nDefault setup costs {loss:.1%} of throughput (budget {LOGGING_BUDGET:.0%})")
+    print("Within budget" if within else "OVER BUDGET")
+    return within
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=2.0,
+                        help="Seconds of mining per run")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Runs per logging setup, the best one is reported")
+    parser.add_argument("--calls", type=int, default=200_000,
+                        help="Calls per logging call measurement")
+    parser.add_argument("--sink-latency", type=float, default=SINK_LATENCY,
+                        help="Seconds each write to the log sink blocks")
+    args = parser.parse_args()
+    sys.exit(0 if run(args.seconds, args.calls, args.sink_latency, args.repeats) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare hashing.merkle_root with the byte-level MerkleTree."""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain.crypto.hashing import merkle_root
+from blockchain.crypto.merkle import MerkleTree, verify_proof
+
+DEFAULT_SIZES = [100, 10_000, 1_000_000]
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def _append_all(leaves):
+    tree = MerkleTree()
+    for leaf in leaves:
+        tree.append(leaf)
+    return tree
+
+def _verify_all(tree, leaves, samples):
+    step = max(1, len(leaves) // samples)
+    root = tree.root
+    for i in range(0, len(leaves), step):
+        assert verify_proof(leaves[i], i, tree.proof(i), root, len(leaves))
+
+def run(sizes):
+    print(f"{'leaves':>10} {'merkle_root':>14} {'MerkleTree':>14} {'append':>14} {'speedup':>8} {'proof+verify':>14}")
+    for size in sizes:
+        digests = [hashlib.sha256(str(i).encode()).digest() for i in range(size)]
+        hex_digests = [d.hex() for d in digests]
+
+        _, legacy = _timed(merkle_root, hex_digests)
+        tree, bulk = _timed(MerkleTree, digests)
+        _, incremental = _timed(_append_all, digests)
+        samples = min(size, 1000)
+        _, proofs = _timed(_verify_all, tree, digests, samples)
+
+        print(
+            f"{size:>10} "
+            f"{size / legacy:>10.0f} l/s "
+            f"{size / bulk:>10.0f} l/s "
+            f"{size / incremental:>10.0f} l/s "
+            f"{legacy / bulk:>7.1f}x "
+            f"{proofs / samples * 1e6:>10.1f} us"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Leaf counts to benchmark")
+    args = parser.parse_args()
+    run(args.sizes)
+
+if __name__ == "__main__":
+    main()
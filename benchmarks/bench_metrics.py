@@ -0,0 +1,118 @@
+"""Measure metrics registry overhead against the mining loop and add_block."""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain.core.block import Block
+from blockchain.core.blockchain import (
+    Blockchain, ADD_BLOCK_SECONDS, BLOCK_INTERVAL_SECONDS, BLOCKS_ADDED, CHAIN_HEIGHT, VALIDATE_BLOCK_SECONDS
+)
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.core.transaction import Transaction
+from blockchain.metrics import MetricsRegistry
+from blockchain.mining.mine import Miner
+from blockchain.mining.proof_of_work import BLOCK_REWARD, MAX_DIFFICULTY, ProofOfFractalWork
+from blockchain.wallet import Wallet
+
+MINING_BUDGET = 0.001  # Largest allowed share of a mining round spent on metrics
+ADD_BLOCK_BUDGET = 0.05  # Largest allowed share of add_block spent on metrics
+
+def _per_call(func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+def _next_block(blockchain, transactions):
+    block = Block(
+        index=len(blockchain.chain),
+        timestamp=time.time(),
+        transactions=[Transaction("network", "bench", BLOCK_REWARD)] + transactions,
+        previous_hash=blockchain.last_block.hash,
+        miner="bench",
+        fractal_coord=FractalCoordinate(100, 100, 100)
+    )
+    merkle_root = block.merkle_root()
+    while not block.calculate_hash(merkle_root).startswith("0" * blockchain.difficulty):
+        block.nonce += 1
+    block.hash = block.calculate_hash(merkle_root)
+    return block
+
+def run(calls, round_hashes, blocks, block_txs):
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "Counter", ["miner"]).labels("x")
+    gauge = registry.gauge("bench_gauge", "Gauge")
+    histogram = registry.histogram("bench_seconds", "Histogram")
+    print("Per-operation cost:")
+    for name, func in [
+        ("counter.inc", counter.inc),
+        ("gauge.set", lambda: gauge.set(1.0)),
+        ("histogram.observe", lambda: histogram.observe(0.003)),
+    ]:
+        print(f"  {name:<20} {_per_call(func, calls) * 1e9:>8.0f} ns")
+
+    # Mining: metrics are updated once per round of round_hashes hashes
+    logging.getLogger("triadnet.miner").disabled = True
+    blockchain = Blockchain(difficulty=1)
+    miner = Miner(Wallet(), blockchain, FractalCoordinate(100, 100, 100))
+    pofw = ProofOfFractalWork(difficulty=MAX_DIFFICULTY)
+    pofw.logger.disabled = True
+    block = _next_block(blockchain, [])
+    start = time.perf_counter()
+    result = pofw.mine_block(block, max_nonce=round_hashes)
+    round_time = time.perf_counter() - start
+    record = _per_call(lambda: miner._record_round(result), calls)
+    mining_share = record / round_time
+    print(f"\nMining round of {round_hashes} hashes: {round_time * 1e3:.1f} ms, "
+          f"metrics {record * 1e6:.2f} us ({mining_share:.5%}, budget {MINING_BUDGET:.3%})")
+
+    # add_block: three clock reads, three observations, a counter and a gauge
+    chain = Blockchain(difficulty=1)
+    pending = []
+    for i in range(blocks):
+        transactions = [Transaction("alice", "bob", float(i * block_txs + n + 1)) for n in range(block_txs)]
+        pending.append(_next_block(chain, transactions))
+        chain.chain.append(pending[-1])
+    fresh = Blockchain(difficulty=1)
+    start = time.perf_counter()
+    for block in pending:
+        fresh.add_block(block)
+    add_block = (time.perf_counter() - start) / blocks
+
+    def instrumentation():
+        started = time.perf_counter()
+        VALIDATE_BLOCK_SECONDS.observe(time.perf_counter() - started)
+        BLOCK_INTERVAL_SECONDS.observe(12.0)
+        BLOCKS_ADDED.inc()
+        CHAIN_HEIGHT.set(1)
+        ADD_BLOCK_SECONDS.observe(time.perf_counter() - started)
+    metrics = _per_call(instrumentation, calls)
+    add_block_share = metrics / add_block
+    print(f"add_block ({block_txs} transactions): {add_block * 1e6:.1f} us, metrics {metrics * 1e6:.2f} us "
+          f"({add_block_share:.2%}, budget {ADD_BLOCK_BUDGET:.0%})")
+
+    within = mining_share <= MINING_BUDGET and add_block_share <= ADD_BLOCK_BUDGET
+    print("\nWithin budget" if within else "\nOVER BUDGET")
+    return within
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000,
+                        help="Calls per per-operation measurement")
+    parser.add_argument("--round-hashes", type=int, default=20_000,
+                        help="Hashes per simulated mining round")
+    parser.add_argument("--blocks", type=int, default=200,
+                        help="Blocks appended in the add_block measurement")
+    parser.add_argument("--block-txs", type=int, default=10,
+                        help="Transactions per block in the add_block measurement")
+    args = parser.parse_args()
+    sys.exit(0 if run(args.calls, args.round_hashes, args.blocks, args.block_txs) else 1)
+
+if __name__ == "__main__":
+    main()
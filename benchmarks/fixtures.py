@@ -0,0 +1,171 @@
+"""Deterministic synthetic chains and mempools for the benchmark suite."""
+
+import logging
+import os
+import pickle
+import random
+from typing import List, Optional, Tuple
+
+from blockchain.core.block import Block
+from blockchain.core.blockchain import BLOCK_REWARD, GENESIS_TIMESTAMP, Blockchain
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.core.transaction import Transaction
+
+FIXTURE_VERSION = 2  # Bump when fixture contents change, so cached chains are rebuilt
+FIXTURE_SEED = 1337  # Seed of the transactions in synthetic chains
+MEMPOOL_SEED = 7331  # Seed of synthetic mempools, so they never repeat chain transactions
+FIXTURE_ADDRESSES = 100  # Distinct wallet addresses that send and receive
+CHAIN_TXS_PER_BLOCK = 2  # Transactions per synthetic block, besides the reward
+BLOCK_SPACING = 60.0  # Seconds between synthetic block timestamps
+TX_SPACING = 0.001  # Seconds between synthetic transaction timestamps, keeps tx IDs unique
+FIXTURE_MINER = "bench-miner"  # Miner of every synthetic block
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")  # Mined chains
+
+ADDRESSES = [f"bench-wallet-{n:03d}" for n in range(FIXTURE_ADDRESSES)]
+FIXTURE_COORD = FractalCoordinate(100, 100, 100)
+
+logger = logging.getLogger("triadnet.benchmarks")
+
+TransactionFields = Tuple[str, str, float, str, float]
+
+def transaction_fields(count: int, seed: int = FIXTURE_SEED, start: float = GENESIS_TIMESTAMP) -> List[TransactionFields]:
+    """
+    Field tuples of synthetic transfers between ADDRESSES.
+
+    Args:
+        count (int): Number of transactions
+        seed (int): Random seed; the same seed gives the same transactions
+        start (float): Timestamp of the first transaction
+
+    Returns:
+        List[TransactionFields]: (sender, receiver, amount, data, timestamp)
+    """
+    rng = random.Random(seed)
+    fields = []
+    for i in range(count):
+        sender = rng.randrange(FIXTURE_ADDRESSES)
+        receiver = (sender + 1 + rng.randrange(FIXTURE_ADDRESSES - 1)) % FIXTURE_ADDRESSES
+        amount = round(rng.uniform(0.01, 10.0), 2)
+        fields.append((ADDRESSES[sender], ADDRESSES[receiver], amount, "", start + i * TX_SPACING))
+    return fields
+
+def synthetic_mempool(count: int, seed: int = MEMPOOL_SEED) -> List[Transaction]:
+    """Synthetic pending transactions, ``count`` of them."""
+    return [Transaction(*fields) for fields in transaction_fields(count, seed)]
+
+def mine_block(
+    index: int,
+    previous_hash: str,
+    transactions: List[Transaction],
+    timestamp: float,
+    difficulty: int,
+    miner: str = FIXTURE_MINER
+) -> Block:
+    """
+    Build a block with a reward transaction and search its nonce.
+
+    Args:
+        index (int): Block height
+        previous_hash (str): Hash of the block before it
+        transactions (List[Transaction]): Transactions besides the reward
+        timestamp (float): Block timestamp, also used for the reward
+        difficulty (int): Leading zeros the hash needs
+        miner (str): Miner address receiving the reward
+
+    Returns:
+        Block: Block with a valid hash
+    """
+    reward = Transaction("network", miner, BLOCK_REWARD, "Mining Reward", timestamp)
+    block = Block(
+        index=index,
+        timestamp=timestamp,
+        transactions=[reward] + transactions,
+        previous_hash=previous_hash,
+        miner=miner,
+        fractal_coord=FIXTURE_COORD
+    )
+    merkle_root = block.merkle_root()
+    target = "0" * difficulty
+    block_hash = block.calculate_hash(merkle_root)
+    while not block_hash.startswith(target):
+        block.nonce += 1
+        block_hash = block.calculate_hash(merkle_root)
+    block.hash = block_hash
+    return block
+
+def synthetic_blocks(
+    count: int,
+    genesis_hash: str,
+    txs_per_block: int = CHAIN_TXS_PER_BLOCK,
+    difficulty: int = 1,
+    seed: int = FIXTURE_SEED
+) -> List[Block]:
+    """
+    Mine ``count`` blocks following a genesis block.
+
+    Args:
+        count (int): Number of blocks
+        genesis_hash (str): Hash of the genesis block they extend
+        txs_per_block (int): Transactions per block besides the reward
+        difficulty (int): Difficulty the blocks are mined at
+        seed (int): Seed of the transaction stream
+
+    Returns:
+        List[Block]: Blocks at heights 1 to ``count``
+    """
+    fields = transaction_fields(count * txs_per_block, seed, GENESIS_TIMESTAMP + TX_SPACING)
+    blocks = []
+    previous_hash = genesis_hash
+    for height in range(1, count + 1):
+        offset = (height - 1) * txs_per_block
+        transactions = [Transaction(*tx) for tx in fields[offset:offset + txs_per_block]]
+        block = mine_block(height, previous_hash, transactions, GENESIS_TIMESTAMP + height * BLOCK_SPACING, difficulty)
+        blocks.append(block)
+        previous_hash = block.hash
+    return blocks
+
+def synthetic_chain(
+    count: int,
+    txs_per_block: int = CHAIN_TXS_PER_BLOCK,
+    difficulty: int = 1,
+    seed: int = FIXTURE_SEED,
+    cache_dir: Optional[str] = CACHE_DIR
+) -> Blockchain:
+    """
+    A Blockchain holding ``count`` synthetic blocks after genesis.
+
+    Mining a large chain takes a while, so the blocks are pickled under
+    ``cache_dir`` and later loads only replay them through ``add_blocks``.
+    A cached chain that no longer validates, for instance after a change to
+    block hashing, is mined again.
+
+    Args:
+        count (int): Number of blocks after genesis
+        txs_per_block (int): Transactions per block besides the reward
+        difficulty (int): Chain difficulty
+        seed (int): Seed of the transaction stream
+        cache_dir (Optional[str]): Cache directory, None to always mine
+
+    Returns:
+        Blockchain: Chain of height ``count``
+    """
+    name = f"chain-v{FIXTURE_VERSION}-{count}x{txs_per_block}-d{difficulty}-s{seed}.pickle"
+    path = os.path.join(cache_dir, name) if cache_dir else None
+    if path and os.path.exists(path):
+        chain = Blockchain(difficulty)
+        try:
+            with open(path, "rb") as f:
+                chain.add_blocks(pickle.load(f))
+            return chain
+        except Exception as e:
+            logger.warning(f"Discarding cached chain {path}: {str(e)}")
+
+    chain = Blockchain(difficulty)
+    logger.info(f"Mining a synthetic chain of {count} blocks")
+    blocks = synthetic_blocks(count, chain.chain[0].hash, txs_per_block, difficulty, seed)
+    chain.add_blocks(blocks)
+    if path:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(blocks, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return chain
@@ -0,0 +1,348 @@
+"""Micro and macro benchmark suite with JSON results and regression checks.
+
+Run the suite and save its results:
+
+    python benchmarks/suite.py run --output results.json
+
+Compare a run against a saved baseline; the command exits with status 1
+when a metric got worse by more than its threshold:
+
+    python benchmarks/suite.py compare baseline.json results.json
+    python benchmarks/suite.py run --baseline baseline.json
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import (
+    ADDRESSES, CACHE_DIR, FIXTURE_COORD, FIXTURE_MINER, GENESIS_TIMESTAMP,
+    mine_block, synthetic_chain, synthetic_mempool, transaction_fields
+)
+from blockchain.core.block import Block
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.transaction import Transaction
+from blockchain.mining.proof_of_work import ConsensusManager
+
+RESULTS_VERSION = 1  # Format version of the results file
+DEFAULT_THRESHOLD = 0.10  # Largest allowed relative slowdown of a metric
+MINING_THRESHOLD = 0.20  # Mining rates depend on the nonces the run happens to hit
+DEFAULT_REPEATS = 5  # Timing runs per micro benchmark; the fastest one is kept
+MEMPOOL_SIZE = 10_000  # Transactions in the synthetic mempool
+VALIDATE_BLOCK_TXS = 100  # Transactions in the block validated, the consensus maximum
+MINING_BLOCK_TXS = 10  # Pending transactions added before each mined block
+LARGE_CHAIN = 10_000  # Chains longer than this are scanned once per metric
+
+PROFILES = {
+    "quick": {"chains": [1_000], "difficulties": [1, 2, 3]},
+    "full": {"chains": [1_000, 100_000], "difficulties": [1, 2, 3, 4]},
+}  # Fixture sizes per profile
+
+MINING_BLOCKS = {1: 200, 2: 100, 3: 20, 4: 4}  # Blocks mined per difficulty
+
+LOWER = "lower"  # Smaller values are better, as for durations
+HIGHER = "higher"  # Larger values are better, as for rates
+
+Metric = Dict[str, Any]
+
+def metric(name: str, value: float, unit: str = "s", better: str = LOWER, threshold: float = DEFAULT_THRESHOLD) -> Metric:
+    return {"name": name, "value": value, "unit": unit, "better": better, "threshold": threshold}
+
+def best_time(func: Callable[[], Any], repeats: int, number: Optional[int] = None) -> float:
+    """
+    Fastest per-call time of ``func`` over ``repeats`` timing runs.
+
+    Args:
+        func (Callable[[], Any]): Code to time
+        repeats (int): Timing runs; the fastest is kept, since noise on the
+            machine only ever slows a run down
+        number (Optional[int]): Calls per run, default enough calls for a
+            run to take at least 0.2 seconds
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+def _size_label(size: int) -> str:
+    return f"{size // 1000}k" if size >= 1000 and size % 1000 == 0 else str(size)
+
+class Fixtures:
+    """
+    Fixtures shared by the benchmarks of one run, built on first use.
+
+    Attributes:
+        profile (str): Key of PROFILES
+        repeats (int): Timing runs per micro benchmark
+        cache_dir (Optional[str]): Where mined chains are cached
+    """
+
+    def __init__(self, profile: str, repeats: int, cache_dir: Optional[str] = CACHE_DIR):
+        self.profile = profile
+        self.repeats = repeats
+        self.cache_dir = cache_dir
+        self._chains: Dict[int, Blockchain] = {}
+        self._mempool: Optional[List[Transaction]] = None
+
+    @property
+    def chain_sizes(self) -> List[int]:
+        return PROFILES[self.profile]["chains"]
+
+    @property
+    def difficulties(self) -> List[int]:
+        return PROFILES[self.profile]["difficulties"]
+
+    @property
+    def mempool(self) -> List[Transaction]:
+        if self._mempool is None:
+            self._mempool = synthetic_mempool(MEMPOOL_SIZE)
+        return self._mempool
+
+    def chain(self, size: int) -> Blockchain:
+        if size not in self._chains:
+            self._chains[size] = synthetic_chain(size, cache_dir=self.cache_dir)
+        return self._chains[size]
+
+    def repeats_for(self, size: int) -> int:
+        return self.repeats if size <= LARGE_CHAIN else 1
+
+    def number_for(self, size: int) -> Optional[int]:
+        return None if size <= LARGE_CHAIN else 1
+
+def bench_hashing(fixtures: Fixtures) -> List[Metric]:
+    """Header hash with a precomputed Merkle root, as in the nonce search, and a transaction hash."""
+    block = mine_block(1, "0" * 64, fixtures.mempool[:VALIDATE_BLOCK_TXS - 1], GENESIS_TIMESTAMP, 1)
+    merkle_root = block.merkle_root()
+    tx = fixtures.mempool[0]
+    return [
+        metric("block_hash", best_time(lambda: block.calculate_hash(merkle_root), fixtures.repeats)),
+        metric("tx_hash", best_time(tx.calculate_hash, fixtures.repeats)),
+    ]
+
+def bench_transactions(fixtures: Fixtures) -> List[Metric]:
+    """Transaction construction: validation and ID hashing in __post_init__."""
+    fields = transaction_fields(MEMPOOL_SIZE)
+    batch = best_time(lambda: [Transaction(*tx) for tx in fields], fixtures.repeats, 1)
+    return [metric("tx_construct", batch / len(fields))]
+
+def bench_merkle(fixtures: Fixtures) -> List[Metric]:
+    """Merkle roots of a full block and of the whole mempool."""
+    metrics = []
+    for count in (VALIDATE_BLOCK_TXS, MEMPOOL_SIZE):
+        block = Block(1, GENESIS_TIMESTAMP, fixtures.mempool[:count], FIXTURE_MINER, FIXTURE_COORD)
+        metrics.append(metric(f"merkle_root_{_size_label(count)}", best_time(block.merkle_root, fixtures.repeats)))
+    return metrics
+
+def bench_validation(fixtures: Fixtures) -> List[Metric]:
+    """Validation of a full block against the tip, and of whole chains."""
+    chain = fixtures.chain(fixtures.chain_sizes[0])
+    block = mine_block(
+        len(chain.chain), chain.last_block.hash, fixtures.mempool[:VALIDATE_BLOCK_TXS - 1],
+        chain.last_block.timestamp + 60, chain.difficulty
+    )
+    metrics = [metric("block_validate", best_time(lambda: chain._is_valid_block(block), fixtures.repeats))]
+    for size in fixtures.chain_sizes:
+        chain = fixtures.chain(size)
+        assert chain.is_valid_chain(), f"Synthetic chain of {size} blocks does not validate"
+        elapsed = best_time(chain.is_valid_chain, fixtures.repeats_for(size), fixtures.number_for(size))
+        metrics.append(metric(f"is_valid_chain_{_size_label(size)}", elapsed))
+    return metrics
+
+def bench_balance(fixtures: Fixtures) -> List[Metric]:
+    """Balance queries, which scan the whole chain."""
+    metrics = []
+    for size in fixtures.chain_sizes:
+        chain = fixtures.chain(size)
+        elapsed = best_time(lambda: chain.get_balance(ADDRESSES[0]), fixtures.repeats_for(size), fixtures.number_for(size))
+        metrics.append(metric(f"get_balance_{_size_label(size)}", elapsed))
+    return metrics
+
+def bench_mining(fixtures: Fixtures) -> List[Metric]:
+    """
+    End-to-end mining: template, nonce search, add_block and mempool pruning.
+
+    The difficulty is pinned so each run mines at the level it names. The
+    rate is hashes per wall-clock second of the whole loop, so at low
+    difficulty it mostly measures the per-block work around the search.
+    """
+    metrics = []
+    mempool = fixtures.mempool
+    for difficulty in fixtures.difficulties:
+        blockchain = Blockchain(difficulty=difficulty)
+        consensus = ConsensusManager(blockchain)
+        consensus.pofw.difficulty = difficulty
+        consensus.pofw.target = "0" * difficulty
+        consensus.pofw._adjust_difficulty = lambda duration, score: None
+        hashes = 0
+        started = time.perf_counter()
+        for i in range(MINING_BLOCKS[difficulty]):
+            for tx in mempool[i * MINING_BLOCK_TXS:(i + 1) * MINING_BLOCK_TXS]:
+                blockchain.add_pending_transaction(tx)
+            block = consensus.create_block(FIXTURE_MINER, FIXTURE_COORD)
+            result = consensus.mine_block(block)
+            assert result.success, f"Mining failed at difficulty {difficulty}"
+            hashes += result.attempts
+        elapsed = time.perf_counter() - started
+        metrics.append(metric(f"mine_d{difficulty}", hashes / elapsed, "hashes/s", HIGHER, MINING_THRESHOLD))
+    return metrics
+
+BENCHMARKS = {
+    "hashing": bench_hashing,
+    "transactions": bench_transactions,
+    "merkle": bench_merkle,
+    "validation": bench_validation,
+    "balance": bench_balance,
+    "mining": bench_mining,
+}  # Benchmark groups, in run order
+
+def format_value(value: float, unit: str) -> str:
+    if unit != "s":
+        return f"{value:,.0f} {unit}"
+    for scale, suffix in ((1, "s"), (1e-3, "ms"), (1e-6, "us")):
+        if value >= scale:
+            return f"{value / scale:.3f} {suffix}"
+    return f"{value / 1e-9:.1f} ns"
+
+def run(profile: str, repeats: int, groups: Sequence[str], cache_dir: Optional[str] = CACHE_DIR) -> Dict[str, Any]:
+    """
+    Run benchmark groups and collect their metrics.
+
+    Args:
+        profile (str): Key of PROFILES
+        repeats (int): Timing runs per micro benchmark
+        groups (Sequence[str]): Keys of BENCHMARKS to run
+        cache_dir (Optional[str]): Where mined chains are cached
+
+    Returns:
+        Dict[str, Any]: Results in the format ``compare`` reads
+    """
+    fixtures = Fixtures(profile, repeats, cache_dir)
+    metrics: Dict[str, Metric] = {}
+    for group in groups:
+        for result in BENCHMARKS[group](fixtures):
+            metrics[result["name"]] = result
+            print(f"{result['name']:<22} {format_value(result['value'], result['unit']):>20}", flush=True)
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "profile": profile,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "metrics": metrics,
+    }
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Compare two result sets metric by metric.
+
+    Args:
+        baseline (Dict[str, Any]): Results to compare against
+        current (Dict[str, Any]): New results
+        threshold (Optional[float]): Relative slowdown allowed for every
+            metric, default each metric's own threshold
+
+    Returns:
+        List[Dict[str, Any]]: One row per metric with its baseline and
+        current values, the relative change (positive means slower) and a
+        status: "ok", "improved", "regressed", "new" or "missing"
+    """
+    rows = []
+    old_metrics = baseline["metrics"]
+    new_metrics = current["metrics"]
+    for name in list(old_metrics) + [name for name in new_metrics if name not in old_metrics]:
+        old, new = old_metrics.get(name), new_metrics.get(name)
+        row = {"name": name, "baseline": old and old["value"], "current": new and new["value"], "change": None}
+        if old is None or new is None:
+            row["status"] = "new" if old is None else "missing"
+            rows.append(row)
+            continue
+        if new["better"] == HIGHER:
+            change = old["value"] / new["value"] - 1 if new["value"] else float("inf")
+        else:
+            change = new["value"] / old["value"] - 1 if old["value"] else 0.0
+        limit = new.get("threshold", DEFAULT_THRESHOLD) if threshold is None else threshold
+        row["change"] = change
+        row["unit"] = new["unit"]
+        row["status"] = "regressed" if change > limit else "improved" if change < -limit else "ok"
+        rows.append(row)
+    return rows
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'metric':<22} {'baseline':>20} {'current':>20} {'slowdown':>9}  status"]
+    for row in rows:
+        unit = row.get("unit", "s")
+        baseline = format_value(row["baseline"], unit) if row["baseline"] is not None else "-"
+        current = format_value(row["current"], unit) if row["current"] is not None else "-"
+        change = f"{row['change']:+.1%}" if row["change"] is not None else "-"
+        lines.append(f"{row['name']:<22} {baseline:>20} {current:>20} {change:>9}  {row['status']}")
+    return "\n".join(lines)
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"{path} has results format {results.get('version')}, expected {RESULTS_VERSION}")
+    return results
+
+def _report(baseline: Dict[str, Any], current: Dict[str, Any], threshold: Optional[float]) -> int:
+    rows = compare(baseline, current, threshold)
+    print(format_comparison(rows))
+    regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"\nRegressed: {', '.join(regressed)}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark suite with regression thresholds")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--profile", choices=sorted(PROFILES), default="full",
+                            help="Fixture sizes: quick uses a 1k-block chain and difficulty up to 3")
+    run_parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                            help="Benchmark groups to run")
+    run_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                            help="Timing runs per micro benchmark, the fastest is kept")
+    run_parser.add_argument("--output", help="Write the results to this JSON file")
+    run_parser.add_argument("--baseline", help="Compare the results against this JSON file")
+    run_parser.add_argument("--threshold", type=float,
+                            help="Allowed relative slowdown for every metric, default per metric")
+    run_parser.add_argument("--no-cache", action="store_true", help="Mine synthetic chains even if cached")
+
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline", help="Results to compare against")
+    compare_parser.add_argument("current", help="New results")
+    compare_parser.add_argument("--threshold", type=float,
+                                help="Allowed relative slowdown for every metric, default per metric")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _report(_load(args.baseline), _load(args.current), args.threshold)
+
+    for name in ("triadnet", "blockchain"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    baseline = _load(args.baseline) if args.baseline else None
+    results = run(args.profile, args.repeats, args.only, None if args.no_cache else CACHE_DIR)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+    if baseline is not None:
+        print()
+        return _report(baseline, results, args.threshold)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
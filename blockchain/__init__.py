@@ -3,7 +3,7 @@
 from blockchain.wallet import Wallet
 from blockchain.core.blockchain import Blockchain
 from blockchain.core.block import Block
-from blockchain.core.transaction import Transaction
+from blockchain.core.transaction import Transaction, MultiOutputTransaction
 from blockchain.core.fractal_coordinate import FractalCoordinate
 from blockchain.mining.mine import Miner
 
@@ -14,6 +14,7 @@ __all__ = [
     "Blockchain",
     "Block",
     "Transaction",
+    "MultiOutputTransaction",
     "FractalCoordinate",
     "Miner"
 ]
@@ -44,10 +44,11 @@ class ProofOfFractalWork:
     def mine_block(self, block: Block, max_nonce: int = 1000000) -> MiningResult:
         start_time = time.time()
         fractal_score = self._calculate_fractal_score(block.fractal_coord)
+        merkle_root = block.merkle_root()
         nonce = 0
         while nonce < max_nonce:
             block.nonce = nonce
-            block_hash = block.calculate_hash()
+            block_hash = block.calculate_hash(merkle_root)
             if block_hash.startswith(self.target):
                 duration = time.time() - start_time
                 block.hash = block_hash  # Set the block hash
@@ -98,11 +99,7 @@ class ConsensusManager:
         result = self.pofw.mine_block(block)
         if result.success:
             if self.blockchain.add_block(result.block):  # Use result.block which has the hash set
-                mined_tx_ids = {tx.tx_id for tx in block.transactions}
-                self.blockchain.pending_transactions = [
-                    tx for tx in self.blockchain.pending_transactions 
-                    if tx.tx_id not in mined_tx_ids
-                ]
+                self.blockchain.remove_confirmed_transactions(block)
                 self.logger.info(f"Block {block.index} added to chain")
             else:
                 result.success = False
@@ -1,11 +1,14 @@
 from blockchain.core.blockchain import Blockchain
 from blockchain.core.block import Block
-from blockchain.core.transaction import Transaction
+from blockchain.core.transaction import Transaction, MultiOutputTransaction
 from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.core.light_client import LightClient
 
 __all__ = [
     "Blockchain",
     "Block",
     "Transaction",
-    "FractalCoordinate"
+    "MultiOutputTransaction",
+    "FractalCoordinate",
+    "LightClient"
 ]
@@ -7,6 +7,7 @@ import json
 import logging
 from .transaction import Transaction
 from .fractal_coordinate import FractalCoordinate
+from ..crypto.merkle import MerkleTree, hash_leaf
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,148 @@ class BlockValidationError(BlockError):
     """Raised when block validation fails."""
     pass
 
+def transaction_leaf(tx: Transaction) -> bytes:
+    """
+    Get the Merkle leaf digest committing to a transaction's full contents.
+    
+    Args:
+        tx (Transaction): Transaction to hash
+        
+    Returns:
+        bytes: 32-byte SHA-256 digest of the canonical transaction JSON
+    """
+    return hash_leaf(json.dumps(tx.__dict__, sort_keys=True).encode())
+
+def compute_header_hash(
+    index: int,
+    timestamp: float,
+    previous_hash: str,
+    merkle_root: str,
+    miner: str,
+    fractal_coord: FractalCoordinate,
+    nonce: int,
+    tx_count: int
+) -> str:
+    """
+    Calculate the SHA-256 hash of a block header.
+    
+    The transaction count is committed alongside the Merkle root so that a
+    header alone bounds the leaf positions an inclusion proof may claim.
+    
+    Returns:
+        str: The hexadecimal representation of the header hash
+    """
+    header_dict = {
+        "index": index,
+        "timestamp": timestamp,
+        "previous_hash": previous_hash,
+        "merkle_root": merkle_root,
+        "miner": miner,
+        "fractal_coord": {
+            "a": fractal_coord.a,
+            "b": fractal_coord.b,
+            "c": fractal_coord.c
+        },
+        "nonce": nonce,
+        "tx_count": tx_count
+    }
+    header_string = json.dumps(header_dict, sort_keys=True)
+    return hashlib.sha256(header_string.encode()).hexdigest()
+
+@dataclass
+class BlockHeader:
+    """
+    The fields of a block that its hash commits to, without transactions.
+    
+    Transactions are committed through the Merkle root and their count, so a
+    header is enough to check proof of work, chain linkage and Merkle
+    inclusion proofs.
+    
+    Attributes:
+        index (int): Block's position in the chain
+        timestamp (float): Unix timestamp of block creation
+        previous_hash (str): Hash of the previous block
+        merkle_root (str): Hex Merkle root of the block's transactions
+        miner (str): Address of the miner who created the block
+        fractal_coord (FractalCoordinate): Fractal coordinates used in mining
+        nonce (int): Nonce used to find valid hash
+        hash (str): The block's hash
+        tx_count (int): Number of transactions in the block
+    """
+    
+    index: int
+    timestamp: float
+    previous_hash: str
+    merkle_root: str
+    miner: str
+    fractal_coord: FractalCoordinate
+    nonce: int = 0
+    hash: str = ""
+    tx_count: int = 0
+    
+    def calculate_hash(self) -> str:
+        """
+        Calculate the header hash, which equals the block hash.
+        
+        Returns:
+            str: The hexadecimal representation of the header hash
+        """
+        return compute_header_hash(
+            self.index, self.timestamp, self.previous_hash, self.merkle_root,
+            self.miner, self.fractal_coord, self.nonce, self.tx_count
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the header to a dictionary representation.
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing all header attributes
+        """
+        return {
+            "index": self.index,
+            "timestamp": self.timestamp,
+            "previous_hash": self.previous_hash,
+            "merkle_root": self.merkle_root,
+            "miner": self.miner,
+            "fractal_coord": self.fractal_coord.to_dict(),
+            "nonce": self.nonce,
+            "hash": self.hash,
+            "tx_count": self.tx_count
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BlockHeader':
+        """
+        Create a BlockHeader instance from a dictionary.
+        
+        Args:
+            data (Dict[str, Any]): Dictionary containing header data
+            
+        Returns:
+            BlockHeader: A new BlockHeader instance
+            
+        Raises:
+            BlockValidationError: If the dictionary is missing required fields
+            or contains invalid data
+        """
+        try:
+            return cls(
+                index=data["index"],
+                timestamp=data["timestamp"],
+                previous_hash=data["previous_hash"],
+                merkle_root=data["merkle_root"],
+                miner=data["miner"],
+                fractal_coord=FractalCoordinate.from_dict(data["fractal_coord"]),
+                nonce=data.get("nonce", 0),
+                hash=data.get("hash", ""),
+                tx_count=data.get("tx_count", 0)
+            )
+        except KeyError as e:
+            raise BlockValidationError(f"Missing required field: {str(e)}")
+        except Exception as e:
+            raise BlockValidationError(f"Failed to create header from dictionary: {str(e)}")
+
 @dataclass
 class Block:
     """
@@ -91,12 +234,57 @@ class Block:
             logger.error(f"Block validation failed: {str(e)}")
             raise BlockValidationError(f"Block validation failed: {str(e)}")
     
-    def calculate_hash(self) -> str:
+    def merkle_tree(self) -> MerkleTree:
+        """
+        Build the Merkle tree over this block's transactions.
+        
+        Returns:
+            MerkleTree: Tree whose leaves are transaction_leaf() digests
+        """
+        return MerkleTree(transaction_leaf(tx) for tx in self.transactions)
+    
+    def merkle_root(self) -> str:
+        """
+        Calculate the Merkle root of this block's transactions.
+        
+        Returns:
+            str: Hex Merkle root
+        """
+        return self.merkle_tree().root_hex
+    
+    def header(self, merkle_root: Optional[str] = None) -> BlockHeader:
+        """
+        Get this block's header.
+        
+        Args:
+            merkle_root (Optional[str]): Precomputed Merkle root, if available
+            
+        Returns:
+            BlockHeader: Header with the block's current hash
+        """
+        return BlockHeader(
+            index=self.index,
+            timestamp=self.timestamp,
+            previous_hash=self.previous_hash,
+            merkle_root=merkle_root or self.merkle_root(),
+            miner=self.miner,
+            fractal_coord=self.fractal_coord,
+            nonce=self.nonce,
+            hash=self.hash,
+            tx_count=len(self.transactions)
+        )
+    
+    def calculate_hash(self, merkle_root: Optional[str] = None) -> str:
         """
         Calculate the SHA-256 hash of the block.
         
-        The hash is calculated from a JSON string containing all block attributes
-        except the hash itself.
+        The hash covers the block header: index, timestamp, previous hash,
+        miner, fractal coordinates, nonce, and the Merkle root and count of
+        the transactions. Miners pass a precomputed ``merkle_root`` so that each
+        nonce attempt hashes only the header.
+        
+        Args:
+            merkle_root (Optional[str]): Precomputed Merkle root, if available
         
         Returns:
             str: The hexadecimal representation of the block's hash
@@ -105,21 +293,11 @@ class Block:
             BlockError: If hash calculation fails
         """
         try:
-            block_dict = {
-                "index": self.index,
-                "timestamp": self.timestamp,
-                "transactions": [tx.__dict__ for tx in self.transactions],
-                "previous_hash": self.previous_hash,
-                "miner": self.miner,
-                "fractal_coord": {
-                    "a": self.fractal_coord.a,
-                    "b": self.fractal_coord.b,
-                    "c": self.fractal_coord.c
-                },
-                "nonce": self.nonce
-            }
-            block_string = json.dumps(block_dict, sort_keys=True)
-            return hashlib.sha256(block_string.encode()).hexdigest()
+            return compute_header_hash(
+                self.index, self.timestamp, self.previous_hash,
+                merkle_root or self.merkle_root(),
+                self.miner, self.fractal_coord, self.nonce, len(self.transactions)
+            )
             
         except Exception as e:
             logger.error(f"Hash calculation failed: {str(e)}")
@@ -173,7 +351,7 @@ class Block:
             
             # Create Transaction instances
             transactions = [
-                Transaction(**tx) for tx in data.get("transactions", [])
+                Transaction.from_dict(tx) for tx in data.get("transactions", [])
             ]
             
             # Create Block instance
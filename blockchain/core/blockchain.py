@@ -1,11 +1,16 @@
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 import json
 import logging
+import time
 from dataclasses import dataclass, field
-from .block import Block
+from .block import Block, BlockHeader
+from .events import EventBus
 from .transaction import Transaction
 from .fractal_coordinate import FractalCoordinate
+from ..logs import LogRateLimiter
+from ..metrics import REGISTRY
+from ..tracing import TRACER, PHASE_APPEND, PHASE_MEMPOOL_PRUNE, PHASE_VALIDATE
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +20,31 @@ MAX_PENDING_TRANSACTIONS = 1000   # Maximum size of transaction pool
 BLOCK_REWARD = 50                 # Mining reward per block
 MIN_DIFFICULTY = 1                # Minimum mining difficulty
 MAX_DIFFICULTY = 32               # Maximum mining difficulty
+GENESIS_TIMESTAMP = 1746921600.0  # Fixed genesis time (2025-05-11 00:00 UTC) shared by all nodes
+
+# Metrics
+ADD_BLOCK_SECONDS = REGISTRY.histogram(
+    "triadnet_add_block_seconds", "Time to validate and append a block"
+)
+VALIDATE_BLOCK_SECONDS = REGISTRY.histogram(
+    "triadnet_validate_block_seconds", "Time spent validating a block"
+)
+BLOCK_INTERVAL_SECONDS = REGISTRY.histogram(
+    "triadnet_block_interval_seconds", "Timestamp difference between consecutive blocks",
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+)
+BLOCKS_ADDED = REGISTRY.counter("triadnet_blocks_added_total", "Blocks appended to the chain")
+CHAIN_HEIGHT = REGISTRY.gauge("triadnet_chain_height", "Height of the chain tip")
+MEMPOOL_SIZE = REGISTRY.gauge("triadnet_mempool_transactions", "Transactions in the pending pool")
+MEMPOOL_ADMITTED = REGISTRY.counter(
+    "triadnet_mempool_admitted_total", "Transactions admitted to the pending pool"
+)
+MEMPOOL_REJECTED = REGISTRY.counter(
+    "triadnet_mempool_rejected_total", "Transactions refused by the pending pool"
+)
+GET_BALANCE_SECONDS = REGISTRY.histogram(
+    "triadnet_get_balance_seconds", "Time to compute an address balance"
+)
 
 class BlockchainError(Exception):
     """Base exception for blockchain-related errors."""
@@ -60,6 +90,7 @@ class Blockchain:
         pending_transactions (List[Transaction]): Transactions waiting to be included in blocks
         difficulty (int): The mining difficulty (number of leading zeros required in block hash)
         stats (ChainStats): Statistics about the blockchain
+        events (EventBus): Publishes appended blocks and new pending transactions
     """
     
     def __init__(self, difficulty: int = 4) -> None:
@@ -82,6 +113,11 @@ class Blockchain:
         self.pending_transactions: List[Transaction] = []
         self.difficulty = difficulty
         self.stats = ChainStats()
+        self.events = EventBus()
+        self._block_heights: Dict[str, int] = {}
+        self._tx_locations: Dict[str, Tuple[int, int]] = {}
+        self._pending_ids: Set[str] = set()
+        self._block_log = LogRateLimiter()
         
         logger.info(f"Initializing blockchain with difficulty {difficulty}")
         if not self.chain:
@@ -92,13 +128,14 @@ class Blockchain:
         Create and add the genesis (first) block to the blockchain.
         
         The genesis block has index 0, no transactions, and a previous hash of 64 zeros.
-        Its fractal coordinates are set to (0,0,0).
+        Its fractal coordinates are set to (0,0,0) and its timestamp to
+        GENESIS_TIMESTAMP, so every node derives the same genesis hash.
         """
         try:
             genesis_coord = FractalCoordinate(a=0, b=0, c=0)
             genesis_block = Block(
                 index=0,
-                timestamp=datetime.utcnow().timestamp(),
+                timestamp=GENESIS_TIMESTAMP,
                 transactions=[],
                 previous_hash="0" * 64,
                 miner="network",
@@ -106,6 +143,7 @@ class Blockchain:
             )
             genesis_block.hash = genesis_block.calculate_hash()
             self.chain.append(genesis_block)
+            self._index_block(genesis_block)
             
             self.stats.total_blocks = 1
             self.stats.last_block_time = genesis_block.timestamp
@@ -138,46 +176,223 @@ class Blockchain:
         Raises:
             InvalidBlockError: If the block fails validation checks
         """
+        started = time.perf_counter()
         try:
             if not isinstance(block, Block):
                 raise InvalidBlockError("Invalid block type")
                 
-            if not self._is_valid_block(block):
+            valid = self._is_valid_block(block)
+            validated = time.perf_counter()
+            VALIDATE_BLOCK_SECONDS.observe(validated - started)
+            TRACER.record(block.index, PHASE_VALIDATE, validated - started)
+            if not valid:
                 logger.warning(f"Block {block.index} validation failed")
                 return False
                 
-            # Update chain
-            self.chain.append(block)
-            
-            # Update statistics
-            self.stats.total_blocks += 1
-            self.stats.total_transactions += len(block.transactions)
-            
-            # Track processed transactions
-            for tx in block.transactions:
-                self.stats.processed_tx_ids.add(tx.tx_id)
-                if tx.sender == "network":  # Mining reward
-                    self.stats.total_rewards += tx.amount
-                    
-            # Update timing statistics
-            current_time = block.timestamp
-            if self.stats.last_block_time > 0:
-                block_time = current_time - self.stats.last_block_time
-                self.stats.average_block_time = (
-                    (self.stats.average_block_time * (self.stats.total_blocks - 1) + block_time)
-                    / self.stats.total_blocks
+            self._append_block(block)
+            TRACER.record(block.index, PHASE_APPEND, time.perf_counter() - validated)
+            if self._block_log.allow():
+                logger.info(
+                    "Block %d added to chain with hash: %.10s... (%d transactions, "
+                    "%d similar messages suppressed)",
+                    block.index, block.hash, len(block.transactions), self._block_log.suppressed
                 )
-            self.stats.last_block_time = current_time
-            
-            logger.info(
-                f"Block {block.index} added to chain with hash: {block.hash[:10]}... "
-                f"({len(block.transactions)} transactions)"
-            )
             return True
             
         except Exception as e:
             logger.error(f"Error adding block: {str(e)}")
             raise BlockchainError(f"Failed to add block: {str(e)}")
+            
+        finally:
+            ADD_BLOCK_SECONDS.observe(time.perf_counter() - started)
+            
+    def add_blocks(self, blocks: List[Block]) -> int:
+        """
+        Validate and append consecutive blocks in one batch.
+        
+        Each block is validated against the block before it, exactly as in
+        add_block, but statistics and logging are handled once per batch,
+        which is what initial block download uses to apply downloaded
+        blocks.
+        
+        Args:
+            blocks (List[Block]): Consecutive blocks following the chain tip
+            
+        Returns:
+            int: Number of blocks added
+            
+        Raises:
+            BlockchainError: If a block fails validation; blocks before it
+            remain in the chain
+        """
+        added = 0
+        try:
+            for block in blocks:
+                if not isinstance(block, Block):
+                    raise InvalidBlockError("Invalid block type")
+                started = time.perf_counter()
+                valid = self._is_valid_block(block)
+                validated = time.perf_counter()
+                VALIDATE_BLOCK_SECONDS.observe(validated - started)
+                TRACER.record(block.index, PHASE_VALIDATE, validated - started)
+                if not valid:
+                    raise InvalidBlockError(f"Block {block.index} validation failed")
+                self._append_block(block)
+                TRACER.record(block.index, PHASE_APPEND, time.perf_counter() - validated)
+                added += 1
+                
+        except Exception as e:
+            logger.error(f"Error adding block batch after {added} blocks: {str(e)}")
+            raise BlockchainError(f"Failed to add blocks: {str(e)}")
+            
+        finally:
+            if added:
+                logger.info(
+                    f"Added {added} blocks to chain, height {len(self.chain) - 1} "
+                    f"with hash: {self.last_block.hash[:10]}..."
+                )
+        return added
+        
+    def _append_block(self, block: Block) -> None:
+        """
+        Append a validated block and update indexes and statistics.
+        
+        Args:
+            block (Block): Block that passed validation
+        """
+        self.chain.append(block)
+        self._index_block(block)
+        
+        # Update statistics
+        self.stats.total_blocks += 1
+        self.stats.total_transactions += len(block.transactions)
+        
+        # Track processed transactions
+        for tx in block.transactions:
+            self.stats.processed_tx_ids.add(tx.tx_id)
+            if tx.sender == "network":  # Mining reward
+                self.stats.total_rewards += tx.amount
+                
+        # Update timing statistics
+        current_time = block.timestamp
+        if self.stats.last_block_time > 0:
+            block_time = current_time - self.stats.last_block_time
+            BLOCK_INTERVAL_SECONDS.observe(block_time)
+            self.stats.average_block_time = (
+                (self.stats.average_block_time * (self.stats.total_blocks - 1) + block_time)
+                / self.stats.total_blocks
+            )
+        self.stats.last_block_time = current_time
+        BLOCKS_ADDED.inc()
+        CHAIN_HEIGHT.set(block.index)
+        self.events.publish_block(block)
+        
+    def _index_block(self, block: Block) -> None:
+        """
+        Record a block's hash and transaction positions for lookups.
+        
+        Args:
+            block (Block): Block that was just appended to the chain
+        """
+        self._block_heights[block.hash] = block.index
+        for position, tx in enumerate(block.transactions):
+            self._tx_locations[tx.tx_id] = (block.index, position)
+        
+    def get_block_by_hash(self, block_hash: str) -> Optional[Block]:
+        """
+        Look up a block in the chain by its hash.
+        
+        Args:
+            block_hash (str): Hash of the block
+            
+        Returns:
+            Optional[Block]: The block, or None if it is not in the chain
+        """
+        height = self._block_heights.get(block_hash)
+        if height is None or height >= len(self.chain):
+            return None
+        block = self.chain[height]
+        return block if block.hash == block_hash else None
+        
+    def get_locator(self) -> List[str]:
+        """
+        Build a block locator for syncing with a peer.
+        
+        The locator lists block hashes from the tip backwards, one by one for
+        the last ten blocks and then with exponentially growing steps,
+        always ending with the genesis block.
+        
+        Returns:
+            List[str]: Block hashes, newest first
+        """
+        locator = []
+        height = len(self.chain) - 1
+        step = 1
+        while height > 0:
+            locator.append(self.chain[height].hash)
+            if len(locator) >= 10:
+                step *= 2
+            height -= step
+        if self.chain:
+            locator.append(self.chain[0].hash)
+        return locator
+        
+    def find_fork_height(self, locator: List[str]) -> int:
+        """
+        Find the most recent block shared with a peer's locator.
+        
+        Args:
+            locator (List[str]): Peer's block hashes, newest first
+            
+        Returns:
+            int: Height of the first locator hash found in this chain, or 0
+        """
+        for block_hash in locator:
+            if self.get_block_by_hash(block_hash) is not None:
+                return self._block_heights[block_hash]
+        return 0
+        
+    def get_headers(self, start_height: int, count: int) -> List[BlockHeader]:
+        """
+        Get consecutive block headers for light clients.
+        
+        Args:
+            start_height (int): Height of the first header
+            count (int): Maximum number of headers to return
+            
+        Returns:
+            List[BlockHeader]: Headers from start_height onwards
+        """
+        if start_height < 0 or count <= 0:
+            return []
+        return [block.header() for block in self.chain[start_height:start_height + count]]
+        
+    def get_merkle_proof(self, tx_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Build a Merkle inclusion proof for a confirmed transaction.
+        
+        Args:
+            tx_id (str): ID of the transaction
+            
+        Returns:
+            Optional[Dict[str, Any]]: Block hash and height, the transaction's
+            position, its leaf and the hex sibling path; None if the
+            transaction is not in the chain
+        """
+        location = self._tx_locations.get(tx_id)
+        if location is None:
+            return None
+            
+        height, position = location
+        block = self.chain[height]
+        tree = block.merkle_tree()
+        return {
+            "block_hash": block.hash,
+            "height": height,
+            "index": position,
+            "leaf": tree.leaf(position).hex(),
+            "proof": [sibling.hex() for sibling in tree.proof(position)]
+        }
         
     def add_pending_transaction(self, transaction: Transaction) -> None:
         """
@@ -203,15 +418,80 @@ class Blockchain:
                 raise TransactionError("Transaction pool is full")
                 
             self.pending_transactions.append(transaction)
+            self._pending_ids.add(transaction.tx_id)
+            MEMPOOL_ADMITTED.inc()
+            MEMPOOL_SIZE.set(len(self.pending_transactions))
+            self.events.publish_transaction(transaction)
             logger.debug(
-                f"Added transaction {transaction.tx_id[:8]}... to pending pool "
-                f"(pool size: {len(self.pending_transactions)})"
+                "Added transaction %.8s... to pending pool (pool size: %d)",
+                transaction.tx_id, len(self.pending_transactions)
             )
             
         except Exception as e:
+            MEMPOOL_REJECTED.inc()
             logger.error(f"Failed to add transaction: {str(e)}")
             raise TransactionError(str(e))
         
+    def remove_confirmed_transactions(self, *blocks: Block) -> int:
+        """
+        Drop the transactions of one or more blocks from the pending pool.
+        
+        Args:
+            *blocks (Block): Blocks that were added to the chain
+            
+        Returns:
+            int: Number of pending transactions removed
+        """
+        started = time.perf_counter()
+        mined_tx_ids = {tx.tx_id for block in blocks for tx in block.transactions}
+        pool_size = len(self.pending_transactions)
+        self.pending_transactions = [
+            tx for tx in self.pending_transactions
+            if tx.tx_id not in mined_tx_ids
+        ]
+        self._pending_ids.difference_update(mined_tx_ids)
+        MEMPOOL_SIZE.set(len(self.pending_transactions))
+        if blocks:
+            TRACER.record(max(block.index for block in blocks), PHASE_MEMPOOL_PRUNE, time.perf_counter() - started)
+        return pool_size - len(self.pending_transactions)
+        
+    def find_transaction(self, tx_id: str) -> Optional[Tuple[Transaction, Optional[int]]]:
+        """
+        Look up a transaction in the chain or the pending pool.
+        
+        Args:
+            tx_id (str): ID of the transaction
+            
+        Returns:
+            Optional[Tuple[Transaction, Optional[int]]]: The transaction and
+            the height of its block, or None as height if it is pending;
+            None if the transaction is unknown
+        """
+        location = self._tx_locations.get(tx_id)
+        if location is not None and location[0] < len(self.chain):
+            height, position = location
+            block = self.chain[height]
+            if position < len(block.transactions) and block.transactions[position].tx_id == tx_id:
+                return block.transactions[position], height
+                
+        if tx_id in self._pending_ids:
+            for tx in self.pending_transactions:
+                if tx.tx_id == tx_id:
+                    return tx, None
+        return None
+        
+    def has_pending_transaction(self, tx_id: str) -> bool:
+        """
+        Check whether a transaction is waiting in the pending pool.
+        
+        Args:
+            tx_id (str): ID of the transaction
+            
+        Returns:
+            bool: True if the transaction is pending
+        """
+        return tx_id in self._pending_ids
+        
     def _is_valid_block(self, block: Block) -> bool:
         """
         Validate a block before adding it to the chain.
@@ -264,6 +544,8 @@ class Blockchain:
                 if tx.sender == "network":
                     if reward_tx:
                         raise InvalidBlockError("Multiple reward transactions found")
+                    if len(tx.get_outputs()) != 1:
+                        raise InvalidBlockError("Mining reward must have a single output")
                     if tx.amount != BLOCK_REWARD:
                         raise InvalidBlockError(f"Invalid mining reward amount: {tx.amount}")
                     if tx.receiver != block.miner:
@@ -341,6 +623,9 @@ class Blockchain:
                         if reward_found:
                             logger.error(f"Invalid chain: Multiple rewards in block {i}")
                             return False
+                        if len(tx.get_outputs()) != 1:
+                            logger.error(f"Invalid chain: Multi-output reward in block {i}")
+                            return False
                         if tx.amount != BLOCK_REWARD:
                             logger.error(f"Invalid chain: Incorrect reward in block {i}")
                             return False
@@ -377,14 +662,16 @@ class Blockchain:
         if not isinstance(address, str) or not address:
             raise ValueError("Invalid address")
             
+        started = time.perf_counter()
         try:
             balance = 0.0
             
             # Process all blocks
             for block in self.chain:
                 for tx in block.transactions:
-                    if tx.receiver == address:
-                        balance += tx.amount
+                    for receiver, amount in tx.get_outputs():
+                        if receiver == address:
+                            balance += amount
                     if tx.sender == address:
                         balance -= tx.amount
                         
@@ -394,6 +681,9 @@ class Blockchain:
             logger.error(f"Error calculating balance for {address}: {str(e)}")
             raise BlockchainError(f"Balance calculation failed: {str(e)}")
             
+        finally:
+            GET_BALANCE_SECONDS.observe(time.perf_counter() - started)
+            
     def get_chain_stats(self) -> Dict[str, Any]:
         """
         Get current blockchain statistics.
@@ -0,0 +1,211 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from .block import Block
+from .transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Event kinds
+EVENT_BLOCK = "block"  # A block was appended to the chain
+EVENT_TRANSACTION = "transaction"  # A transaction entered the pending pool
+EVENT_CONFIRMED = "confirmed"  # A transaction touching a watched address was mined
+SUBSCRIBABLE_EVENTS = (EVENT_BLOCK, EVENT_TRANSACTION)  # Kinds available without an address filter
+
+@dataclass
+class Event:
+    """
+    A chain event delivered to subscribers.
+    
+    The same Event object is handed to every matching subscriber, and its
+    JSON encoding is computed once, so fanning an event out costs no
+    serialization per subscriber.
+    
+    Attributes:
+        kind (str): EVENT_BLOCK, EVENT_TRANSACTION or EVENT_CONFIRMED
+        data (Dict[str, Any]): Event body
+    """
+    
+    kind: str
+    data: Dict[str, Any]
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
+    def to_json_line(self) -> bytes:
+        """
+        Encode the event as one line of JSON.
+        
+        Returns:
+            bytes: ``{"event": kind, "data": ...}`` followed by a newline
+        """
+        if self._encoded is None:
+            self._encoded = json.dumps(
+                {"event": self.kind, "data": self.data},
+                separators=(",", ":")
+            ).encode() + b"\n"
+        return self._encoded
+
+Subscriber = Callable[[Event], None]
+
+def transaction_addresses(tx: Transaction) -> Set[str]:
+    """
+    Get every address a transaction touches.
+    
+    Args:
+        tx (Transaction): Transaction to inspect
+        
+    Returns:
+        Set[str]: Sender and all receivers
+    """
+    return {tx.sender} | {receiver for receiver, _ in tx.get_outputs()}
+
+class EventBus:
+    """
+    In-process publish/subscribe hub for chain events.
+    
+    Subscribers either take every event of some kinds or watch a set of
+    addresses. Address watchers are kept in an address -> subscribers
+    index, so publishing a transaction costs one lookup per address it
+    touches plus one call per matching subscriber, however many
+    subscribers watch other addresses. Watchers get EVENT_TRANSACTION when
+    a transaction touching their address enters the pending pool and
+    EVENT_CONFIRMED when one is mined.
+    
+    Callbacks run synchronously in the publishing thread, which may be the
+    mining thread, so they must be quick and thread-safe; hand events off
+    to a queue or an event loop rather than doing I/O in them. A callback
+    that raises is logged and skipped.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._callbacks: Dict[int, Subscriber] = {}
+        self._by_kind: Dict[str, Set[int]] = {kind: set() for kind in SUBSCRIBABLE_EVENTS}
+        self._by_address: Dict[str, Set[int]] = {}
+        self._addresses: Dict[int, Set[str]] = {}
+        
+    def __len__(self) -> int:
+        return len(self._callbacks)
+        
+    def subscribe(
+        self,
+        callback: Subscriber,
+        kinds: Iterable[str] = (),
+        addresses: Iterable[str] = ()
+    ) -> int:
+        """
+        Register a subscriber.
+        
+        Args:
+            callback (Subscriber): Called with each matching Event
+            kinds (Iterable[str]): Kinds from SUBSCRIBABLE_EVENTS to receive
+                in full
+            addresses (Iterable[str]): Addresses to watch
+            
+        Returns:
+            int: Subscription ID for unsubscribe
+            
+        Raises:
+            ValueError: If a kind is unknown or nothing is subscribed to
+        """
+        kinds = set(kinds)
+        addresses = {str(address) for address in addresses}
+        unknown = kinds - set(SUBSCRIBABLE_EVENTS)
+        if unknown:
+            raise ValueError(f"Unknown event kinds: {sorted(unknown)}")
+        if not kinds and not addresses:
+            raise ValueError("Subscribe to at least one event kind or address")
+            
+        with self._lock:
+            subscription_id = self._next_id
+            self._next_id += 1
+            self._callbacks[subscription_id] = callback
+            for kind in kinds:
+                self._by_kind[kind].add(subscription_id)
+            for address in addresses:
+                self._by_address.setdefault(address, set()).add(subscription_id)
+            self._addresses[subscription_id] = addresses
+        return subscription_id
+        
+    def unsubscribe(self, subscription_id: int) -> bool:
+        """
+        Remove a subscriber.
+        
+        Args:
+            subscription_id (int): ID returned by subscribe
+            
+        Returns:
+            bool: True if the subscription existed
+        """
+        with self._lock:
+            if self._callbacks.pop(subscription_id, None) is None:
+                return False
+            for subscribers in self._by_kind.values():
+                subscribers.discard(subscription_id)
+            for address in self._addresses.pop(subscription_id, set()):
+                watchers = self._by_address.get(address)
+                if watchers is not None:
+                    watchers.discard(subscription_id)
+                    if not watchers:
+                        del self._by_address[address]
+        return True
+        
+    def publish_transaction(self, tx: Transaction) -> None:
+        """
+        Publish a transaction that entered the pending pool.
+        
+        Args:
+            tx (Transaction): The new pending transaction
+        """
+        if not self._callbacks:
+            return
+        with self._lock:
+            targets = set(self._by_kind[EVENT_TRANSACTION])
+            for address in transaction_addresses(tx):
+                targets |= self._by_address.get(address, set())
+            callbacks = [self._callbacks[i] for i in targets]
+        if callbacks:
+            self._deliver(Event(EVENT_TRANSACTION, tx.to_dict()), callbacks)
+            
+    def publish_block(self, block: Block) -> None:
+        """
+        Publish a block appended to the chain.
+        
+        Block subscribers get the whole block; address watchers get one
+        EVENT_CONFIRMED per mined transaction touching their addresses.
+        
+        Args:
+            block (Block): The new block
+        """
+        if not self._callbacks:
+            return
+        with self._lock:
+            block_callbacks = [self._callbacks[i] for i in self._by_kind[EVENT_BLOCK]]
+            confirmations = []
+            if self._by_address:
+                for tx in block.transactions:
+                    watchers: Set[int] = set()
+                    for address in transaction_addresses(tx):
+                        watchers |= self._by_address.get(address, set())
+                    if watchers:
+                        confirmations.append((tx, [self._callbacks[i] for i in watchers]))
+                        
+        if block_callbacks:
+            self._deliver(Event(EVENT_BLOCK, block.to_dict()), block_callbacks)
+        for tx, callbacks in confirmations:
+            event = Event(EVENT_CONFIRMED, {
+                "transaction": tx.to_dict(),
+                "block_hash": block.hash,
+                "block_height": block.index
+            })
+            self._deliver(event, callbacks)
+            
+    @staticmethod
+    def _deliver(event: Event, callbacks: List[Subscriber]) -> None:
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Event subscriber failed on {event.kind}: {str(e)}")
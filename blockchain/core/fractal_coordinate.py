@@ -48,7 +48,7 @@ class FractalCoordinate:
             CoordinateValidationError: If any coordinate is invalid
         """
         self._validate_coordinates()
-        logger.debug(f"Created fractal coordinate at ({self.a}, {self.b}, {self.c})")
+        logger.debug("Created fractal coordinate at (%s, %s, %s)", self.a, self.b, self.c)
 
     def _validate_coordinates(self) -> None:
         """
@@ -82,7 +82,7 @@ class FractalCoordinate:
                 b=random.randint(MIN_COORDINATE, MAX_COORDINATE),
                 c=random.randint(MIN_COORDINATE, MAX_COORDINATE)
             )
-            logger.debug(f"Generated random coordinates: {coords}")
+            logger.debug("Generated random coordinates: %s", coords)
             return coords
         except Exception as e:
             logger.error(f"Failed to generate random coordinates: {str(e)}")
@@ -131,7 +131,7 @@ class FractalCoordinate:
                 b=max(MIN_COORDINATE, min(MAX_COORDINATE, self.b + delta_b)),
                 c=max(MIN_COORDINATE, min(MAX_COORDINATE, self.c + delta_c))
             )
-            logger.debug(f"Adjusted coordinates from {self} to {new_coords}")
+            logger.debug("Adjusted coordinates from %s to %s", self, new_coords)
             return new_coords
         except Exception as e:
             logger.error(f"Failed to adjust coordinates: {str(e)}")
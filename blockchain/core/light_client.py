@@ -0,0 +1,244 @@
+import struct
+import logging
+from typing import Dict, Any, Iterable
+from .block import BlockHeader, transaction_leaf
+from .transaction import Transaction
+from .fractal_coordinate import FractalCoordinate
+from ..crypto.merkle import verify_proof
+
+logger = logging.getLogger(__name__)
+
+# Packed header record: hash, Merkle root, timestamp, nonce, fractal coordinate, transaction count
+HEADER_RECORD = struct.Struct(">32s32sdQHHHI")
+HEADER_SYNC_BATCH = 2000  # Headers requested per sync round trip
+
+class LightClientError(Exception):
+    """Base exception for light client errors."""
+    pass
+
+class HeaderValidationError(LightClientError):
+    """Raised when a header fails proof of work or linkage checks."""
+    pass
+
+class LightClient:
+    """
+    Simplified payment verification (SPV) client.
+
+    Keeps only block headers, packed into a single bytearray of
+    HEADER_RECORD.size bytes per block (hash, Merkle root, timestamp, nonce,
+    fractal coordinate and transaction count). Previous hashes are implied by the order of
+    records, and each header is checked for proof of work and linkage
+    before it is stored.
+
+    Payments are confirmed with a Merkle inclusion proof from a provider.
+    The proof's position is bounded by the transaction count committed in
+    the stored header, not by anything the provider sends.
+    A provider is any object with ``get_headers(start_height, count)`` and
+    ``get_merkle_proof(tx_id)``, such as a full-node ``Blockchain``.
+
+    Attributes:
+        difficulty (int): Required number of leading zeros in block hashes
+    """
+
+    def __init__(self, genesis: BlockHeader, difficulty: int):
+        """
+        Initialize the client from a trusted genesis header.
+
+        Args:
+            genesis (BlockHeader): Header of block 0
+            difficulty (int): Required number of leading zeros in block hashes
+
+        Raises:
+            HeaderValidationError: If the genesis header is inconsistent
+        """
+        if genesis.index != 0 or genesis.hash != genesis.calculate_hash():
+            raise HeaderValidationError("Invalid genesis header")
+
+        self.difficulty = difficulty
+        self._target = "0" * difficulty
+        self._records = bytearray()
+        self._append(genesis)
+
+    def __len__(self) -> int:
+        return len(self._records) // HEADER_RECORD.size
+
+    @property
+    def height(self) -> int:
+        """Height of the best known header."""
+        return len(self) - 1
+
+    @property
+    def tip_hash(self) -> str:
+        """Hash of the best known header."""
+        return self._record(self.height)[0].hex()
+
+    @property
+    def memory_per_header(self) -> int:
+        """Bytes of header storage used per block."""
+        return HEADER_RECORD.size
+
+    def _append(self, header: BlockHeader) -> None:
+        coord = header.fractal_coord
+        self._records += HEADER_RECORD.pack(
+            bytes.fromhex(header.hash),
+            bytes.fromhex(header.merkle_root),
+            header.timestamp,
+            header.nonce,
+            coord.a, coord.b, coord.c,
+            header.tx_count
+        )
+
+    def _record(self, height: int) -> tuple:
+        return HEADER_RECORD.unpack_from(self._records, height * HEADER_RECORD.size)
+
+    def get_header(self, height: int) -> Dict[str, Any]:
+        """
+        Get the stored fields of a header.
+
+        Args:
+            height (int): Header height
+
+        Returns:
+            Dict[str, Any]: Hash, previous hash, Merkle root, timestamp, nonce,
+            fractal coordinate and transaction count
+
+        Raises:
+            LightClientError: If the height is unknown
+        """
+        if not 0 <= height <= self.height:
+            raise LightClientError(f"Unknown header height {height}")
+
+        block_hash, merkle_root, timestamp, nonce, a, b, c, tx_count = self._record(height)
+        previous_hash = self._record(height - 1)[0].hex() if height else "0" * 64
+        return {
+            "index": height,
+            "hash": block_hash.hex(),
+            "previous_hash": previous_hash,
+            "merkle_root": merkle_root.hex(),
+            "timestamp": timestamp,
+            "nonce": nonce,
+            "fractal_coord": FractalCoordinate(a, b, c).to_dict(),
+            "tx_count": tx_count
+        }
+
+    def add_header(self, header: BlockHeader) -> None:
+        """
+        Validate a header against the current tip and store it.
+
+        Args:
+            header (BlockHeader): Next header in the chain
+
+        Raises:
+            HeaderValidationError: If the header fails validation
+        """
+        if header.index != len(self):
+            raise HeaderValidationError(
+                f"Invalid header index. Expected {len(self)}, got {header.index}"
+            )
+
+        if header.previous_hash != self.tip_hash:
+            raise HeaderValidationError("Header's previous hash doesn't match tip")
+
+        if not header.hash.startswith(self._target):
+            raise HeaderValidationError(
+                f"Header hash doesn't meet difficulty requirement of {self.difficulty}"
+            )
+
+        if header.calculate_hash() != header.hash:
+            raise HeaderValidationError("Header hash is invalid")
+
+        self._append(header)
+
+    def add_headers(self, headers: Iterable[BlockHeader]) -> int:
+        """
+        Validate and store consecutive headers.
+
+        Args:
+            headers (Iterable[BlockHeader]): Headers following the current tip
+
+        Returns:
+            int: Number of headers added
+
+        Raises:
+            HeaderValidationError: If a header fails validation
+        """
+        added = 0
+        for header in headers:
+            self.add_header(header)
+            added += 1
+        return added
+
+    def sync(self, provider: Any, batch_size: int = HEADER_SYNC_BATCH) -> int:
+        """
+        Download and validate new headers from a provider.
+
+        Args:
+            provider: Object with a ``get_headers(start_height, count)`` method
+            batch_size (int): Headers requested per call
+
+        Returns:
+            int: Number of headers added
+
+        Raises:
+            HeaderValidationError: If a downloaded header fails validation
+        """
+        added = 0
+        while True:
+            headers = provider.get_headers(len(self), batch_size)
+            if not headers:
+                break
+            added += self.add_headers(headers)
+            if len(headers) < batch_size:
+                break
+
+        if added:
+            logger.info(f"Synced {added} headers, tip at height {self.height}")
+        return added
+
+    def verify_payment(
+        self,
+        tx: Transaction,
+        provider: Any,
+        min_confirmations: int = 1
+    ) -> bool:
+        """
+        Confirm that a transaction is included in the header chain.
+
+        Args:
+            tx (Transaction): The payment to confirm
+            provider: Object with a ``get_merkle_proof(tx_id)`` method
+            min_confirmations (int): Blocks required on top of and including
+                the transaction's block
+
+        Returns:
+            bool: True if the proof is valid against a stored header and the
+            block has enough confirmations
+        """
+        try:
+            proof = provider.get_merkle_proof(tx.tx_id)
+            if not proof:
+                return False
+
+            height = proof["height"]
+            if not 0 <= height <= self.height:
+                return False
+
+            record = self._record(height)
+            block_hash, merkle_root, tx_count = record[0], record[1], record[-1]
+            if block_hash.hex() != proof["block_hash"]:
+                return False
+
+            if self.height - height + 1 < min_confirmations:
+                return False
+
+            return verify_proof(
+                transaction_leaf(tx),
+                proof["index"],
+                [bytes.fromhex(sibling) for sibling in proof["proof"]],
+                merkle_root,
+                tx_count
+            )
+
+        except Exception as e:
+            logger.warning(f"Payment verification failed for {tx.tx_id[:8]}...: {str(e)}")
+            return False
@@ -2,11 +2,15 @@ import hashlib
 import time
 import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Multi-output transaction constants
+MAX_TX_OUTPUTS = 1000  # Maximum (receiver, amount) outputs per transaction
+MULTI_OUTPUT_RECEIVER = "multi"  # Placeholder receiver of multi-output transactions
+
 class TransactionError(Exception):
     """Base exception for transaction-related errors."""
     pass
@@ -62,7 +66,7 @@ class Transaction:
             self._validate_attributes()
             if self.tx_id is None:
                 self.tx_id = self.calculate_hash()
-                logger.debug(f"Generated transaction ID: {self.tx_id[:8]}...")
+                logger.debug("Generated transaction ID: %.8s...", self.tx_id)
         except Exception as e:
             logger.error(f"Transaction initialization failed: {str(e)}")
             raise TransactionValidationError(f"Transaction initialization failed: {str(e)}")
@@ -115,6 +119,15 @@ class Transaction:
             logger.error(f"Hash calculation failed: {str(e)}")
             raise TransactionError(f"Failed to calculate transaction hash: {str(e)}")
 
+    def get_outputs(self) -> List[Tuple[str, float]]:
+        """
+        Get the (receiver, amount) pairs credited by this transaction.
+        
+        Returns:
+            List[Tuple[str, float]]: A single output for plain transactions
+        """
+        return [(self.receiver, self.amount)]
+
     def sign(self, signature: str) -> None:
         """
         Add a digital signature to the transaction.
@@ -132,7 +145,7 @@ class Transaction:
             raise SignatureError("Invalid signature format")
             
         self.signature = signature
-        logger.debug(f"Transaction {self.tx_id[:8]}... signed")
+        logger.debug("Transaction %.8s... signed", self.tx_id)
 
     def verify_signature(self) -> bool:
         """
@@ -179,6 +192,9 @@ class Transaction:
             TransactionValidationError: If the dictionary is missing required fields
             or contains invalid data
         """
+        if cls is Transaction and data.get("outputs") is not None:
+            return MultiOutputTransaction.from_dict(data)
+            
         try:
             required_fields = {"sender", "receiver", "amount"}
             if not all(field in data for field in required_fields):
@@ -197,3 +213,135 @@ class Transaction:
             
         except Exception as e:
             raise TransactionValidationError(f"Failed to create transaction from dictionary: {str(e)}")
+
+@dataclass
+class MultiOutputTransaction(Transaction):
+    """
+    A transaction paying several receivers from one sender with one signature.
+    
+    The ``receiver`` field holds MULTI_OUTPUT_RECEIVER and ``amount`` holds the
+    total of all outputs, so code that debits ``sender`` by ``amount`` keeps
+    working. Credits must be read through ``get_outputs()``.
+    
+    Attributes:
+        outputs (List[Tuple[str, float]]): (receiver, amount) pairs to pay
+    """
+    
+    receiver: str = MULTI_OUTPUT_RECEIVER
+    amount: float = 0.0
+    outputs: List[Tuple[str, float]] = field(default_factory=list)
+
+    def __post_init__(self):
+        """
+        Normalize outputs, derive the total amount, then validate.
+        
+        Raises:
+            TransactionValidationError: If any attribute or output is invalid
+        """
+        if not isinstance(self.outputs, (list, tuple)):
+            raise TransactionValidationError("Outputs must be a list of (receiver, amount) pairs")
+        try:
+            self.outputs = [(receiver, amount) for receiver, amount in self.outputs]
+        except (TypeError, ValueError):
+            raise TransactionValidationError("Outputs must be a list of (receiver, amount) pairs")
+            
+        self.receiver = MULTI_OUTPUT_RECEIVER
+        self.amount = sum(
+            amount for _, amount in self.outputs
+            if isinstance(amount, (int, float))
+        )
+        super().__post_init__()
+
+    def _validate_attributes(self) -> None:
+        """
+        Validate transaction attributes and every output.
+        
+        Raises:
+            TransactionValidationError: If any attribute or output is invalid
+        """
+        if not self.outputs:
+            raise TransactionValidationError("Multi-output transaction needs at least one output")
+            
+        if len(self.outputs) > MAX_TX_OUTPUTS:
+            raise TransactionValidationError(
+                f"Transaction exceeds maximum of {MAX_TX_OUTPUTS} outputs"
+            )
+            
+        for receiver, amount in self.outputs:
+            if not isinstance(receiver, str) or not receiver:
+                raise TransactionValidationError("Output receiver must be a non-empty string")
+            if not isinstance(amount, (int, float)) or amount <= 0:
+                raise TransactionValidationError("Output amount must be a positive number")
+                
+        super()._validate_attributes()
+
+    def calculate_hash(self) -> str:
+        """
+        Calculate the SHA-256 hash of the transaction, covering all outputs.
+        
+        Returns:
+            str: The hexadecimal representation of the transaction's hash
+            
+        Raises:
+            TransactionError: If hash calculation fails
+        """
+        try:
+            outputs = json.dumps(self.outputs)
+            tx_string = f"{self.sender}{outputs}{self.data}{self.timestamp}"
+            return hashlib.sha256(tx_string.encode()).hexdigest()
+        except Exception as e:
+            logger.error(f"Hash calculation failed: {str(e)}")
+            raise TransactionError(f"Failed to calculate transaction hash: {str(e)}")
+
+    def get_outputs(self) -> List[Tuple[str, float]]:
+        """
+        Get the (receiver, amount) pairs credited by this transaction.
+        
+        Returns:
+            List[Tuple[str, float]]: All outputs, in order
+        """
+        return list(self.outputs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the transaction to a dictionary representation.
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing all transaction attributes
+        """
+        tx_dict = super().to_dict()
+        tx_dict["outputs"] = [list(output) for output in self.outputs]
+        return tx_dict
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MultiOutputTransaction':
+        """
+        Create a MultiOutputTransaction instance from a dictionary.
+        
+        Args:
+            data (Dict[str, Any]): Dictionary containing transaction data
+            
+        Returns:
+            MultiOutputTransaction: A new MultiOutputTransaction instance
+            
+        Raises:
+            TransactionValidationError: If the dictionary is missing required fields
+            or contains invalid data
+        """
+        try:
+            required_fields = {"sender", "outputs"}
+            if not all(field in data for field in required_fields):
+                missing = required_fields - set(data.keys())
+                raise TransactionValidationError(f"Missing required fields: {missing}")
+                
+            return cls(
+                sender=data["sender"],
+                outputs=data["outputs"],
+                data=data.get("data", ""),
+                timestamp=data.get("timestamp", time.time()),
+                tx_id=data.get("tx_id"),
+                signature=data.get("signature")
+            )
+            
+        except Exception as e:
+            raise TransactionValidationError(f"Failed to create transaction from dictionary: {str(e)}")
@@ -1,8 +1,14 @@
 from .hashing import calculate_hash, double_sha256, merkle_root, create_block_hash
+from .merkle import MerkleTree, MerkleError, hash_leaf, hash_pair, verify_proof
 
 __all__ = [
     "calculate_hash",
     "double_sha256",
     "merkle_root",
-    "create_block_hash"
+    "create_block_hash",
+    "MerkleTree",
+    "MerkleError",
+    "hash_leaf",
+    "hash_pair",
+    "verify_proof"
 ]
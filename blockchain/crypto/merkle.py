@@ -0,0 +1,222 @@
+import hashlib
+from typing import Iterable, List
+
+# Merkle tree constants
+DIGEST_SIZE = 32  # Size of leaf and node digests in bytes
+EMPTY_ROOT = hashlib.sha256(hashlib.sha256(b"").digest()).digest()  # Root of an empty tree
+
+_sha256 = hashlib.sha256
+
+class MerkleError(Exception):
+    """Raised when a Merkle tree operation receives invalid input."""
+    pass
+
+def hash_leaf(data: bytes) -> bytes:
+    """
+    Hash arbitrary bytes into a 32-byte leaf digest.
+
+    Args:
+        data (bytes): Leaf contents
+
+    Returns:
+        bytes: SHA-256 digest of the data
+    """
+    return _sha256(data).digest()
+
+def hash_pair(left: bytes, right: bytes) -> bytes:
+    """
+    Hash two child digests into their parent with double SHA-256.
+
+    Args:
+        left (bytes): Left child digest
+        right (bytes): Right child digest
+
+    Returns:
+        bytes: Parent digest
+    """
+    return _sha256(_sha256(left + right).digest()).digest()
+
+def verify_proof(leaf: bytes, index: int, proof: List[bytes], root: bytes, leaf_count: int) -> bool:
+    """
+    Check that a leaf is included at a position under a Merkle root.
+
+    Because an odd last node is paired with itself, a tree of n leaves has
+    the same root as one with its last leaf repeated, so a proof alone would
+    also place the last leaf at positions past the end. Knowing the leaf
+    count rules those out: the index must be in range, the proof must be as
+    long as the tree is deep, and a last node without a sibling must be
+    paired with itself.
+
+    Args:
+        leaf (bytes): Leaf digest
+        index (int): Position of the leaf in the tree
+        proof (List[bytes]): Sibling digests from leaf level to just below the root
+        root (bytes): Expected Merkle root
+        leaf_count (int): Number of leaves in the tree
+
+    Returns:
+        bool: True if the proof links the leaf to the root
+    """
+    if not 0 <= index < leaf_count:
+        return False
+
+    node = leaf
+    width = leaf_count
+    for sibling in proof:
+        if width == 1:
+            return False
+        if index & 1:
+            node = hash_pair(sibling, node)
+        else:
+            if index == width - 1 and sibling != node:
+                return False
+            node = hash_pair(node, sibling)
+        index >>= 1
+        width = (width + 1) // 2
+
+    return width == 1 and node == root
+
+class MerkleTree:
+    """
+    Merkle tree over raw 32-byte digests with every level cached.
+
+    Levels are kept from the leaves (level 0) up to the root, so the root is
+    read in O(1), ``append`` rehashes only the O(log n) nodes on the new
+    leaf's path, and ``proof`` reads siblings without rehashing anything.
+
+    An odd node at any level is paired with itself, matching ``merkle_root``
+    in ``blockchain.crypto.hashing``.
+    """
+
+    def __init__(self, leaves: Iterable[bytes] = ()):
+        """
+        Build a tree from leaf digests.
+
+        Args:
+            leaves (Iterable[bytes]): 32-byte leaf digests
+
+        Raises:
+            MerkleError: If a leaf is not a 32-byte digest
+        """
+        level = [self._check_leaf(leaf) for leaf in leaves]
+        self._levels: List[List[bytes]] = [level]
+
+        while len(level) > 1:
+            if len(level) & 1:
+                pairs = level + [level[-1]]
+            else:
+                pairs = level
+            level = [
+                _sha256(_sha256(pairs[i] + pairs[i + 1]).digest()).digest()
+                for i in range(0, len(pairs), 2)
+            ]
+            self._levels.append(level)
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    @staticmethod
+    def _check_leaf(leaf: bytes) -> bytes:
+        if not isinstance(leaf, bytes) or len(leaf) != DIGEST_SIZE:
+            raise MerkleError(f"Leaves must be {DIGEST_SIZE}-byte digests")
+        return leaf
+
+    @property
+    def root(self) -> bytes:
+        """Merkle root, or EMPTY_ROOT for a tree without leaves."""
+        if not self._levels[0]:
+            return EMPTY_ROOT
+        return self._levels[-1][0]
+
+    @property
+    def root_hex(self) -> str:
+        """Merkle root as a hex string."""
+        return self.root.hex()
+
+    def leaf(self, index: int) -> bytes:
+        """
+        Get the leaf digest at a position.
+
+        Args:
+            index (int): Leaf position
+
+        Returns:
+            bytes: Leaf digest
+
+        Raises:
+            MerkleError: If the index is out of range
+        """
+        if not 0 <= index < len(self):
+            raise MerkleError(f"Leaf index {index} out of range")
+        return self._levels[0][index]
+
+    def append(self, leaf: bytes) -> None:
+        """
+        Append a leaf and update the nodes on its path to the root.
+
+        Args:
+            leaf (bytes): 32-byte leaf digest
+
+        Raises:
+            MerkleError: If the leaf is not a 32-byte digest
+        """
+        levels = self._levels
+        levels[0].append(self._check_leaf(leaf))
+        index = len(levels[0]) - 1
+        depth = 0
+
+        while len(levels[depth]) > 1:
+            level = levels[depth]
+            left_index = index & ~1
+            left = level[left_index]
+            right = level[left_index + 1] if left_index + 1 < len(level) else left
+            parent = hash_pair(left, right)
+
+            if depth + 1 == len(levels):
+                levels.append([])
+            parents = levels[depth + 1]
+            index >>= 1
+            if index < len(parents):
+                parents[index] = parent
+            else:
+                parents.append(parent)
+            depth += 1
+
+    def extend(self, leaves: Iterable[bytes]) -> None:
+        """
+        Append several leaves.
+
+        Args:
+            leaves (Iterable[bytes]): 32-byte leaf digests
+
+        Raises:
+            MerkleError: If a leaf is not a 32-byte digest
+        """
+        if not self._levels[0]:
+            self.__init__(leaves)
+            return
+        for leaf in leaves:
+            self.append(leaf)
+
+    def proof(self, index: int) -> List[bytes]:
+        """
+        Get the inclusion proof for a leaf.
+
+        Args:
+            index (int): Leaf position
+
+        Returns:
+            List[bytes]: Sibling digests from the leaf level up to below the root
+
+        Raises:
+            MerkleError: If the index is out of range
+        """
+        if not 0 <= index < len(self):
+            raise MerkleError(f"Leaf index {index} out of range")
+
+        path = []
+        for level in self._levels[:-1]:
+            sibling = index ^ 1
+            path.append(level[sibling] if sibling < len(level) else level[index])
+            index >>= 1
+        return path
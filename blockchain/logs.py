@@ -0,0 +1,146 @@
+"""Non-blocking log pipeline and rate limiting for per-block messages."""
+
+import atexit
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, List, Optional, Sequence
+
+from .metrics import REGISTRY
+
+# Logging constants
+LOGGER_NAMES = ("triadnet", "blockchain")  # Logger trees the node's modules log under
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"  # Default record format
+LOG_QUEUE_SIZE = 10000  # Records buffered for the listener before new ones are dropped
+BLOCK_LOG_INTERVAL = 10.0  # Minimum seconds between two per-block messages from one limiter
+
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "triadnet_log_records_dropped_total", "Log records dropped because the log queue was full"
+)
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread without formatting or waiting.
+
+    ``QueueHandler.prepare`` formats the message on the logging thread so
+    records can cross process boundaries; the queue here stays in-process,
+    so formatting is left to the listener. A full queue drops the record
+    instead of blocking the caller.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+class _QueueListener(QueueListener):
+    """Waits for room for the stop sentinel instead of failing on a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+_handler: Optional[_NonBlockingQueueHandler] = None
+_listener: Optional[_QueueListener] = None
+_logger_names: Sequence[str] = ()
+
+def configure_logging(
+    level: int = logging.INFO,
+    handlers: Optional[List[logging.Handler]] = None,
+    logger_names: Sequence[str] = LOGGER_NAMES,
+    queue_size: int = LOG_QUEUE_SIZE
+) -> QueueListener:
+    """
+    Route the node's loggers through a queue drained by a listener thread.
+
+    Each logger in ``logger_names`` gets the same single queue handler and
+    stops propagating to the root logger, so logging from the mining loop
+    or the event loop costs a record and a queue put; the handlers doing
+    I/O run on the listener thread. Calling it again replaces the previous
+    configuration instead of adding handlers.
+
+    Args:
+        level (int): Level of the configured loggers
+        handlers (Optional[List[logging.Handler]]): Handlers the listener
+            writes to, default a stderr StreamHandler. Handlers without a
+            formatter get LOG_FORMAT
+        logger_names (Sequence[str]): Logger trees to configure
+        queue_size (int): Records buffered before new ones are dropped
+
+    Returns:
+        QueueListener: The started listener
+    """
+    global _handler, _listener, _logger_names
+    stop_logging()
+
+    if handlers is None:
+        handlers = [logging.StreamHandler()]
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(queue_size)
+    _handler = _NonBlockingQueueHandler(log_queue)
+    _logger_names = tuple(logger_names)
+    for name in _logger_names:
+        logger = logging.getLogger(name)
+        logger.addHandler(_handler)
+        logger.setLevel(level)
+        logger.propagate = False
+
+    _listener = _QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def stop_logging() -> None:
+    """Write out the queued records, stop the listener and detach the queue handler."""
+    global _handler, _listener
+    if _handler is not None:
+        for name in _logger_names:
+            logger = logging.getLogger(name)
+            logger.removeHandler(_handler)
+            logger.propagate = True
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(stop_logging)
+
+class LogRateLimiter:
+    """
+    Lets a repeated message through at most once per interval.
+
+    Meant for messages logged once per block or round, which flood the log
+    when blocks come quickly. Check ``allow()`` before logging so a dropped
+    message costs no record at all, and report ``suppressed`` with the
+    message that does get through:
+
+        if limiter.allow():
+            logger.info("Block %d mined (%d since last report)", index, limiter.suppressed)
+
+    Attributes:
+        interval (float): Minimum seconds between allowed messages
+        suppressed (int): Messages dropped before the last allowed one
+    """
+
+    def __init__(self, interval: float = BLOCK_LOG_INTERVAL, clock: Callable[[], float] = time.monotonic):
+        self.interval = interval
+        self.suppressed = 0
+        self._clock = clock
+        self._dropped = 0
+        self._last: Optional[float] = None
+
+    def allow(self) -> bool:
+        now = self._clock()
+        if self._last is not None and now - self._last < self.interval:
+            self._dropped += 1
+            return False
+        self._last = now
+        self.suppressed = self._dropped
+        self._dropped = 0
+        return True
@@ -0,0 +1,372 @@
+"""Counters, gauges and histograms exposed in the Prometheus text format."""
+
+import bisect
+import logging
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Metrics constants
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)  # Histogram upper bounds in seconds, suited to per-call latencies
+METRICS_PORT = 9100  # Default port of the metrics endpoint
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"  # Prometheus text exposition format
+
+logger = logging.getLogger("triadnet.metrics")
+
+Sample = Tuple[str, Dict[str, str], float]
+
+class MetricsError(Exception):
+    """Raised when a metric is declared or used inconsistently."""
+    pass
+
+class _Sharded:
+    """
+    Per-thread cells for a value updated from several threads.
+
+    Each thread only ever writes its own cell, so updates need no lock and
+    none are lost; readers sum the cells. An uncontended lock costs several
+    times more than the update itself, which matters on paths like
+    add_block.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._shards: Dict[int, list] = {}
+
+    def _shard(self) -> list:
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            with self._lock:
+                shard = self._shards[ident] = self._new_shard()
+        return shard
+
+    def _all_shards(self) -> List[list]:
+        with self._lock:
+            return list(self._shards.values())
+
+    def _new_shard(self) -> list:
+        raise NotImplementedError
+
+class _CounterValue(_Sharded):
+    def _new_shard(self) -> list:
+        return [0.0]
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise MetricsError("Counters can only increase")
+        shard = self._shards.get(threading.get_ident()) or self._shard()
+        shard[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(shard[0] for shard in self._all_shards())
+
+    def samples(self, name: str) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        yield name, {}, self.value
+
+class _GaugeValue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._function: Optional[Callable[[], float]] = None
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    def samples(self, name: str) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        yield name, {}, float(self._function()) if self._function else self.value
+
+class _HistogramValue(_Sharded):
+    # Shard layout: one count per bucket including +Inf, then the sum
+    def __init__(self, buckets: Tuple[float, ...]):
+        super().__init__()
+        self._buckets = buckets
+
+    def _new_shard(self) -> list:
+        return [0] * (len(self._buckets) + 1) + [0.0]
+
+    def observe(self, value: float) -> None:
+        shard = self._shards.get(threading.get_ident()) or self._shard()
+        shard[bisect.bisect_left(self._buckets, value)] += 1
+        shard[-1] += value
+
+    def samples(self, name: str) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        counts = [0] * (len(self._buckets) + 1)
+        total = 0.0
+        for shard in self._all_shards():
+            for index, bucket_count in enumerate(shard[:-1]):
+                counts[index] += bucket_count
+            total += shard[-1]
+        count = sum(counts)
+        cumulative = 0
+        for bound, bucket_count in zip(self._buckets + (math.inf,), counts):
+            cumulative += bucket_count
+            yield name + "_bucket", {"le": _format_value(bound)}, cumulative
+        yield name + "_sum", {}, total
+        yield name + "_count", {}, count
+
+class Metric:
+    """
+    A named metric, optionally split by label values.
+
+    A metric without labels is updated directly (``metric.inc()``); one
+    with labels is updated through the child for a set of label values
+    (``metric.labels("addr").inc()``). Children are created on first use
+    and kept, so callers on hot paths should hold on to the child.
+
+    Attributes:
+        name (str): Metric name
+        documentation (str): HELP text
+        labelnames (Tuple[str, ...]): Label names, empty for a single series
+    """
+
+    kind = ""
+    _update_methods: Tuple[str, ...] = ()
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._children[()] = self._default = self._new_child()
+            # Skip a call layer on updates of single-series metrics
+            for method in self._update_methods:
+                setattr(self, method, getattr(self._default, method))
+
+    def labels(self, *values: object):
+        """
+        Get the series for a set of label values.
+
+        Args:
+            *values: One value per label name
+
+        Returns:
+            The child series, with the same update methods as the metric
+
+        Raises:
+            MetricsError: If the number of values does not match the labels
+        """
+        if len(values) != len(self.labelnames) or not values:
+            raise MetricsError(f"{self.name} takes labels {self.labelnames}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def samples(self) -> List[Sample]:
+        """All samples of the metric, with labels filled in."""
+        samples = []
+        for key, child in list(self._children.items()):
+            labels = dict(zip(self.labelnames, key))
+            for name, extra, value in child.samples(self.name):
+                samples.append((name, {**labels, **extra}, value))
+        return samples
+
+    def _new_child(self):
+        raise NotImplementedError
+
+class Counter(Metric):
+    """A value that only goes up, such as blocks added."""
+
+    kind = "counter"
+    _update_methods = ("inc",)
+
+    def _new_child(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+class Gauge(Metric):
+    """A value that goes up and down, or is read from a function at scrape time."""
+
+    kind = "gauge"
+    _update_methods = ("set", "inc", "dec", "set_function")
+
+    def _new_child(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default.dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Report ``function()`` at each scrape instead of a stored value."""
+        self._default.set_function(function)
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, such as call latencies."""
+
+    kind = "histogram"
+    _update_methods = ("observe",)
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.buckets = tuple(sorted(buckets))
+        if not self.buckets:
+            raise MetricsError("Histogram needs at least one bucket")
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together.
+
+    Declaring a metric that already exists returns the existing one if its
+    type matches, so modules can declare their metrics at import time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text
+        """
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for sample_name, labels, value in metric.samples():
+                if labels:
+                    label_text = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+                    lines.append(f"{sample_name}{{{label_text}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{sample_name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise MetricsError(f"Metric {name} already registered as a different {metric.kind}")
+            return metric
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    return repr(float(value))
+
+# Process-wide registry the node's modules declare their metrics in
+REGISTRY = MetricsRegistry()
+
+class MetricsServer:
+    """
+    Serves a registry at ``/metrics`` over HTTP for Prometheus to scrape.
+
+    Runs ``http.server`` in a daemon thread, so it works next to the
+    threaded miner as well as the asyncio node.
+
+    Attributes:
+        registry (MetricsRegistry): Registry served
+        host (str): Listen host
+        port (int): Listen port (updated after start if 0 was given)
+    """
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = METRICS_PORT):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics listening on http://{self.host}:{self.port}/metrics")
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
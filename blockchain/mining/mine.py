@@ -12,8 +12,10 @@ from blockchain.core.block import Block
 from blockchain.core.transaction import Transaction
 from blockchain.wallet import Wallet
 from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.logs import LogRateLimiter
+from blockchain.metrics import REGISTRY
 from blockchain.mining.proof_of_work import (
-    ProofOfFractalWork, ConsensusManager, BLOCK_REWARD, MiningError
+    ProofOfFractalWork, ConsensusManager, BLOCK_REWARD, MiningError, MiningResult
 )
 
 # Mining constants
@@ -25,6 +27,14 @@ AGGRESSIVE_ADJUST_STEP = 100  # Aggressive coordinate adjustment step
 SLOW_BLOCK_TIME = 120  # Time threshold for "too slow" mining (seconds)
 FAST_BLOCK_TIME = 10  # Time threshold for "too fast" mining (seconds)
 
+# Metrics, labelled by miner address
+MINER_HASHES = REGISTRY.counter("triadnet_miner_hashes_total", "Hashes computed", ["miner"])
+MINER_HASH_RATE = REGISTRY.gauge(
+    "triadnet_miner_hashes_per_second", "Hash rate over the last mining round", ["miner"]
+)
+MINER_DIFFICULTY = REGISTRY.gauge("triadnet_miner_difficulty", "Difficulty the miner targets", ["miner"])
+MINER_BLOCKS = REGISTRY.counter("triadnet_miner_blocks_total", "Blocks mined", ["miner"])
+
 class MinerError(Exception):
     """Base exception for miner-related errors."""
     pass
@@ -132,17 +142,18 @@ class Miner:
         
         self.stats = MiningStats()
         self.logger = logging.getLogger("triadnet.miner")
+        self._hashes_metric = MINER_HASHES.labels(wallet.address)
+        self._hash_rate_metric = MINER_HASH_RATE.labels(wallet.address)
+        self._difficulty_metric = MINER_DIFFICULTY.labels(wallet.address)
+        self._blocks_metric = MINER_BLOCKS.labels(wallet.address)
         
-        # Configure logging
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
+        # Handlers belong to the application (see blockchain.logs.configure_logging);
+        # per-block messages are rate limited so fast blocks cannot flood the log
+        self._block_log = LogRateLimiter()
+        self._coord_log = LogRateLimiter()
         
         self.logger.info(
-            f"Miner initialized with address {wallet.address} "
-            f"at coordinates {fractal_coord}"
+            "Miner initialized with address %s at coordinates %s", wallet.address, fractal_coord
         )
 
     def start(self) -> None:
@@ -160,7 +171,7 @@ class Miner:
                 self._mining_thread = threading.Thread(target=self._mine_loop)
                 self._mining_thread.daemon = True
                 self._mining_thread.start()
-                self.logger.info(f"Mining started at coordinates {self.fractal_coord}")
+                self.logger.info("Mining started at coordinates %s", self.fractal_coord)
         except Exception as e:
             self._mining = False
             raise MinerError(f"Failed to start mining: {str(e)}")
@@ -199,7 +210,7 @@ class Miner:
                 
             self._pending_transactions.put(transaction)
             self.blockchain.add_pending_transaction(transaction)
-            self.logger.debug(f"Added transaction to pool: {transaction.tx_id}")
+            self.logger.debug("Added transaction to pool: %s", transaction.tx_id)
             
         except Exception as e:
             raise MinerError(f"Failed to add transaction: {str(e)}")
@@ -221,22 +232,22 @@ class Miner:
                     fractal_coord=self.fractal_coord
                 )
                 
-                self.logger.info(
-                    f"Mining block {block.index} with "
-                    f"{len(block.transactions)} transactions..."
+                self.logger.debug(
+                    "Mining block %d with %d transactions...", block.index, len(block.transactions)
                 )
                 
                 result = self.consensus.mine_block(block)
+                self._record_round(result)
                 
                 if result.success:
                     self.stats.update_block_mined(BLOCK_REWARD)
-                    self.logger.info(
-                        f"Block {block.index} mined! "
-                        f"Hash: {result.hash_val[:10]}... "
-                        f"Nonce: {result.nonce} "
-                        f"Time: {result.duration:.2f}s "
-                        f"Reward: {BLOCK_REWARD} TRIAD"
-                    )
+                    if self._block_log.allow():
+                        self.logger.info(
+                            "Block %d mined! Hash: %.10s... Nonce: %d Time: %.2fs Reward: %s TRIAD "
+                            "(%d similar messages suppressed)",
+                            block.index, result.hash_val, result.nonce, result.duration,
+                            BLOCK_REWARD, self._block_log.suppressed
+                        )
                     
                     if self.auto_adjust_coords:
                         self._adjust_fractal_coordinates(result.duration)
@@ -246,8 +257,8 @@ class Miner:
                     
                 else:
                     self.logger.warning(
-                        f"Failed to mine block after {result.duration:.2f}s, "
-                        "adjusting parameters and retrying..."
+                        "Failed to mine block after %.2fs, adjusting parameters and retrying...",
+                        result.duration
                     )
                     
                     retry_count += 1
@@ -271,6 +282,23 @@ class Miner:
                 self.logger.error(f"Mining error: {str(e)}")
                 time.sleep(5)
 
+    def _record_round(self, result: MiningResult) -> None:
+        """
+        Update the miner's metrics after a mining round.
+        
+        Updates happen once per round, never per hash, so they cost nothing
+        measurable next to the hashing itself.
+        
+        Args:
+            result (MiningResult): Result of the round
+        """
+        self._hashes_metric.inc(result.attempts)
+        if result.duration > 0:
+            self._hash_rate_metric.set(result.attempts / result.duration)
+        self._difficulty_metric.set(self.consensus.pofw.difficulty)
+        if result.success:
+            self._blocks_metric.inc()
+            
     def _adjust_fractal_coordinates(self, last_block_time: float) -> None:
         """
         Adjust mining coordinates based on mining performance.
@@ -292,9 +320,8 @@ class Miner:
                         b=self.fractal_coord.b + COORD_ADJUST_STEP,
                         c=self.fractal_coord.c + COORD_ADJUST_STEP
                     )
-                    self.logger.info(
-                        f"Adjusted coordinates for easier mining: {self.fractal_coord}"
-                    )
+                    if self._coord_log.allow():
+                        self.logger.info("Adjusted coordinates for easier mining: %s", self.fractal_coord)
                 elif last_block_time < FAST_BLOCK_TIME:
                     # Mining too fast, move to harder spot
                     self.fractal_coord = FractalCoordinate(
@@ -302,9 +329,8 @@ class Miner:
                         b=max(0, self.fractal_coord.b - COORD_ADJUST_STEP),
                         c=max(0, self.fractal_coord.c - COORD_ADJUST_STEP)
                     )
-                    self.logger.info(
-                        f"Adjusted coordinates for harder mining: {self.fractal_coord}"
-                    )
+                    if self._coord_log.allow():
+                        self.logger.info("Adjusted coordinates for harder mining: %s", self.fractal_coord)
                     
         except Exception as e:
             self.logger.error(f"Failed to adjust coordinates: {str(e)}")
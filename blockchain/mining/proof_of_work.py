@@ -8,6 +8,7 @@ from ..core.block import Block
 from ..core.transaction import Transaction
 from ..core.fractal_coordinate import FractalCoordinate
 from ..core.blockchain import Blockchain, BlockchainError
+from ..tracing import TRACER, PHASE_HASH_SEARCH, PHASE_TEMPLATE
 
 # Mining constants
 BLOCK_REWARD = 50  # Reward for mining a block
@@ -49,12 +50,14 @@ class MiningResult:
         nonce (int): Nonce that produced the valid hash
         duration (float): Time taken to mine in seconds
         block (Optional[Block]): The mined block (if successful)
+        attempts (int): Number of hashes computed
     """
     success: bool
     hash_val: str = ""
     nonce: int = 0
     duration: float = 0
     block: Optional[Block] = None
+    attempts: int = 0
 
 class ProofOfFractalWork:
     """
@@ -85,7 +88,7 @@ class ProofOfFractalWork:
         self.difficulty = difficulty
         self.target = "0" * difficulty
         self.logger = logging.getLogger("triadnet.consensus")
-        self.logger.info(f"Initialized PoFW with difficulty {difficulty}")
+        self.logger.info("Initialized PoFW with difficulty %d", difficulty)
         
     def _calculate_fractal_score(self, coord: FractalCoordinate) -> float:
         """
@@ -114,8 +117,7 @@ class ProofOfFractalWork:
             score = max(MIN_SCORE, min(MAX_SCORE, base_score + noise))
             
             self.logger.debug(
-                f"Fractal score: {score:.3f} "
-                f"(base: {base_score:.3f}, noise: {noise:.3f})"
+                "Fractal score: %.3f (base: %.3f, noise: %.3f)", score, base_score, noise
             )
             return score
             
@@ -153,8 +155,8 @@ class ProofOfFractalWork:
             
             if self.difficulty != old_difficulty:
                 self.logger.info(
-                    f"Difficulty adjusted from {old_difficulty} to {self.difficulty} "
-                    f"(time ratio: {time_ratio:.2f}, fractal score: {fractal_score:.2f})"
+                    "Difficulty adjusted from %d to %d (time ratio: %.2f, fractal score: %.2f)",
+                    old_difficulty, self.difficulty, time_ratio, fractal_score
                 )
                 
         except Exception as e:
@@ -184,28 +186,26 @@ class ProofOfFractalWork:
         try:
             start_time = time.time()
             fractal_score = self._calculate_fractal_score(block.fractal_coord)
+            merkle_root = block.merkle_root()
             
-            self.logger.info(
-                f"Starting to mine block {block.index} "
-                f"with difficulty {self.difficulty}"
+            self.logger.debug(
+                "Starting to mine block %d with difficulty %d", block.index, self.difficulty
             )
             
             nonce = 0
             while nonce < max_nonce:
                 block.nonce = nonce
-                block_hash = block.calculate_hash()
+                block_hash = block.calculate_hash(merkle_root)
                 
                 if block_hash.startswith(self.target):
                     duration = time.time() - start_time
+                    TRACER.record(block.index, PHASE_HASH_SEARCH, duration)
                     block.hash = block_hash
                     self._adjust_difficulty(duration, fractal_score)
                     
-                    self.logger.info(
-                        f"Block {block.index} mined! "
-                        f"Hash: {block_hash[:10]}... "
-                        f"Nonce: {nonce} "
-                        f"Time: {duration:.2f}s "
-                        f"Difficulty: {self.difficulty}"
+                    self.logger.debug(
+                        "Block %d mined! Hash: %.10s... Nonce: %d Time: %.2fs Difficulty: %d",
+                        block.index, block_hash, nonce, duration, self.difficulty
                     )
                     
                     return MiningResult(
@@ -213,17 +213,18 @@ class ProofOfFractalWork:
                         hash_val=block_hash,
                         nonce=nonce,
                         duration=duration,
-                        block=block
+                        block=block,
+                        attempts=nonce + 1
                     )
                     
                 nonce += 1
                 
             duration = time.time() - start_time
+            TRACER.record(block.index, PHASE_HASH_SEARCH, duration)
             self.logger.warning(
-                f"Failed to mine block {block.index} "
-                f"after {max_nonce} attempts in {duration:.2f}s"
+                "Failed to mine block %d after %d attempts in %.2fs", block.index, max_nonce, duration
             )
-            return MiningResult(success=False, duration=duration)
+            return MiningResult(success=False, duration=duration, attempts=max_nonce)
             
         except Exception as e:
             self.logger.error(f"Mining error: {str(e)}")
@@ -265,6 +266,7 @@ class ConsensusManager:
         Raises:
             MiningError: If block creation fails
         """
+        started = time.perf_counter()
         try:
             if not isinstance(miner_address, str) or not miner_address:
                 raise MiningError("Invalid miner address")
@@ -293,10 +295,10 @@ class ConsensusManager:
                 fractal_coord=fractal_coord
             )
             
-            self.logger.info(
-                f"Created block {new_block.index} "
-                f"with {len(transactions)} transactions"
+            self.logger.debug(
+                "Created block %d with %d transactions", new_block.index, len(transactions)
             )
+            TRACER.record(new_block.index, PHASE_TEMPLATE, time.perf_counter() - started)
             return new_block
             
         except Exception as e:
@@ -322,19 +324,15 @@ class ConsensusManager:
             if result.success:
                 if self.blockchain.add_block(result.block):
                     # Remove mined transactions from pending pool
-                    mined_tx_ids = {tx.tx_id for tx in block.transactions}
-                    self.blockchain.pending_transactions = [
-                        tx for tx in self.blockchain.pending_transactions 
-                        if tx.tx_id not in mined_tx_ids
-                    ]
-                    self.logger.info(
-                        f"Block {block.index} added to chain, "
-                        f"removed {len(mined_tx_ids)} transactions from pool"
+                    removed = self.blockchain.remove_confirmed_transactions(block)
+                    self.logger.debug(
+                        "Block %d added to chain, removed %d transactions from pool",
+                        block.index, removed
                     )
                 else:
                     result.success = False
                     self.logger.warning(
-                        f"Block {block.index} mining succeeded but validation failed"
+                        "Block %d mining succeeded but validation failed", block.index
                     )
                     
             return result
@@ -0,0 +1,170 @@
+import hashlib
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from blockchain.core.block import Block, BlockHeader
+from blockchain.core.transaction import Transaction
+from blockchain.network.protocol import ProtocolError
+
+# Compact block constants
+SHORT_ID_BYTES = 6  # Size of a salted short transaction ID
+MAX_PARTIAL_BLOCKS = 16  # Compact blocks waiting for missing transactions
+
+def short_id(tx_id: str, salt: bytes) -> str:
+    """
+    Compute the salted short ID of a transaction.
+
+    Args:
+        tx_id (str): Full transaction ID
+        salt (bytes): Per-message salt (see ``CompactBlock.salt``)
+
+    Returns:
+        str: Hex short ID of SHORT_ID_BYTES bytes
+    """
+    return hashlib.blake2b(tx_id.encode(), key=salt, digest_size=SHORT_ID_BYTES).hexdigest()
+
+@dataclass
+class CompactBlock:
+    """
+    A block announced as its header plus short transaction IDs.
+
+    Receivers are expected to hold most of a new block's transactions in
+    their pending pool already, so only a short ID is sent per transaction.
+    Transactions a receiver cannot possibly have, the mining reward, are
+    sent in full as prefilled entries. Short IDs are keyed with the block
+    hash and a random nonce so that collisions cannot be precomputed and
+    differ between announcements.
+
+    Attributes:
+        header (BlockHeader): Header of the block
+        nonce (int): Random 64-bit value mixed into the short ID salt
+        short_ids (List[str]): Short IDs of the non-prefilled transactions,
+            in block order
+        prefilled (List[Tuple[int, Transaction]]): Transactions sent in
+            full, with their position in the block
+    """
+
+    header: BlockHeader
+    nonce: int
+    short_ids: List[str] = field(default_factory=list)
+    prefilled: List[Tuple[int, Transaction]] = field(default_factory=list)
+
+    @property
+    def salt(self) -> bytes:
+        return bytes.fromhex(self.header.hash) + self.nonce.to_bytes(8, "big")
+
+    @property
+    def transaction_count(self) -> int:
+        return len(self.short_ids) + len(self.prefilled)
+
+    @classmethod
+    def from_block(cls, block: Block, nonce: Optional[int] = None) -> 'CompactBlock':
+        """
+        Build a compact block, prefilling the mining reward.
+
+        Args:
+            block (Block): Block to announce
+            nonce (Optional[int]): Salt nonce; random if not given
+
+        Returns:
+            CompactBlock: The compact representation
+        """
+        compact = cls(
+            header=block.header(),
+            nonce=random.getrandbits(64) if nonce is None else nonce
+        )
+        salt = compact.salt
+        for position, tx in enumerate(block.transactions):
+            if tx.sender == "network":
+                compact.prefilled.append((position, tx))
+            else:
+                compact.short_ids.append(short_id(tx.tx_id, salt))
+        return compact
+
+    def reconstruct(self, mempool: Iterable[Transaction]) -> List[Optional[Transaction]]:
+        """
+        Fill in the block's transactions from a pending pool.
+
+        Args:
+            mempool (Iterable[Transaction]): Locally known transactions
+
+        Returns:
+            List[Optional[Transaction]]: Transactions in block order, with
+            None where no unique match was found
+        """
+        salt = self.salt
+        wanted = set(self.short_ids)
+        candidates: Dict[str, Optional[Transaction]] = {}
+        for tx in mempool:
+            sid = short_id(tx.tx_id, salt)
+            if sid in wanted:
+                # Two pool transactions with one short ID: trust neither
+                candidates[sid] = None if sid in candidates else tx
+
+        transactions: List[Optional[Transaction]] = [None] * self.transaction_count
+        for position, tx in self.prefilled:
+            transactions[position] = tx
+        short_ids = iter(self.short_ids)
+        for position in range(len(transactions)):
+            if transactions[position] is None:
+                transactions[position] = candidates.get(next(short_ids))
+        return transactions
+
+    def to_block(self, transactions: List[Transaction]) -> Block:
+        """
+        Assemble the full block once every transaction is known.
+
+        Args:
+            transactions (List[Transaction]): Transactions in block order
+
+        Returns:
+            Block: The block; its hash must still be checked by the caller
+        """
+        header = self.header
+        block = Block(
+            index=header.index,
+            timestamp=header.timestamp,
+            transactions=list(transactions),
+            miner=header.miner,
+            fractal_coord=header.fractal_coord,
+            previous_hash=header.previous_hash
+        )
+        block.nonce = header.nonce
+        block.hash = header.hash
+        return block
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "header": self.header.to_dict(),
+            "nonce": self.nonce,
+            "short_ids": self.short_ids,
+            "prefilled": [[position, tx.to_dict()] for position, tx in self.prefilled]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactBlock':
+        """
+        Create a CompactBlock from a message payload.
+
+        Raises:
+            ProtocolError: If the payload is malformed
+        """
+        try:
+            compact = cls(
+                header=BlockHeader.from_dict(data["header"]),
+                nonce=int(data["nonce"]),
+                short_ids=[str(sid) for sid in data.get("short_ids", [])],
+                prefilled=[
+                    (int(position), Transaction.from_dict(tx))
+                    for position, tx in data.get("prefilled", [])
+                ]
+            )
+        except Exception as e:
+            raise ProtocolError(f"Malformed compact block: {str(e)}")
+
+        positions = [position for position, _ in compact.prefilled]
+        if len(set(positions)) != len(positions) or any(
+            not 0 <= position < compact.transaction_count for position in positions
+        ):
+            raise ProtocolError("Malformed compact block: invalid prefilled positions")
+        return compact
@@ -0,0 +1,161 @@
+import lzma
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, Sequence, Tuple
+
+# Compression constants
+COMPRESSION_NONE = "none"  # Frame payload sent as plain JSON
+COMPRESSION_ZLIB = "zlib"  # Fast, moderate ratio; the default
+COMPRESSION_LZMA = "lzma"  # Slower, better ratio for bulk transfers on slow links
+SUPPORTED_COMPRESSION = (COMPRESSION_ZLIB, COMPRESSION_LZMA)  # Codecs this node can decode
+FRAME_FLAGS = {COMPRESSION_NONE: 0x00, COMPRESSION_ZLIB: 0x01, COMPRESSION_LZMA: 0x02}  # Frame header flag per codec
+COMPRESSION_THRESHOLD = 512  # Payloads smaller than this are never compressed
+ZLIB_LEVEL = 6  # zlib compression level
+LZMA_PRESET = 1  # lzma preset; higher presets cost far more CPU for little gain on JSON
+
+class CompressionError(Exception):
+    """Raised when a compressed payload cannot be decompressed."""
+    pass
+
+def negotiate(preferred: Sequence[str], remote: Iterable[str]) -> str:
+    """
+    Choose the codec for frames sent to a peer.
+
+    Each side picks its own codec for the frames it sends, since every frame
+    names its codec in the header flags; a peer only has to be able to
+    decode it.
+
+    Args:
+        preferred (Sequence[str]): Local codecs in order of preference
+        remote (Iterable[str]): Codecs the peer advertised it can decode
+
+    Returns:
+        str: First preferred codec the peer supports, or COMPRESSION_NONE
+    """
+    remote = set(remote)
+    for codec in preferred:
+        if codec in remote and codec in SUPPORTED_COMPRESSION:
+            return codec
+    return COMPRESSION_NONE
+
+def compress(body: bytes, codec: str) -> Tuple[bytes, int]:
+    """
+    Compress a frame payload if it is worth it.
+
+    Args:
+        body (bytes): Plain payload
+        codec (str): Codec negotiated for the connection
+
+    Returns:
+        Tuple[bytes, int]: Payload to send and its frame flags; the plain
+        payload with no flags if it is below COMPRESSION_THRESHOLD or did
+        not shrink
+    """
+    if codec == COMPRESSION_NONE or len(body) < COMPRESSION_THRESHOLD:
+        return body, FRAME_FLAGS[COMPRESSION_NONE]
+    if codec == COMPRESSION_ZLIB:
+        data = zlib.compress(body, ZLIB_LEVEL)
+    elif codec == COMPRESSION_LZMA:
+        data = lzma.compress(body, format=lzma.FORMAT_XZ, check=lzma.CHECK_NONE, preset=LZMA_PRESET)
+    else:
+        raise CompressionError(f"Unknown compression codec {codec}")
+
+    if len(data) >= len(body):
+        return body, FRAME_FLAGS[COMPRESSION_NONE]
+    return data, FRAME_FLAGS[codec]
+
+def decompress(data: bytes, flags: int, max_size: int) -> bytes:
+    """
+    Decompress a frame payload according to its flags.
+
+    Args:
+        data (bytes): Payload as received
+        flags (int): Frame header flags
+        max_size (int): Largest allowed decompressed size
+
+    Returns:
+        bytes: Plain payload
+
+    Raises:
+        CompressionError: If the flags are unknown, the data is corrupt or
+            truncated, or it expands beyond max_size
+    """
+    if flags == FRAME_FLAGS[COMPRESSION_NONE]:
+        return data
+    try:
+        if flags == FRAME_FLAGS[COMPRESSION_ZLIB]:
+            decompressor = zlib.decompressobj()
+            body = decompressor.decompress(data, max_size + 1)
+        elif flags == FRAME_FLAGS[COMPRESSION_LZMA]:
+            decompressor = lzma.LZMADecompressor()
+            body = decompressor.decompress(data, max_length=max_size + 1)
+        else:
+            raise CompressionError(f"Unknown frame flags {flags:#x}")
+    except (zlib.error, lzma.LZMAError) as e:
+        raise CompressionError(f"Corrupt compressed payload: {str(e)}")
+
+    if len(body) > max_size:
+        raise CompressionError(f"Compressed payload expands beyond {max_size} bytes")
+    if not decompressor.eof:
+        raise CompressionError("Truncated compressed payload")
+    return body
+
+class CompressionStats:
+    """
+    Per-message-type compression counters.
+
+    Counts plain and wire bytes and the CPU time spent compressing and
+    decompressing, for frames encoded for sending (once, however many peers
+    they go to) and frames received. Messages that skipped
+    compression count too, so the ratio reflects what a message type
+    actually costs on the wire.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, Counter] = {}
+
+    def record(self, direction: str, msg_type: str, plain: int, wire: int, seconds: float) -> None:
+        """
+        Record one frame.
+
+        Args:
+            direction (str): "sent" or "received"
+            msg_type (str): Message type
+            plain (int): Payload size before compression
+            wire (int): Payload size on the wire
+            seconds (float): CPU time spent compressing or decompressing
+        """
+        counter = self._counters.setdefault(msg_type, Counter())
+        counter[direction + ".messages"] += 1
+        counter[direction + ".plain"] += plain
+        counter[direction + ".wire"] += wire
+        counter[direction + ".seconds"] += seconds
+
+    def ratio(self, msg_type: str) -> float:
+        """Plain bytes per wire byte over all frames of a type, 1.0 if none."""
+        counter = self._counters.get(msg_type, Counter())
+        wire = counter["sent.wire"] + counter["received.wire"]
+        plain = counter["sent.plain"] + counter["received.plain"]
+        return plain / wire if wire else 1.0
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize the counters.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Per message type: frames, plain
+            and wire bytes, ratio, and microseconds of compression and
+            decompression CPU time per frame
+        """
+        report = {}
+        for msg_type, counter in sorted(self._counters.items()):
+            sent, received = counter["sent.messages"], counter["received.messages"]
+            report[msg_type] = {
+                "messages": sent + received,
+                "plain_bytes": counter["sent.plain"] + counter["received.plain"],
+                "wire_bytes": counter["sent.wire"] + counter["received.wire"],
+                "ratio": round(self.ratio(msg_type), 3),
+                "compress_us": round(counter["sent.seconds"] * 1e6 / sent, 1) if sent else 0.0,
+                "decompress_us": round(counter["received.seconds"] * 1e6 / received, 1) if received else 0.0
+            }
+        return report
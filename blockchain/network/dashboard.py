@@ -1,5 +1,5 @@
-from flask import Flask, render_template, request, jsonify
-import json
+from flask import Flask, render_template, request, jsonify, make_response
+from blockchain.network.recent_blocks import RecentBlocks
 from blockchain.network.ssh_connector import establish_ssh_connection, close_ssh_connection, SSHConnectionError
 
 app = Flask(__name__)
@@ -7,17 +7,21 @@ app = Flask(__name__)
 # Store SSH connections
 ssh_connections = {}
 
+# Last blocks of the block store, read incrementally
+recent_blocks = RecentBlocks(path='blocks.json')
+
+PLACEHOLDER_BLOCK = {'hash': 'N/A', 'nonce': 'N/A', 'duration': 0, 'coord': (0, 0, 0), 'block_time': 0, 'transactions': []}
+
 @app.route('/')
 def dashboard():
-    blocks = []
-    try:
-        with open('blocks.json', 'r') as f:
-            for line in f:
-                blocks.append(json.loads(line.strip()))
-        blocks = blocks[-10:]
-    except FileNotFoundError:
-        blocks = [{'hash': 'N/A', 'nonce': 'N/A', 'duration': 0, 'coord': (0, 0, 0), 'block_time': 0, 'transactions': []}]
-    return render_template('dashboard.html', blocks=blocks)
+    recent_blocks.refresh()
+    body = recent_blocks.render(
+        lambda blocks: render_template('dashboard.html', blocks=blocks or [PLACEHOLDER_BLOCK])
+    )
+    response = make_response(body)
+    response.set_etag(recent_blocks.etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 @app.route('/connect-ssh', methods=['POST'])
 def connect_ssh():
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+# Inventory constants
+INV_TX = "tx"  # Inventory item kind for transactions
+INV_BLOCK = "block"  # Inventory item kind for blocks
+MAX_INV_ITEMS = 50000  # Items accepted in a single inv or getdata message
+SEEN_CACHE_SIZE = 100000  # Inventory IDs remembered by a node
+SEEN_TTL = 600.0  # Seconds an inventory ID stays in a seen cache
+PEER_KNOWN_SIZE = 20000  # Inventory IDs remembered per peer
+
+InventoryItem = Tuple[str, str]
+
+class SeenCache:
+    """
+    Bounded set of recently seen keys with time-based expiry.
+
+    Keys are kept in insertion order with a fixed TTL, so the oldest entry is
+    always the next to expire and both expiry and eviction pop from the
+    front. Membership checks and inserts are O(1) amortized.
+
+    Attributes:
+        max_entries (int): Maximum number of keys kept
+        ttl (float): Seconds a key is remembered after it was last added
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SEEN_CACHE_SIZE,
+        ttl: float = SEEN_TTL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        self._expire(self._clock())
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        expires = self._entries.get(key)
+        if expires is None:
+            return False
+        if expires <= self._clock():
+            del self._entries[key]
+            return False
+        return True
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Remember a key, refreshing its expiry if already present.
+
+        Args:
+            key (Hashable): Key to remember
+
+        Returns:
+            bool: True if the key was not already in the cache
+        """
+        now = self._clock()
+        self._expire(now)
+        is_new = key not in self._entries
+        self._entries[key] = now + self.ttl
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return is_new
+
+    def discard(self, key: Hashable) -> None:
+        """Forget a key if present."""
+        self._entries.pop(key, None)
+
+    def _expire(self, now: float) -> None:
+        while self._entries:
+            key, expires = next(iter(self._entries.items()))
+            if expires > now:
+                break
+            self._entries.popitem(last=False)
+
+def encode_inventory(items: List[InventoryItem]) -> Dict[str, Any]:
+    """
+    Build an inv/getdata payload.
+
+    Args:
+        items (List[InventoryItem]): (kind, ID) pairs
+
+    Returns:
+        Dict[str, Any]: Message payload
+    """
+    return {"items": [[kind, item_id] for kind, item_id in items]}
+
+def decode_inventory(payload: Dict[str, Any]) -> List[InventoryItem]:
+    """
+    Parse an inv/getdata payload, dropping malformed or unknown items.
+
+    Args:
+        payload (Dict[str, Any]): Message payload
+
+    Returns:
+        List[InventoryItem]: (kind, ID) pairs, at most MAX_INV_ITEMS
+    """
+    items = []
+    for entry in payload.get("items", [])[:MAX_INV_ITEMS]:
+        if (
+            isinstance(entry, list) and len(entry) == 2
+            and entry[0] in (INV_TX, INV_BLOCK) and isinstance(entry[1], str)
+        ):
+            items.append((entry[0], entry[1]))
+    return items
@@ -1,38 +1,900 @@
-import json
-import socket
-import threading
-from triadnet.wallet import Wallet
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from blockchain.core.blockchain import Blockchain, BlockchainError
+from blockchain.core.block import Block
+from blockchain.core.transaction import Transaction
+from blockchain.network.compact import CompactBlock, MAX_PARTIAL_BLOCKS
+from blockchain.network.compression import (
+    COMPRESSION_ZLIB, COMPRESSION_LZMA, SUPPORTED_COMPRESSION, CompressionStats, negotiate
+)
+from blockchain.network.inventory import (
+    SeenCache, InventoryItem, INV_TX, INV_BLOCK, MAX_INV_ITEMS,
+    encode_inventory, decode_inventory
+)
+from blockchain.network.peer import Peer
+from blockchain.network.ratelimit import TokenBucket
+from blockchain.network.reconcile import (
+    IBLT, ReconciliationError, ReconciliationState,
+    RELAY_FLOOD, RELAY_RECONCILE, RECONCILE_FLOOD_FANOUT, RECONCILE_INTERVAL,
+    RECONCILE_TIMEOUT
+)
+from blockchain.network.sync import ChainSync, SyncError
+from blockchain.network.protocol import (
+    PROTOCOL_VERSION, ProtocolError, encode_message, message_priority,
+    MSG_VERSION, MSG_TX, MSG_TXS, MSG_BLOCK, MSG_INV, MSG_GETDATA,
+    MSG_GETHEADERS, MSG_HEADERS, MSG_GETBODIES, MSG_BODIES,
+    MSG_CMPCTBLOCK, MSG_GETBLOCKTXN, MSG_BLOCKTXN,
+    MSG_REQRECON, MSG_SKETCH, MSG_RECONCILDIFF
+)
+
+# Node constants
+LISTEN_BACKLOG = 1024  # Pending inbound connections queued by the OS
+HANDSHAKE_TIMEOUT = 10  # Seconds to wait for a peer's version message
+SYNC_TICK_INTERVAL = 1.0  # Seconds between checks for stalled sync requests
+TX_TRICKLE_INTERVAL = 0.005  # Mean seconds transaction announcements wait per peer
+MAX_TRICKLE_DELAY = 0.02  # Upper bound on a peer's trickle delay
+MAX_INV_BATCH = 1000  # Queued announcements that flush a peer's batch at once
+INITIAL_RECONNECT_DELAY = 0.5  # Seconds before the first reconnect attempt
+MAX_RECONNECT_DELAY = 60.0  # Upper bound for the reconnect backoff
+REQUEST_TIMEOUT = 5.0  # Seconds before an unanswered getdata item is asked for again
+RELAY_POOL_SIZE = 5000  # Recently announced objects kept to answer getdata
+DEFAULT_COMPRESSION = (COMPRESSION_ZLIB, COMPRESSION_LZMA)  # Codec preference for sent frames
+MAX_INBOUND_PEERS = 125  # Inbound connections accepted at once
+BAN_SCORE = 100  # Misbehavior points that get a peer disconnected and banned
+BAN_DURATION = 3600.0  # Seconds a banned host may not connect
+THROTTLE_PENALTY = 1  # Points per message read while a peer is over its message rate
+
+class NodeError(Exception):
+    """Base exception for node-related errors."""
+    pass
 
 class Node:
-    def __init__(self, node_id: str, host: str = "127.0.0.1", port: int = 5000):
+    """
+    Peer-to-peer node running on a single asyncio event loop.
+
+    Every connection, inbound or outbound, is a Peer served by one reader
+    task and one writer task; there are no per-connection threads. Peers
+    registered with ``add_peer`` get a persistent outbound connection that is
+    re-established with exponential backoff whenever it drops, so relaying a
+    message costs one queued write per peer rather than a new connection.
+    Messages use the framing in
+    ``blockchain.network.protocol`` and are dispatched to handlers that feed
+    the node's Blockchain:
+
+    - ``version``: handshake; starts a headers-first sync if the peer is ahead
+    - ``inv``: announces transaction IDs and block hashes; unseen items are
+      requested from the first peer that announces them with ``getdata``
+    - ``getdata``: answered with one ``txs`` batch and full ``block`` messages
+    - ``tx``/``txs``: add to the pending pool and announce new transactions
+    - ``cmpctblock``: new blocks are pushed as a header with short
+      transaction IDs and rebuilt from the pending pool; transactions the
+      pool lacks are fetched with ``getblocktxn``/``blocktxn``
+    - ``block``: full block, sent only when a compact block cannot be rebuilt
+    - ``getheaders``/``headers``/``getbodies``/``bodies``: initial block
+      download, handled by ``ChainSync``
+
+    Full objects cross each link at most once: items already in the node's
+    seen cache are neither requested nor re-processed, and announcements skip
+    peers that are known to have the item. Transaction announcements are not
+    sent one by one; each peer collects them until its own randomized trickle
+    timer fires (TX_TRICKLE_INTERVAL on average, at most MAX_TRICKLE_DELAY)
+    or MAX_INV_BATCH are queued, and then gets them as a single ``inv``.
+
+    With ``tx_relay=RELAY_RECONCILE``, a new transaction is flooded to at
+    most RECONCILE_FLOOD_FANOUT outbound peers that also reconcile and is
+    not announced to the other reconciling peers. Instead, every
+    RECONCILE_INTERVAL the
+    outbound side of each such link starts a round (``reqrecon``), the
+    inbound side answers with an IBLT sketch of the transactions it has
+    not announced (``sketch``), and the initiator decodes the difference,
+    announces what the peer lacks and asks for what it lacks itself
+    (``reconcildiff``). Rounds that fail to decode fall back to ``inv``.
+
+    Frames sent to a peer are compressed with the first codec in
+    ``compression`` that the peer advertised in its version message;
+    payloads under COMPRESSION_THRESHOLD are sent as they are. Ratios and
+    CPU cost per message type are kept in ``compression_stats``.
+
+    A peer cannot starve the others: each peer's reads are paced by its
+    message and byte buckets (see ``Peer``), sends are queued by priority
+    so blocks overtake transactions, and ``upload_limit`` caps the bytes
+    per second written to all peers together. At most MAX_INBOUND_PEERS
+    inbound connections are accepted. Peers collect misbehavior points for
+    provable protocol violations (malformed frames, invalid proof of work,
+    blocks that do not hash to their header) and for reading on while over
+    their message rate; at BAN_SCORE they are disconnected and their host is
+    banned for BAN_DURATION. A peer on a competing branch cannot be synced
+    from and is disconnected without penalty; reconnects to it keep backing
+    off.
+
+    Attributes:
+        node_id (str): This node's identifier
+        blockchain (Blockchain): Chain and pending pool served by this node
+        host (str): Listen host
+        port (int): Listen port (updated after start if 0 was given)
+        peers (Dict[str, Tuple[str, int]]): Known peer addresses by peer ID
+        tx_relay (str): RELAY_FLOOD or RELAY_RECONCILE
+        compression (Sequence[str]): Codecs for sent frames in order of
+            preference; empty to send everything uncompressed
+        compression_stats (CompressionStats): Per-type compression counters
+        upload_limit (float): Bytes per second written to all peers
+            together, 0 for no limit
+        banned (Dict[str, float]): Banned hosts and when their bans expire,
+            in ``time.monotonic()`` seconds
+        seen (SeenCache): Inventory this node has already processed
+        sync (ChainSync): Headers-first block download state
+        stats (Counter): Per-type ``messages.*`` and ``bytes.*`` receive
+            counters, ``objects`` for full transactions and blocks received
+            and ``duplicates`` for those that were already known
+        accept_listeners (List[Callable[[InventoryItem], None]]): Called with
+            each transaction or block this node accepts from the network or
+            from ``submit_transaction``
+        shaper_factory (Optional[Callable[[], Any]]): If set, called for every
+            new connection to create a link shaper for the peer's writes
+            (see ``Peer``); used by the network simulator
+    """
+
+    def __init__(
+        self,
+        node_id: str,
+        blockchain: Optional[Blockchain] = None,
+        host: str = "127.0.0.1",
+        port: int = 5000,
+        tx_relay: str = RELAY_FLOOD,
+        compression: Sequence[str] = DEFAULT_COMPRESSION,
+        upload_limit: float = 0.0
+    ):
+        if tx_relay not in (RELAY_FLOOD, RELAY_RECONCILE):
+            raise NodeError(f"Unknown transaction relay mode {tx_relay}")
         self.node_id = node_id
-        self.wallet = Wallet()
+        self.blockchain = blockchain or Blockchain()
         self.host = host
         self.port = port
-        self.peers = {}
-        self.running = True
-
-    def start_server(self):
-        threading.Thread(target=self._server_loop, daemon=True).start()
-
-    def _server_loop(self):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.bind((self.host, self.port))
-            s.listen()
-            while self.running:
-                client, _ = s.accept()
-                threading.Thread(target=self._handle_client, args=(client,), daemon=True).start()
-
-    def _handle_client(self, client_socket):
-        with client_socket:
-            data = client_socket.recv(4096)
-            if data: print(f"[{self.node_id}] Received: {data.decode()}")
-
-    def broadcast(self, message: dict):
-        for peer_id, (host, port) in self.peers.items():
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.connect((host, port))
-                s.sendall(json.dumps(message).encode())
-
-    def add_peer(self, peer_id: str, host: str, port: int):
+        self.tx_relay = tx_relay
+        self.compression = tuple(compression)
+        self.compression_stats = CompressionStats()
+        self.upload_limit = upload_limit
+        self.banned: Dict[str, float] = {}
+        self.peers: Dict[str, Tuple[str, int]] = {}
+        self.running = False
+        self.seen = SeenCache()
+        self.sync = ChainSync(self.blockchain, lambda: self.connected_peers, self.seen, node_id)
+        self.stats: Counter = Counter()
+        self.accept_listeners: List[Callable[[InventoryItem], None]] = []
+        self.shaper_factory: Optional[Callable[[], Any]] = None
+        self.logger = logging.getLogger("triadnet.node")
+
+        self._connections: Set[Peer] = set()
+        self._dialers: Dict[str, asyncio.Task] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._requested = SeenCache(ttl=REQUEST_TIMEOUT)
+        self._relay_pool: "OrderedDict[InventoryItem, Dict[str, Any]]" = OrderedDict()
+        self._upload_bucket = TokenBucket(upload_limit, upload_limit) if upload_limit > 0 else None
+        self._partial_blocks: "OrderedDict[str, Tuple[CompactBlock, List[Optional[Transaction]]]]" = OrderedDict()
+        self._handlers: Dict[str, Callable[[Peer, Dict[str, Any]], Awaitable[None]]] = {
+            MSG_VERSION: self._handle_version,
+            MSG_TX: self._handle_tx,
+            MSG_TXS: self._handle_txs,
+            MSG_BLOCK: self._handle_block,
+            MSG_GETHEADERS: self.sync.handle_getheaders,
+            MSG_HEADERS: self.sync.handle_headers,
+            MSG_GETBODIES: self.sync.handle_getbodies,
+            MSG_BODIES: self.sync.handle_bodies,
+            MSG_INV: self._handle_inv,
+            MSG_GETDATA: self._handle_getdata,
+            MSG_CMPCTBLOCK: self._handle_cmpctblock,
+            MSG_GETBLOCKTXN: self._handle_getblocktxn,
+            MSG_BLOCKTXN: self._handle_blocktxn,
+            MSG_REQRECON: self._handle_reqrecon,
+            MSG_SKETCH: self._handle_sketch,
+            MSG_RECONCILDIFF: self._handle_reconcildiff,
+        }
+
+    @property
+    def connected_peers(self) -> List[Peer]:
+        """Peers that have completed the handshake."""
+        return [peer for peer in self._connections if peer.peer_id is not None]
+
+    def ban(self, host: str, duration: float = BAN_DURATION) -> None:
+        """
+        Refuse connections to and from a host for a while.
+
+        Args:
+            host (str): Host to ban
+            duration (float): Ban length in seconds
+        """
+        self.banned[host] = time.monotonic() + duration
+
+    def is_banned(self, host: str) -> bool:
+        """Whether a host is currently banned."""
+        until = self.banned.get(host)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self.banned[host]
+            return False
+        return True
+
+    async def start(self) -> None:
+        """
+        Start listening and connect to all known peers.
+
+        Raises:
+            NodeError: If the server cannot be started
+        """
+        try:
+            self._server = await asyncio.start_server(
+                self._handle_connection, self.host, self.port, backlog=LISTEN_BACKLOG
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            self.running = True
+            self.logger.info(f"[{self.node_id}] Listening on {self.host}:{self.port}")
+        except Exception as e:
+            raise NodeError(f"Failed to start node: {str(e)}")
+
+        for peer_id in list(self.peers):
+            self._start_dialer(peer_id)
+        self._spawn(self._sync_loop())
+        if self.tx_relay == RELAY_RECONCILE:
+            self._spawn(self._reconcile_loop())
+
+    async def stop(self) -> None:
+        """Close the server, every peer connection and background task."""
+        self.running = False
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in list(self._dialers.values()):
+            task.cancel()
+        self._dialers.clear()
+        for peer in list(self._connections):
+            await peer.close()
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self.logger.info(f"[{self.node_id}] Stopped")
+
+    def add_peer(self, peer_id: str, host: str, port: int) -> None:
+        """
+        Register a peer address and keep a connection to it open.
+
+        The connection is opened right away if the node is running, otherwise
+        on start, and is re-established with backoff whenever it drops.
+
+        Args:
+            peer_id (str): Peer's node ID
+            host (str): Peer host
+            port (int): Peer port
+        """
+        if self.peers.get(peer_id) == (host, port) and peer_id in self._dialers:
+            return
+        self.remove_peer(peer_id)
         self.peers[peer_id] = (host, port)
+        if self.running:
+            self._start_dialer(peer_id)
+
+    def remove_peer(self, peer_id: str) -> None:
+        """
+        Forget a peer address and stop reconnecting to it.
+
+        Args:
+            peer_id (str): Peer's node ID
+        """
+        self.peers.pop(peer_id, None)
+        dialer = self._dialers.pop(peer_id, None)
+        if dialer is not None:
+            dialer.cancel()
+
+    async def connect(self, host: str, port: int) -> Optional[Peer]:
+        """
+        Open an outbound connection and start serving it.
+
+        Args:
+            host (str): Peer host
+            port (int): Peer port
+
+        Returns:
+            Optional[Peer]: The connected peer, or None if connecting failed
+        """
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError as e:
+            self.logger.warning(f"[{self.node_id}] Could not connect to {host}:{port}: {e}")
+            return None
+
+        peer = Peer(reader, writer, outbound=True)
+        self._spawn(self._serve_peer(peer))
+        return peer
+
+    async def broadcast(
+        self,
+        msg_type: str,
+        payload: Dict[str, Any],
+        exclude: Optional[Peer] = None
+    ) -> None:
+        """
+        Send a message to every connected peer.
+
+        The message is encoded once and queued on all peers concurrently, so
+        a peer with a full send queue only delays the broadcast as a whole
+        and never the writes to other peers.
+
+        Args:
+            msg_type (str): Message type
+            payload (Dict[str, Any]): Message body
+            exclude (Optional[Peer]): Peer to skip, usually the message source
+        """
+        targets = [peer for peer in self.connected_peers if peer is not exclude]
+        await self._send_to(targets, msg_type, payload)
+
+    async def submit_transaction(self, tx: Transaction) -> bool:
+        """
+        Add a local transaction to the pending pool and announce it.
+
+        Args:
+            tx (Transaction): Transaction to submit
+
+        Returns:
+            bool: True if the transaction was new and accepted
+        """
+        if not self._accept_transaction(tx):
+            return False
+        await self._announce((INV_TX, tx.tx_id), tx.to_dict())
+        return True
+
+    async def announce_block(self, block: Block) -> None:
+        """
+        Announce a block that is already part of the local chain.
+
+        Args:
+            block (Block): Block to announce
+        """
+        self.seen.add((INV_BLOCK, block.hash))
+        await self._relay_block(block)
+
+    async def _send_to(self, targets: List[Peer], msg_type: str, payload: Dict[str, Any]) -> None:
+        """Encode a message once and queue it on several peers concurrently."""
+        if not targets:
+            return
+
+        priority = message_priority(msg_type)
+        # Peers may have negotiated different codecs; encode once per codec
+        frames: Dict[str, bytes] = {}
+        for peer in targets:
+            if peer.compression not in frames:
+                frames[peer.compression] = encode_message(
+                    msg_type, payload, peer.compression, self.compression_stats
+                )
+        results = await asyncio.gather(
+            *(peer.send_frame(frames[peer.compression], priority) for peer in targets),
+            return_exceptions=True
+        )
+        for peer, result in zip(targets, results):
+            if isinstance(result, (ConnectionError, OSError)):
+                self.logger.warning(f"[{self.node_id}] Failed to send to {peer}: {result}")
+                await peer.close()
+            elif isinstance(result, BaseException):
+                raise result
+
+    async def _announce(
+        self,
+        item: InventoryItem,
+        payload: Dict[str, Any],
+        exclude: Optional[Peer] = None
+    ) -> None:
+        """Announce an item to every peer not already known to have it."""
+        self._relay_pool[item] = payload
+        self._relay_pool.move_to_end(item)
+        while len(self._relay_pool) > RELAY_POOL_SIZE:
+            self._relay_pool.popitem(last=False)
+
+        candidates = [
+            peer for peer in self.connected_peers
+            if peer is not exclude and item not in peer.known_inventory
+        ]
+        flood = set()
+        if item[0] == INV_TX:
+            # Low-fanout flooding: a few outbound peers still get the
+            # transaction at once, the rest learn of it by reconciliation
+            outbound = [peer for peer in candidates if peer.recon is not None and peer.outbound]
+            flood = set(random.sample(outbound, min(RECONCILE_FLOOD_FANOUT, len(outbound))))
+
+        targets = []
+        for peer in candidates:
+            if item[0] == INV_TX and peer.recon is not None and peer not in flood:
+                peer.recon.pending.add(item[1])
+                continue
+            peer.known_inventory.add(item)
+            if item[0] == INV_TX:
+                self._queue_inventory(peer, item)
+            else:
+                targets.append(peer)
+        await self._send_to(targets, MSG_INV, encode_inventory([item]))
+
+    def _announce_to(self, peer: Peer, tx_ids: List[str]) -> None:
+        """Queue announcements of transactions a peer is not known to have."""
+        for tx_id in tx_ids:
+            item = (INV_TX, tx_id)
+            if item not in peer.known_inventory and item in self._relay_pool:
+                peer.known_inventory.add(item)
+                self._queue_inventory(peer, item)
+
+    def _mark_known(self, peer: Peer, item: InventoryItem) -> None:
+        peer.known_inventory.add(item)
+        if peer.recon is not None and item[0] == INV_TX:
+            peer.recon.pending.discard(item[1])
+
+    def _queue_inventory(self, peer: Peer, item: InventoryItem) -> None:
+        """Add a transaction announcement to a peer's next batch."""
+        peer.inv_queue.append(item)
+        if len(peer.inv_queue) >= MAX_INV_BATCH:
+            self._flush_inventory(peer)
+        elif peer.inv_timer is None:
+            # Independent exponential delays per peer, so batches to different
+            # peers do not go out in lockstep
+            delay = min(random.expovariate(1 / TX_TRICKLE_INTERVAL), MAX_TRICKLE_DELAY)
+            peer.inv_timer = asyncio.get_event_loop().call_later(
+                delay, self._flush_inventory, peer
+            )
+
+    def _flush_inventory(self, peer: Peer) -> None:
+        if peer.inv_timer is not None:
+            peer.inv_timer.cancel()
+            peer.inv_timer = None
+        items, peer.inv_queue = peer.inv_queue, []
+        if items and not peer.closed and self.running:
+            self._spawn(self._send_quietly(peer, MSG_INV, encode_inventory(items)))
+
+    async def _send_quietly(self, peer: Peer, msg_type: str, payload: Dict[str, Any]) -> None:
+        try:
+            await peer.send(msg_type, payload)
+        except ConnectionError:
+            pass
+
+    async def _relay_block(self, block: Block, exclude: Optional[Peer] = None) -> None:
+        """Push a compact block to every peer not already known to have it."""
+        item = (INV_BLOCK, block.hash)
+        targets = []
+        for peer in self.connected_peers:
+            if peer is exclude or item in peer.known_inventory:
+                continue
+            peer.known_inventory.add(item)
+            targets.append(peer)
+        if targets:
+            await self._send_to(targets, MSG_CMPCTBLOCK, CompactBlock.from_block(block).to_dict())
+
+    def _spawn(self, coro: Awaitable) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _start_dialer(self, peer_id: str) -> None:
+        if peer_id not in self._dialers:
+            self._dialers[peer_id] = self._spawn(self._maintain_connection(peer_id))
+
+    async def _maintain_connection(self, peer_id: str) -> None:
+        """Keep one outbound connection to a registered peer open."""
+        delay = INITIAL_RECONNECT_DELAY
+        while self.running and peer_id in self.peers:
+            host, port = self.peers[peer_id]
+            try:
+                if self.is_banned(host):
+                    raise ConnectionRefusedError(f"{host} is banned")
+                reader, writer = await asyncio.open_connection(host, port)
+            except OSError as e:
+                self.logger.debug(f"[{self.node_id}] Could not connect to {host}:{port}: {e}")
+            else:
+                peer = Peer(reader, writer, outbound=True)
+                await self._serve_peer(peer)
+                if peer.peer_id is not None and not peer.diverged:
+                    # The session got past the handshake; start backing off afresh
+                    delay = INITIAL_RECONNECT_DELAY
+
+            if not self.running:
+                break
+            # Jitter keeps peers that dropped together from reconnecting in lockstep
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _reconcile_loop(self) -> None:
+        while self.running:
+            await asyncio.sleep(RECONCILE_INTERVAL)
+            now = time.monotonic()
+            for peer in self.connected_peers:
+                state = peer.recon
+                if state is None or not peer.outbound:
+                    continue
+                if state.started_at:
+                    if now - state.started_at < RECONCILE_TIMEOUT:
+                        continue
+                    self._announce_to(peer, state.finish())
+
+                salt = os.urandom(8)
+                state.take_snapshot(salt)
+                state.started_at = now
+                self.stats["reconcile.rounds"] += 1
+                await self._send_quietly(peer, MSG_REQRECON, {
+                    "salt": salt.hex(),
+                    "size": len(state.snapshot)
+                })
+
+    async def _sync_loop(self) -> None:
+        while self.running:
+            await asyncio.sleep(SYNC_TICK_INTERVAL)
+            await self.sync.tick()
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        peer = Peer(reader, writer, outbound=False)
+        inbound = sum(1 for other in self._connections if not other.outbound)
+        if self.is_banned(peer.address[0]) or inbound >= MAX_INBOUND_PEERS:
+            self.logger.debug(f"[{self.node_id}] Refusing connection from {peer}")
+            writer.close()
+            return
+        await self._serve_peer(peer)
+
+    async def _serve_peer(self, peer: Peer) -> None:
+        """Run the handshake and message loop for one connection."""
+        self._connections.add(peer)
+        peer.compression_stats = self.compression_stats
+        peer.upload_bucket = self._upload_bucket
+        if self.shaper_factory is not None:
+            peer.shaper = self.shaper_factory()
+        peer.start()
+        try:
+            await peer.send(MSG_VERSION, {
+                "node_id": self.node_id,
+                "version": PROTOCOL_VERSION,
+                "height": len(self.blockchain.chain),
+                "relay": self.tx_relay,
+                "compression": list(SUPPORTED_COMPRESSION)
+            })
+            msg_type, payload, _ = await asyncio.wait_for(peer.receive(), HANDSHAKE_TIMEOUT)
+            if msg_type != MSG_VERSION:
+                raise ProtocolError(f"Expected version message, got {msg_type}")
+            await self._handle_version(peer, payload)
+
+            while self.running and not peer.closed:
+                msg_type, payload, delay = await peer.receive()
+                self.stats["messages." + msg_type] += 1
+                self.stats["bytes." + msg_type] += peer.last_message_size
+                handler = self._handlers.get(msg_type)
+                if handler is None:
+                    self.logger.debug(f"[{self.node_id}] Ignoring unknown message {msg_type} from {peer}")
+                else:
+                    await handler(peer, payload)
+
+                if delay > 0:
+                    # Over its limits: stop reading from this peer for a while
+                    self.stats["throttled"] += 1
+                    if peer.message_bucket.tokens < 0 and self._penalize(peer, THROTTLE_PENALTY, "message flood"):
+                        break
+                    await asyncio.sleep(delay)
+
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.TimeoutError):
+            pass
+        except ProtocolError as e:
+            self.logger.warning(f"[{self.node_id}] Protocol error from {peer}: {e}")
+            self._penalize(peer, BAN_SCORE, str(e))
+        except SyncError as e:
+            self.logger.info(f"[{self.node_id}] Disconnecting {peer}, its chain diverged: {e}")
+            peer.diverged = True
+            self.stats["sync.diverged"] += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"[{self.node_id}] Error serving {peer}: {str(e)}")
+        finally:
+            self._connections.discard(peer)
+            await peer.close()
+
+    def _penalize(self, peer: Peer, points: int, reason: str) -> bool:
+        """
+        Add misbehavior points to a peer, banning its host at BAN_SCORE.
+
+        Args:
+            peer (Peer): Misbehaving peer
+            points (int): Points to add
+            reason (str): What the peer did, for the log
+
+        Returns:
+            bool: True if the peer reached BAN_SCORE and should be
+            disconnected
+        """
+        peer.misbehavior += points
+        if peer.misbehavior < BAN_SCORE:
+            return False
+        if not self.is_banned(peer.address[0]):
+            self.logger.warning(f"[{self.node_id}] Banning {peer}: {reason}")
+            self.ban(peer.address[0])
+            self.stats["bans"] += 1
+        return True
+
+    async def _handle_version(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        peer.peer_id = str(payload.get("node_id", ""))
+        peer.height = int(payload.get("height", 0))
+        remote_codecs = payload.get("compression")
+        if isinstance(remote_codecs, list):
+            peer.compression = negotiate(
+                self.compression, [codec for codec in remote_codecs if isinstance(codec, str)]
+            )
+        if self.tx_relay == RELAY_RECONCILE and payload.get("relay") == RELAY_RECONCILE:
+            peer.recon = ReconciliationState()
+        self.logger.debug(f"[{self.node_id}] Handshake with {peer} at height {peer.height}")
+        if peer.height > len(self.blockchain.chain):
+            await self.sync.request_headers(peer)
+
+    def _accept_transaction(self, tx: Transaction) -> bool:
+        """
+        Add a transaction to the pending pool unless it is already known.
+
+        Only transactions the node holds are marked seen, so a rejected
+        transaction sent under a real ID cannot stop the real one.
+        """
+        item = (INV_TX, tx.tx_id)
+        if (
+            tx.tx_id in self.blockchain.stats.processed_tx_ids
+            or self.blockchain.has_pending_transaction(tx.tx_id)
+        ):
+            self.seen.add(item)
+            return False
+        try:
+            self.blockchain.add_pending_transaction(tx)
+        except BlockchainError as e:
+            self.logger.debug(f"[{self.node_id}] Rejected transaction {tx.tx_id[:8]}...: {e}")
+            return False
+        self.seen.add(item)
+        self._notify_accepted(item)
+        return True
+
+    def _accept_block(self, block: Block) -> bool:
+        """
+        Add a block to the chain unless it is known or invalid.
+
+        Only blocks in the chain are marked seen, so an invalid block
+        carrying a real block's hash cannot stop the real one.
+        """
+        item = (INV_BLOCK, block.hash)
+        if self.blockchain.get_block_by_hash(block.hash) is not None:
+            self.seen.add(item)
+            return False
+        try:
+            if not self.blockchain.add_block(block):
+                return False
+        except BlockchainError as e:
+            self.logger.debug(f"[{self.node_id}] Rejected block {block.index}: {e}")
+            return False
+        self.seen.add(item)
+        self.blockchain.remove_confirmed_transactions(block)
+        self._notify_accepted(item)
+        return True
+
+    def _notify_accepted(self, item: InventoryItem) -> None:
+        for listener in self.accept_listeners:
+            try:
+                listener(item)
+            except Exception as e:
+                self.logger.error(f"[{self.node_id}] Accept listener failed: {str(e)}")
+
+    async def _handle_inv(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        wanted = []
+        for item in decode_inventory(payload):
+            self._mark_known(peer, item)
+            if item in self.seen or item in self._requested:
+                continue
+            if item[0] == INV_BLOCK and self.blockchain.get_block_by_hash(item[1]) is not None:
+                self.seen.add(item)
+                continue
+            self._requested.add(item)
+            wanted.append(item)
+        if wanted:
+            await peer.send(MSG_GETDATA, encode_inventory(wanted))
+
+    async def _handle_getdata(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        transactions = []
+        for kind, item_id in decode_inventory(payload):
+            data = self._relay_pool.get((kind, item_id))
+            if data is None and kind == INV_BLOCK:
+                block = self.blockchain.get_block_by_hash(item_id)
+                data = block.to_dict() if block is not None else None
+            if data is None:
+                continue
+            peer.known_inventory.add((kind, item_id))
+            if kind == INV_TX:
+                transactions.append(data)
+            else:
+                await peer.send(MSG_BLOCK, data)
+        if transactions:
+            await peer.send(MSG_TXS, {"transactions": transactions})
+
+    async def _handle_tx(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        await self._receive_transactions(peer, [payload])
+
+    async def _handle_txs(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        await self._receive_transactions(peer, payload.get("transactions", [])[:MAX_INV_ITEMS])
+
+    async def _receive_transactions(self, peer: Peer, batch: List[Dict[str, Any]]) -> None:
+        for data in batch:
+            tx = Transaction.from_dict(data)
+            item = (INV_TX, tx.tx_id)
+            self._mark_known(peer, item)
+            self._requested.discard(item)
+            self.stats["objects"] += 1
+            if item in self.seen:
+                self.stats["duplicates"] += 1
+                continue
+            if self._accept_transaction(tx):
+                await self._announce(item, data, exclude=peer)
+
+    async def _handle_block(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        block = Block.from_dict(payload)
+        item = (INV_BLOCK, block.hash)
+        peer.known_inventory.add(item)
+        self._requested.discard(item)
+        self.stats["objects"] += 1
+        if item in self.seen:
+            self.stats["duplicates"] += 1
+            return
+        if (
+            not block.hash.startswith("0" * self.blockchain.difficulty)
+            or block.calculate_hash() != block.hash
+        ):
+            raise ProtocolError(f"Block {block.index} does not hash to its header")
+        if self.sync.syncing or block.index > len(self.blockchain.chain):
+            # We are missing blocks in between; catch up through the sync
+            peer.height = max(peer.height, block.index + 1)
+            await self.sync.request_headers(peer)
+            return
+        if self._accept_block(block):
+            await self._relay_block(block, exclude=peer)
+
+    async def _handle_cmpctblock(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        compact = CompactBlock.from_dict(payload)
+        header = compact.header
+        item = (INV_BLOCK, header.hash)
+        peer.known_inventory.add(item)
+        self.stats["objects"] += 1
+        if item in self.seen or header.hash in self._partial_blocks:
+            self.stats["duplicates"] += 1
+            return
+        if self.sync.syncing or header.index > len(self.blockchain.chain):
+            peer.height = max(peer.height, header.index + 1)
+            await self.sync.request_headers(peer)
+            return
+        if header.index < len(self.blockchain.chain):
+            return
+
+        # Check proof of work before spending time on the pending pool
+        if (
+            not header.hash.startswith("0" * self.blockchain.difficulty)
+            or header.calculate_hash() != header.hash
+        ):
+            raise ProtocolError(f"Compact block {header.index} has an invalid header")
+
+        transactions = compact.reconstruct(self.blockchain.pending_transactions)
+        missing = [position for position, tx in enumerate(transactions) if tx is None]
+        if not missing:
+            await self._complete_compact_block(peer, compact, transactions)
+            return
+
+        self._partial_blocks[header.hash] = (compact, transactions)
+        while len(self._partial_blocks) > MAX_PARTIAL_BLOCKS:
+            self._partial_blocks.popitem(last=False)
+        await peer.send(MSG_GETBLOCKTXN, {"hash": header.hash, "indexes": missing})
+
+    async def _handle_getblocktxn(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        block = self.blockchain.get_block_by_hash(str(payload.get("hash", "")))
+        if block is None:
+            return
+        transactions = []
+        for position in payload.get("indexes", []):
+            if isinstance(position, int) and 0 <= position < len(block.transactions):
+                transactions.append([position, block.transactions[position].to_dict()])
+        await peer.send(MSG_BLOCKTXN, {"hash": block.hash, "transactions": transactions})
+
+    async def _handle_blocktxn(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        partial = self._partial_blocks.pop(str(payload.get("hash", "")), None)
+        if partial is None:
+            return
+        compact, transactions = partial
+        for position, tx_data in payload.get("transactions", []):
+            if isinstance(position, int) and 0 <= position < len(transactions):
+                transactions[position] = Transaction.from_dict(tx_data)
+        await self._complete_compact_block(peer, compact, transactions)
+
+    async def _complete_compact_block(
+        self,
+        peer: Peer,
+        compact: CompactBlock,
+        transactions: List[Optional[Transaction]]
+    ) -> None:
+        """Accept a rebuilt block, falling back to the full block if it does not match."""
+        block = None
+        if all(tx is not None for tx in transactions):
+            block = compact.to_block(transactions)
+        if block is None or block.calculate_hash() != compact.header.hash:
+            # Missing transactions or a short ID collision; ask for the whole block
+            item = (INV_BLOCK, compact.header.hash)
+            self._requested.add(item)
+            await peer.send(MSG_GETDATA, encode_inventory([item]))
+            return
+        if self._accept_block(block):
+            await self._relay_block(block, exclude=peer)
+
+    async def _handle_reqrecon(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        state = peer.recon
+        if state is None or peer.outbound:
+            return
+        if state.snapshot:
+            # The previous round was never completed; announce its leftovers
+            self._announce_to(peer, state.finish())
+
+        try:
+            salt = bytes.fromhex(str(payload["salt"]))
+            remote_size = int(payload["size"])
+        except (KeyError, ValueError) as e:
+            raise ProtocolError(f"Malformed reconciliation request: {str(e)}")
+
+        snapshot = state.take_snapshot(salt)
+        state.remote_size = remote_size
+        state.started_at = time.monotonic()
+        sketch = IBLT.from_keys(snapshot, state.sketch_cells(len(snapshot), remote_size))
+        await peer.send(MSG_SKETCH, {"size": len(snapshot), "sketch": sketch.to_base64()})
+
+    async def _handle_sketch(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        state = peer.recon
+        if state is None or not state.started_at:
+            return
+        try:
+            remote = IBLT.from_base64(str(payload.get("sketch", "")))
+            remote_size = int(payload.get("size", 0))
+        except (ReconciliationError, ValueError) as e:
+            raise ProtocolError(str(e))
+
+        local_size = len(state.snapshot)
+        local = IBLT.from_keys(state.snapshot, remote.cells)
+        try:
+            ours, theirs = local.subtract(remote).decode()
+        except ReconciliationError:
+            self.stats["reconcile.failures"] += 1
+            state.record_failure()
+            await peer.send(MSG_RECONCILDIFF, {"failed": True})
+            self._announce_to(peer, state.finish())
+            return
+
+        difference = len(ours) + len(theirs)
+        state.update_q(local_size, remote_size, difference)
+        missing = [state.snapshot[key] for key in ours if key in state.snapshot]
+        state.finish()
+        await peer.send(MSG_RECONCILDIFF, {"want": sorted(theirs), "difference": difference})
+        self._announce_to(peer, missing)
+
+    async def _handle_reconcildiff(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        state = peer.recon
+        if state is None or not state.started_at:
+            return
+        if payload.get("failed"):
+            state.record_failure()
+            self._announce_to(peer, state.finish())
+            return
+
+        state.update_q(len(state.snapshot), state.remote_size, int(payload.get("difference", 0)))
+        # Announce rather than push: the initiator may have received some of
+        # these from other peers since it took its snapshot
+        wanted = [
+            state.snapshot[key] for key in payload.get("want", [])[:MAX_INV_ITEMS]
+            if isinstance(key, int) and key in state.snapshot
+        ]
+        state.finish()
+        self._announce_to(peer, wanted)
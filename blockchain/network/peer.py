@@ -0,0 +1,253 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from blockchain.network.inventory import SeenCache, InventoryItem, PEER_KNOWN_SIZE
+from blockchain.network.compression import COMPRESSION_NONE, CompressionStats
+from blockchain.network.protocol import (
+    PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW, encode_message, message_priority, read_message
+)
+from blockchain.network.ratelimit import TokenBucket
+from blockchain.network.reconcile import ReconciliationState
+
+logger = logging.getLogger(__name__)
+
+# Peer connection constants
+PEER_SEND_QUEUE_SIZE = 1024  # Frames buffered per peer before senders wait
+WRITE_BATCH_SIZE = 64  # Queued frames coalesced into one socket write
+PEER_MESSAGE_RATE = 500.0  # Messages per second read from a peer before it is throttled
+PEER_MESSAGE_BURST = 1000.0  # Messages a peer may send at once above the rate
+PEER_BYTE_RATE = 16 * 1024 * 1024.0  # Frame bytes per second read from a peer
+PEER_BYTE_BURST = 32 * 1024 * 1024.0  # Burst allowance in bytes; fits the largest frame
+
+class Peer:
+    """
+    A long-lived stream connection to another node.
+
+    Outbound frames go through a bounded per-peer queue drained by a single
+    writer task, so callers never write to the socket directly. When the
+    queue is full, ``send``/``send_frame`` wait until the writer catches up,
+    which pushes back on whoever is producing messages for a slow peer.
+    The queue has one lane per send priority and the writer always drains
+    the most urgent lane first, so a block is never stuck behind a backlog
+    of transactions; PRIORITY_HIGH frames also skip the queue bound. If an
+    upload bucket is set, the writer waits on it before writing anything
+    but PRIORITY_HIGH frames, which still use up its tokens.
+
+    Inbound messages are metered by per-peer message and byte buckets
+    (PEER_MESSAGE_RATE, PEER_BYTE_RATE); ``receive`` reports how long the
+    caller should pause reading to bring the peer back under its limits.
+
+    Attributes:
+        outbound (bool): Whether this node opened the connection
+        address (Tuple[str, int]): Remote host and port
+        peer_id (Optional[str]): Remote node ID, known after the handshake
+        height (int): Remote chain height reported in the handshake
+        bytes_sent (int): Frame bytes written to the peer
+        bytes_received (int): Frame bytes read from the peer
+        messages_sent (int): Frames written to the peer
+        messages_received (int): Frames read from the peer
+        last_message_size (int): Size in bytes of the last frame read
+        known_inventory (SeenCache): Inventory the peer is known to have,
+            either because it announced it or because it was sent to it
+        inv_queue (List[InventoryItem]): Transaction announcements waiting
+            for the peer's trickle timer
+        inv_timer (Optional[asyncio.TimerHandle]): Pending flush of inv_queue
+        misbehavior (int): Penalty points collected on this connection
+        diverged (bool): Whether the connection was dropped because the
+            peer's chain forked from ours
+        upload_bucket (Optional[TokenBucket]): Upload limit shared with
+            other peers, in bytes
+        recon (Optional[ReconciliationState]): Set reconciliation state if
+            both sides relay transactions by reconciliation
+        compression (str): Codec for frames sent to the peer, chosen in the
+            handshake; received frames are decoded by their own flags
+        compression_stats (Optional[CompressionStats]): Counters that sent
+            and received frames are recorded in
+        shaper (Optional[Any]): Link shaper with a ``transmit(writer, frames)``
+            method that performs writes in place of the peer, e.g. to add
+            latency or limit bandwidth; None writes directly
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        outbound: bool,
+        queue_size: int = PEER_SEND_QUEUE_SIZE
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.outbound = outbound
+        self.address: Tuple[str, int] = writer.get_extra_info("peername") or ("", 0)
+        self.peer_id: Optional[str] = None
+        self.height = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.last_message_size = 0
+        self.known_inventory = SeenCache(max_entries=PEER_KNOWN_SIZE)
+        self.shaper: Optional[Any] = None
+        self.inv_queue: List[InventoryItem] = []
+        self.inv_timer: Optional[asyncio.TimerHandle] = None
+        self.recon: Optional[ReconciliationState] = None
+        self.compression = COMPRESSION_NONE
+        self.compression_stats: Optional[CompressionStats] = None
+        self.misbehavior = 0
+        self.diverged = False
+        self.upload_bucket: Optional[TokenBucket] = None
+        self.message_bucket = TokenBucket(PEER_MESSAGE_RATE, PEER_MESSAGE_BURST)
+        self.byte_bucket = TokenBucket(PEER_BYTE_RATE, PEER_BYTE_BURST)
+        self._lanes: List[Deque[bytes]] = [deque() for _ in range(PRIORITY_LOW + 1)]
+        self._queued = 0
+        self._queue_size = queue_size
+        self._has_frames = asyncio.Event()
+        self._has_space = asyncio.Event()
+        self._has_space.set()
+        self._has_urgent = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def __repr__(self) -> str:
+        direction = "out" if self.outbound else "in"
+        return f"Peer({self.peer_id or '?'}@{self.address[0]}:{self.address[1]}, {direction})"
+
+    @property
+    def closed(self) -> bool:
+        """Whether the connection has been closed or the transport is closing."""
+        return self._closed or self.writer.is_closing()
+
+    @property
+    def pending_frames(self) -> int:
+        """Frames queued but not yet written."""
+        return self._queued
+
+    def start(self) -> None:
+        """Start the writer task that drains the send queue."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.ensure_future(self._write_loop())
+
+    async def send(self, msg_type: str, payload: Dict[str, Any]) -> None:
+        """
+        Queue one message for the peer.
+
+        Args:
+            msg_type (str): Message type
+            payload (Dict[str, Any]): Message body
+
+        Raises:
+            ConnectionError: If the connection is closed
+        """
+        frame = encode_message(msg_type, payload, self.compression, self.compression_stats)
+        await self.send_frame(frame, message_priority(msg_type))
+
+    async def send_frame(self, frame: bytes, priority: int = PRIORITY_NORMAL) -> None:
+        """
+        Queue an already encoded frame, waiting while the queue is full.
+
+        Args:
+            frame (bytes): Encoded frame
+            priority (int): Send priority; PRIORITY_HIGH frames never wait
+
+        Raises:
+            ConnectionError: If the connection is closed
+        """
+        if self.closed:
+            raise ConnectionError(f"Connection to {self} is closed")
+        while priority != PRIORITY_HIGH and self._queued >= self._queue_size:
+            self._has_space.clear()
+            await self._has_space.wait()
+            if self._closed:
+                # Dropped like any frame still queued at close
+                return
+        self._lanes[priority].append(frame)
+        self._queued += 1
+        self._has_frames.set()
+        if priority == PRIORITY_HIGH:
+            self._has_urgent.set()
+
+    async def receive(self) -> Tuple[str, Dict[str, Any], float]:
+        """
+        Read the next message from the peer.
+
+        Returns:
+            Tuple[str, Dict[str, Any], float]: Message type, payload and the
+            seconds to wait before reading on to respect the peer's rate
+            limits, 0 if it is within them
+        """
+        msg_type, payload, size = await read_message(self.reader, self.compression_stats)
+        self.bytes_received += size
+        self.messages_received += 1
+        self.last_message_size = size
+        delay = max(self.message_bucket.reserve(1), self.byte_bucket.reserve(size))
+        return msg_type, payload, delay
+
+    async def _write_loop(self) -> None:
+        """Write queued frames, coalescing whatever is already waiting."""
+        try:
+            while True:
+                await self._has_frames.wait()
+                # Each batch comes from the most urgent non-empty lane
+                priority = next(p for p, lane in enumerate(self._lanes) if lane)
+                if priority != PRIORITY_HIGH and self.upload_bucket is not None:
+                    wait = -self.upload_bucket.tokens / self.upload_bucket.rate
+                    if wait > 0:
+                        # Over the upload limit; only an urgent frame cuts the wait short
+                        try:
+                            await asyncio.wait_for(self._has_urgent.wait(), wait)
+                        except asyncio.TimeoutError:
+                            pass
+                        continue
+
+                lane = self._lanes[priority]
+                frames = [lane.popleft() for _ in range(min(WRITE_BATCH_SIZE, len(lane)))]
+                self._queued -= len(frames)
+                if not self._queued:
+                    self._has_frames.clear()
+                if not self._lanes[PRIORITY_HIGH]:
+                    self._has_urgent.clear()
+                self._has_space.set()
+                if self.upload_bucket is not None:
+                    self.upload_bucket.reserve(sum(len(frame) for frame in frames))
+
+                if self.shaper is not None:
+                    self.shaper.transmit(self.writer, frames)
+                else:
+                    self.writer.writelines(frames)
+                self.bytes_sent += sum(len(frame) for frame in frames)
+                self.messages_sent += len(frames)
+                await self.writer.drain()
+
+        except asyncio.CancelledError:
+            raise
+        except (ConnectionError, OSError) as e:
+            logger.debug(f"Write to {self} failed: {e}")
+            self._closed = True
+            self.writer.close()
+
+    async def close(self) -> None:
+        """Close the connection and release anyone waiting to send."""
+        self._closed = True
+        if self.inv_timer is not None:
+            self.inv_timer.cancel()
+            self.inv_timer = None
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+        # Unblock senders waiting on a full queue; their frames are dropped
+        for lane in self._lanes:
+            lane.clear()
+        self._queued = 0
+        self._has_space.set()
+
+        if not self.writer.is_closing():
+            self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except Exception:
+            pass
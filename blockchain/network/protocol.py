@@ -0,0 +1,159 @@
+import json
+import struct
+import time
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+from blockchain.network.compression import (
+    COMPRESSION_NONE, CompressionError, CompressionStats, compress, decompress
+)
+
+# Wire protocol constants
+PROTOCOL_VERSION = 1  # Version byte carried by every frame
+FRAME_HEADER = struct.Struct(">IBB")  # Payload length, protocol version, flags
+MAX_MESSAGE_SIZE = 32 * 1024 * 1024  # Largest accepted frame payload in bytes
+
+# Message types
+MSG_VERSION = "version"  # Handshake: node ID, protocol version, chain height
+MSG_TX = "tx"  # A single transaction
+MSG_TXS = "txs"  # Several transactions answering one getdata
+MSG_BLOCK = "block"  # A single block
+MSG_GETHEADERS = "getheaders"  # Request block headers after a locator
+MSG_HEADERS = "headers"  # Response to getheaders
+MSG_GETBODIES = "getbodies"  # Request full blocks by hash
+MSG_BODIES = "bodies"  # Response to getbodies
+MSG_CMPCTBLOCK = "cmpctblock"  # New block as header, short IDs and prefilled reward
+MSG_GETBLOCKTXN = "getblocktxn"  # Request transactions missing from a compact block
+MSG_BLOCKTXN = "blocktxn"  # Response to getblocktxn
+MSG_REQRECON = "reqrecon"  # Start a transaction set reconciliation round
+MSG_SKETCH = "sketch"  # Responder's set sketch for a reconciliation round
+MSG_RECONCILDIFF = "reconcildiff"  # Initiator's decoded difference, or failure
+MSG_INV = "inv"  # Announce transaction IDs and block hashes
+MSG_GETDATA = "getdata"  # Request full objects for announced inventory
+
+# Send priorities; lower is sent first
+PRIORITY_HIGH = 0  # New blocks; also exempt from send queue and upload limits
+PRIORITY_NORMAL = 1  # Handshake, announcements, requests and block download
+PRIORITY_LOW = 2  # Transactions and reconciliation
+MESSAGE_PRIORITY = {
+    MSG_CMPCTBLOCK: PRIORITY_HIGH,
+    MSG_GETBLOCKTXN: PRIORITY_HIGH,
+    MSG_BLOCKTXN: PRIORITY_HIGH,
+    MSG_BLOCK: PRIORITY_HIGH,
+    MSG_TX: PRIORITY_LOW,
+    MSG_TXS: PRIORITY_LOW,
+    MSG_REQRECON: PRIORITY_LOW,
+    MSG_SKETCH: PRIORITY_LOW,
+    MSG_RECONCILDIFF: PRIORITY_LOW,
+}  # Message types not listed are PRIORITY_NORMAL
+
+class ProtocolError(Exception):
+    """Raised when a peer sends a malformed or unsupported frame."""
+    pass
+
+def message_priority(msg_type: str) -> int:
+    """Send priority of a message type."""
+    return MESSAGE_PRIORITY.get(msg_type, PRIORITY_NORMAL)
+
+def encode_message(
+    msg_type: str,
+    payload: Dict[str, Any],
+    compression: str = COMPRESSION_NONE,
+    stats: Optional[CompressionStats] = None
+) -> bytes:
+    """
+    Encode a message into a length-prefixed, versioned frame.
+
+    The frame is a FRAME_HEADER (payload length, protocol version, flags)
+    followed by the JSON payload ``{"type": ..., "payload": ...}``. With a
+    compression codec, payloads of at least COMPRESSION_THRESHOLD bytes are
+    compressed and the flags name the codec used.
+
+    Args:
+        msg_type (str): Message type
+        payload (Dict[str, Any]): JSON-serializable message body
+        compression (str): Codec negotiated with the receiver
+        stats (Optional[CompressionStats]): Counters to record the frame in
+
+    Returns:
+        bytes: The encoded frame
+
+    Raises:
+        ProtocolError: If the message is too large to send
+    """
+    body = json.dumps(
+        {"type": msg_type, "payload": payload},
+        separators=(",", ":")
+    ).encode()
+    if len(body) > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Message of {len(body)} bytes exceeds maximum size")
+
+    start = time.process_time()
+    data, flags = compress(body, compression)
+    if stats is not None:
+        stats.record("sent", msg_type, len(body), len(data), time.process_time() - start)
+    return FRAME_HEADER.pack(len(data), PROTOCOL_VERSION, flags) + data
+
+def decode_body(body: bytes) -> Tuple[str, Dict[str, Any]]:
+    """
+    Decode a frame payload into its message type and body.
+
+    Args:
+        body (bytes): Frame payload
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: Message type and payload
+
+    Raises:
+        ProtocolError: If the payload is not a valid message
+    """
+    try:
+        message = json.loads(body)
+        msg_type = message["type"]
+        payload = message.get("payload") or {}
+    except (ValueError, KeyError, TypeError) as e:
+        raise ProtocolError(f"Malformed message: {str(e)}")
+
+    if not isinstance(msg_type, str) or not isinstance(payload, dict):
+        raise ProtocolError("Malformed message: invalid type or payload")
+    return msg_type, payload
+
+async def read_message(
+    reader: asyncio.StreamReader,
+    stats: Optional[CompressionStats] = None
+) -> Tuple[str, Dict[str, Any], int]:
+    """
+    Read one frame from a stream, decompressing it if its flags say so.
+
+    Args:
+        reader (asyncio.StreamReader): Stream to read from
+        stats (Optional[CompressionStats]): Counters to record the frame in
+
+    Returns:
+        Tuple[str, Dict[str, Any], int]: Message type, payload and frame
+        size on the wire
+
+    Raises:
+        ProtocolError: If the frame is malformed, too large, has an
+            unsupported version or cannot be decompressed
+        asyncio.IncompleteReadError: If the stream closes mid-frame
+    """
+    header = await reader.readexactly(FRAME_HEADER.size)
+    length, version, flags = FRAME_HEADER.unpack(header)
+
+    if version != PROTOCOL_VERSION:
+        raise ProtocolError(f"Unsupported protocol version {version}")
+    if length > MAX_MESSAGE_SIZE:
+        raise ProtocolError(f"Frame of {length} bytes exceeds maximum size")
+
+    data = await reader.readexactly(length)
+    start = time.process_time()
+    try:
+        body = decompress(data, flags, MAX_MESSAGE_SIZE)
+    except CompressionError as e:
+        raise ProtocolError(str(e))
+    seconds = time.process_time() - start
+
+    msg_type, payload = decode_body(body)
+    if stats is not None:
+        stats.record("received", msg_type, len(body), length, seconds)
+    return msg_type, payload, FRAME_HEADER.size + length
@@ -0,0 +1,76 @@
+import time
+from typing import Callable
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Tokens accrue at ``rate`` per second up to ``capacity``. ``consume`` takes
+    tokens only if they are available; ``reserve`` always takes them, letting
+    the balance go negative, and says how long the caller should wait for
+    the debt to be paid off. Reserving suits limits shared by several
+    writers: each waits its turn instead of polling.
+
+    Attributes:
+        rate (float): Tokens added per second
+        capacity (float): Largest balance, i.e. the allowed burst
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Create a full bucket.
+
+        Args:
+            rate (float): Tokens added per second; must be positive
+            capacity (float): Largest balance
+            clock (Callable[[], float]): Time source in seconds
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    @property
+    def tokens(self) -> float:
+        """Current balance; negative while reservations are outstanding."""
+        self._refill()
+        return self._tokens
+
+    def consume(self, amount: float = 1.0) -> bool:
+        """
+        Take tokens if the balance covers them.
+
+        Args:
+            amount (float): Tokens to take
+
+        Returns:
+            bool: True if the tokens were taken
+        """
+        self._refill()
+        if self._tokens < amount:
+            return False
+        self._tokens -= amount
+        return True
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Take tokens, going into debt if necessary.
+
+        Args:
+            amount (float): Tokens to take
+
+        Returns:
+            float: Seconds until the balance is back to zero, 0 if it
+            covered the amount
+        """
+        self._refill()
+        self._tokens -= amount
+        return max(0.0, -self._tokens / self.rate)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
@@ -0,0 +1,201 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+from blockchain.core.events import EVENT_BLOCK, Event, EventBus
+
+# Recent block feed constants
+RECENT_BLOCKS = 10  # Blocks kept in the feed
+TAIL_CHUNK_SIZE = 8192  # Bytes read per step when seeking back from the end of the file
+TAIL_RELOAD_BYTES = 1024 * 1024  # Growth beyond which the tail is re-read instead of the appended bytes
+
+logger = logging.getLogger("triadnet.recent_blocks")
+
+def read_tail_lines(path: str, count: int, chunk_size: int = TAIL_CHUNK_SIZE) -> List[bytes]:
+    """
+    Read the last complete lines of a file without reading all of it.
+
+    Seeks back from the end one chunk at a time until enough newlines have
+    been seen, so the cost depends on the size of the last lines, not of
+    the file. A final line without a newline is still being written and is
+    left out.
+
+    Args:
+        path (str): File to read
+        count (int): Number of lines wanted
+        chunk_size (int): Bytes read per step
+
+    Returns:
+        List[bytes]: Up to ``count`` lines, oldest first, without newlines
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(chunk_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    lines = data.split(b"\n")
+    lines.pop()  # Partial line after the last newline, or b"" if there is none
+    if position > 0:
+        lines = lines[1:]  # First line may have started before the data read
+    return [line for line in lines if line.strip()][-count:]
+
+def block_record(block: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert ``Block.to_dict`` output to the record format of blocks.json.
+
+    Args:
+        block (Dict[str, Any]): Block dictionary
+
+    Returns:
+        Dict[str, Any]: hash, nonce, duration, coord, block_time and
+        transactions
+    """
+    coord = block["fractal_coord"]
+    return {
+        "hash": block["hash"],
+        "nonce": block["nonce"],
+        "duration": 0,
+        "coord": (coord["a"], coord["b"], coord["c"]),
+        "block_time": block["timestamp"],
+        "transactions": block["transactions"]
+    }
+
+class RecentBlocks:
+    """
+    The last few blocks, kept in memory for the dashboard.
+
+    Blocks come from a JSON-lines block store or from block events on an
+    EventBus. On cold start the store's tail is read backwards from the
+    end; after that only the bytes appended since the last read are
+    parsed, so serving the feed costs a ``stat`` call rather than a pass
+    over the file. Every change bumps ``version``, which keys the ETag and
+    the rendered-page cache.
+
+    Attributes:
+        capacity (int): Number of blocks kept
+        path (Optional[str]): Block store followed by ``refresh``
+        version (int): Incremented whenever the feed changes
+    """
+
+    def __init__(self, capacity: int = RECENT_BLOCKS, path: Optional[str] = None):
+        self.capacity = capacity
+        self.path = path
+        self.version = 0
+
+        self._blocks: deque = deque(maxlen=capacity)
+        self._lock = threading.RLock()
+        self._epoch = f"{time.time_ns():x}"
+        self._offset = 0
+        self._identity: Optional[tuple] = None
+        self._cache_version = -1
+        self._cache: Any = None
+
+    @property
+    def etag(self) -> str:
+        """Entity tag for the current contents, unique across restarts."""
+        return f"{self._epoch}-{self.version}"
+
+    def blocks(self) -> List[Dict[str, Any]]:
+        """Blocks in the feed, oldest first."""
+        with self._lock:
+            return list(self._blocks)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Add a block record, evicting the oldest when full."""
+        with self._lock:
+            self._blocks.append(record)
+            self.version += 1
+
+    def attach(self, events: EventBus) -> int:
+        """
+        Feed the buffer from block events.
+
+        Args:
+            events (EventBus): Bus to follow, normally ``Blockchain.events``
+
+        Returns:
+            int: Subscription ID
+        """
+        def on_block(event: Event) -> None:
+            self.append(block_record(event.data))
+        return events.subscribe(on_block, kinds=[EVENT_BLOCK])
+
+    def refresh(self) -> None:
+        """
+        Pick up blocks appended to the block store since the last call.
+
+        Reads the tail on first use, when the file was replaced or truncated,
+        or when it grew by more than TAIL_RELOAD_BYTES; otherwise reads only
+        the new bytes. A missing store leaves the feed as it is.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return
+            identity = (stat.st_dev, stat.st_ino)
+            if identity != self._identity or stat.st_size < self._offset \
+                    or stat.st_size - self._offset > TAIL_RELOAD_BYTES:
+                self._load_tail(identity, stat.st_size)
+            elif stat.st_size > self._offset:
+                self._read_appended()
+
+    def render(self, renderer: Callable[[List[Dict[str, Any]]], Any]) -> Any:
+        """
+        Render the feed, reusing the last result while nothing has changed.
+
+        Args:
+            renderer (Callable): Builds the response body from the blocks
+
+        Returns:
+            Any: Rendered body
+        """
+        with self._lock:
+            if self._cache_version != self.version:
+                self._cache = renderer(list(self._blocks))
+                self._cache_version = self.version
+            return self._cache
+
+    def _load_tail(self, identity: tuple, size: int) -> None:
+        lines = read_tail_lines(self.path, self.capacity)
+        self._blocks.clear()
+        self._add_lines(lines)
+        self._identity = identity
+        self._offset = size
+        # Leave a trailing partial line to be read once it is complete
+        with open(self.path, "rb") as f:
+            f.seek(max(0, size - TAIL_CHUNK_SIZE))
+            tail = f.read(size - f.tell())
+        if tail and not tail.endswith(b"\n"):
+            self._offset -= len(tail) - (tail.rfind(b"\n") + 1)
+        self.version += 1
+
+    def _read_appended(self) -> None:
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return
+        self._offset += end
+        self._add_lines(data[:end].split(b"\n"))
+        self.version += 1
+
+    def _add_lines(self, lines: List[bytes]) -> None:
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                self._blocks.append(json.loads(line))
+            except ValueError:
+                logger.warning("Skipping malformed line in block store")
@@ -0,0 +1,238 @@
+import base64
+import hashlib
+import math
+import struct
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Reconciliation constants
+RELAY_FLOOD = "flood"  # Announce every transaction to every peer
+RELAY_RECONCILE = "reconcile"  # Periodically reconcile transaction sets with peers
+HASH_COUNT = 3  # Cells each key is added to
+CELL = struct.Struct(">iQI")  # Count, XOR of keys, XOR of key checksums
+MIN_SKETCH_CELLS = 12  # Smallest sketch sent, so tiny differences still decode
+SKETCH_OVERHEAD = 1.5  # Cells per expected differing element
+MAX_SKETCH_CELLS = 30000  # Largest sketch accepted from a peer
+DEFAULT_Q = 0.25  # Initial share of the smaller set expected to differ
+RECONCILE_INTERVAL = 0.25  # Seconds between reconciliations with each outbound peer
+RECONCILE_FLOOD_FANOUT = 2  # Outbound reconciling peers a new transaction is still flooded to
+RECONCILE_TIMEOUT = 5.0  # Seconds before an unanswered reconciliation is abandoned
+
+class ReconciliationError(Exception):
+    """Raised when a sketch cannot be decoded or is malformed."""
+    pass
+
+def short_key(tx_id: str, salt: bytes) -> int:
+    """
+    Map a transaction ID to a salted 64-bit key.
+
+    Args:
+        tx_id (str): Full transaction ID
+        salt (bytes): Per-reconciliation salt
+
+    Returns:
+        int: 64-bit key
+    """
+    digest = hashlib.blake2b(tx_id.encode(), key=salt, digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+def _cell_positions(key: int, cells_per_part: int) -> Tuple[List[int], int]:
+    digest = hashlib.blake2b(key.to_bytes(8, "big"), digest_size=16).digest()
+    words = struct.unpack(">IIII", digest)
+    positions = [part * cells_per_part + words[part] % cells_per_part for part in range(HASH_COUNT)]
+    return positions, words[HASH_COUNT]
+
+class IBLT:
+    """
+    Invertible Bloom lookup table over 64-bit keys.
+
+    A sketch of a set uses a fixed number of cells no matter how large the
+    set is. Subtracting two sketches with the same size cancels the keys the
+    sets share, and the result can be decoded into the symmetric difference
+    as long as it is not much larger than the number of cells. The cells are
+    split into HASH_COUNT parts and every key lands in one cell per part.
+
+    Attributes:
+        cells (int): Number of cells, a multiple of HASH_COUNT
+    """
+
+    def __init__(self, cells: int):
+        """
+        Create an empty sketch.
+
+        Args:
+            cells (int): Minimum number of cells; rounded up to a multiple
+                of HASH_COUNT
+        """
+        self.cells = max(HASH_COUNT, math.ceil(cells / HASH_COUNT) * HASH_COUNT)
+        self._part = self.cells // HASH_COUNT
+        self.counts = [0] * self.cells
+        self.key_sums = [0] * self.cells
+        self.check_sums = [0] * self.cells
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[int], cells: int) -> 'IBLT':
+        sketch = cls(cells)
+        for key in keys:
+            sketch.insert(key)
+        return sketch
+
+    def insert(self, key: int, sign: int = 1) -> None:
+        positions, check = _cell_positions(key, self._part)
+        for position in positions:
+            self.counts[position] += sign
+            self.key_sums[position] ^= key
+            self.check_sums[position] ^= check
+
+    def subtract(self, other: 'IBLT') -> 'IBLT':
+        """
+        Compute the sketch of the difference between two sets.
+
+        Args:
+            other (IBLT): Sketch with the same number of cells
+
+        Returns:
+            IBLT: Sketch whose positive keys are only in self and negative
+            keys only in other
+
+        Raises:
+            ReconciliationError: If the sketches have different sizes
+        """
+        if other.cells != self.cells:
+            raise ReconciliationError(f"Sketch sizes differ: {self.cells} vs {other.cells}")
+        result = IBLT(self.cells)
+        for i in range(self.cells):
+            result.counts[i] = self.counts[i] - other.counts[i]
+            result.key_sums[i] = self.key_sums[i] ^ other.key_sums[i]
+            result.check_sums[i] = self.check_sums[i] ^ other.check_sums[i]
+        return result
+
+    def decode(self) -> Tuple[Set[int], Set[int]]:
+        """
+        Recover the keys of a difference sketch by peeling pure cells.
+
+        Returns:
+            Tuple[Set[int], Set[int]]: Keys with positive and with negative count
+
+        Raises:
+            ReconciliationError: If the difference is too large to decode
+        """
+        counts = list(self.counts)
+        key_sums = list(self.key_sums)
+        check_sums = list(self.check_sums)
+        positive: Set[int] = set()
+        negative: Set[int] = set()
+
+        queue = list(range(self.cells))
+        while queue:
+            i = queue.pop()
+            if counts[i] not in (1, -1):
+                continue
+            key = key_sums[i]
+            positions, check = _cell_positions(key, self._part)
+            if check != check_sums[i] or i not in positions:
+                continue
+
+            sign = counts[i]
+            (positive if sign == 1 else negative).add(key)
+            for position in positions:
+                counts[position] -= sign
+                key_sums[position] ^= key
+                check_sums[position] ^= check
+                queue.append(position)
+
+        if any(counts) or any(key_sums) or any(check_sums):
+            raise ReconciliationError("Sketch difference too large to decode")
+        return positive, negative
+
+    def to_base64(self) -> str:
+        data = b"".join(
+            CELL.pack(count, key, check)
+            for count, key, check in zip(self.counts, self.key_sums, self.check_sums)
+        )
+        return base64.b64encode(data).decode()
+
+    @classmethod
+    def from_base64(cls, data: str) -> 'IBLT':
+        """
+        Load a sketch received from a peer.
+
+        Raises:
+            ReconciliationError: If the data is malformed or too large
+        """
+        try:
+            raw = base64.b64decode(data, validate=True)
+        except (ValueError, TypeError) as e:
+            raise ReconciliationError(f"Malformed sketch: {str(e)}")
+        cells = len(raw) // CELL.size
+        if len(raw) % CELL.size or cells % HASH_COUNT or not 0 < cells <= MAX_SKETCH_CELLS:
+            raise ReconciliationError(f"Malformed sketch of {len(raw)} bytes")
+
+        sketch = cls(cells)
+        for i, (count, key, check) in enumerate(CELL.iter_unpack(raw)):
+            sketch.counts[i] = count
+            sketch.key_sums[i] = key
+            sketch.check_sums[i] = check
+        return sketch
+
+class ReconciliationState:
+    """
+    Per-peer transaction reconciliation state.
+
+    Transactions this node would have announced to the peer collect in
+    ``pending``. At each reconciliation the pending set is frozen into a
+    snapshot keyed by salted short keys, and the sketch size is chosen from
+    both set sizes and ``q``, the share of the smaller set that differed in
+    past rounds.
+
+    Attributes:
+        pending (Set[str]): Transaction IDs not yet reconciled with the peer
+        snapshot (Dict[int, str]): Short key to transaction ID for the round
+            in progress
+        q (float): Learned difference factor
+        remote_size (int): Peer's set size in the round in progress
+        started_at (float): When the round in progress began, 0 if idle
+    """
+
+    def __init__(self, q: float = DEFAULT_Q):
+        self.pending: Set[str] = set()
+        self.snapshot: Dict[int, str] = {}
+        self.q = q
+        self.remote_size = 0
+        self.started_at = 0.0
+
+    def take_snapshot(self, salt: bytes) -> Dict[int, str]:
+        """
+        Freeze the pending set for a reconciliation round.
+
+        Args:
+            salt (bytes): Salt for the round's short keys
+
+        Returns:
+            Dict[int, str]: Short key to transaction ID
+        """
+        self.snapshot = {short_key(tx_id, salt): tx_id for tx_id in self.pending}
+        self.pending = set()
+        return self.snapshot
+
+    def finish(self) -> List[str]:
+        """End the round, returning the snapshot's transaction IDs."""
+        tx_ids = list(self.snapshot.values())
+        self.snapshot = {}
+        self.started_at = 0.0
+        return tx_ids
+
+    def sketch_cells(self, local_size: int, remote_size: int) -> int:
+        """Number of sketch cells for the expected difference."""
+        expected = abs(local_size - remote_size) + self.q * min(local_size, remote_size)
+        return min(MAX_SKETCH_CELLS, MIN_SKETCH_CELLS + math.ceil(SKETCH_OVERHEAD * expected))
+
+    def update_q(self, local_size: int, remote_size: int, difference: int) -> None:
+        """Blend the difference observed in a successful round into q."""
+        smaller = min(local_size, remote_size)
+        if smaller:
+            observed = (difference - abs(local_size - remote_size)) / smaller
+            self.q = min(1.0, max(0.0, (self.q + observed) / 2))
+
+    def record_failure(self) -> None:
+        """Grow q after a sketch failed to decode."""
+        self.q = min(1.0, self.q * 2 + 0.1)
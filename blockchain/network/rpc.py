@@ -0,0 +1,394 @@
+import asyncio
+import inspect
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from blockchain.core.blockchain import Blockchain, MAX_PENDING_TRANSACTIONS
+from blockchain.core.transaction import Transaction, TransactionError
+from blockchain.profiling import ProfilingError
+
+# JSON-RPC constants
+JSONRPC_VERSION = "2.0"  # Protocol version carried by every request and response
+MAX_BATCH_SIZE = 100  # Requests accepted in one batch
+MAX_REQUEST_SIZE = 1024 * 1024  # Largest accepted HTTP request body in bytes
+MAX_HEADER_LINES = 100  # HTTP header lines accepted per request
+RPC_WORKERS = 4  # Threads running read-only calls
+REQUEST_READ_TIMEOUT = 30.0  # Seconds an idle keep-alive connection is kept open
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700  # Body is not valid JSON
+INVALID_REQUEST = -32600  # Not a valid request object
+METHOD_NOT_FOUND = -32601  # No such method
+INVALID_PARAMS = -32602  # Parameters do not match the method
+INTERNAL_ERROR = -32603  # Unexpected failure inside a method
+TRANSACTION_REJECTED = -32000  # sendTransaction was refused by the pool
+MINER_UNAVAILABLE = -32001  # getMiningStatus without a miner attached
+PROFILER_ERROR = -32002  # Profiler already running, not running or misconfigured
+
+# Profiler modes
+PROFILE_SAMPLE = "sample"  # Stack sampler writing collapsed stacks
+PROFILE_CPROFILE = "cprofile"  # Scoped cProfile session writing pstats files
+
+class RPCError(Exception):
+    """Raised by RPC methods to return a JSON-RPC error to the caller."""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        error = {"code": self.code, "message": self.message}
+        if self.data is not None:
+            error["data"] = self.data
+        return error
+
+RPCMethod = Callable[..., Any]
+
+class RPCServer:
+    """
+    JSON-RPC 2.0 node API served over HTTP on an asyncio event loop.
+
+    Requests are POSTed as a single JSON-RPC object or a batch (a list of up
+    to MAX_BATCH_SIZE objects) and answered with one HTTP response.
+    Connections are kept alive between requests. Calls in a batch run
+    concurrently; read-only methods run on a small thread pool so slow
+    queries such as ``getBalance``, which scans the chain, neither block the
+    event loop nor wait on each other. Methods that change state run on the
+    event loop itself. The mining thread is never waited on; its status is
+    only read.
+
+    Methods:
+
+    - ``getBalance(address)``: confirmed balance of an address
+    - ``getBlock(block_id)``: block by hash or height as a dict, or null if
+      unknown
+    - ``getTransaction(tx_id)``: transaction with its block height and
+      confirmations (height null while pending), or null if unknown
+    - ``sendTransaction(transaction)``: add a transaction dict to the
+      pending pool (and relay it if a node is attached); returns its ID
+    - ``getMempoolInfo()``: pending pool size, capacity and total amount
+    - ``getMiningStatus()``: ``Miner.get_status()``
+
+    With a Profiler attached, also:
+
+    - ``startProfiler(mode, subsystems)``: start the stack sampler
+      (``"sample"``) or a cProfile session (``"cprofile"``) around the given
+      subsystems (all by default)
+    - ``stopProfiler(mode)``: stop it and return the files written
+
+    Attributes:
+        blockchain (Blockchain): Chain and pending pool the API serves
+        miner (Optional[Miner]): Miner whose status is reported
+        node (Optional[Node]): Node used to relay sent transactions
+        profiler (Optional[Profiler]): Profiler controlled over RPC
+        host (str): Listen host
+        port (int): Listen port (updated after start if 0 was given)
+    """
+
+    def __init__(
+        self,
+        blockchain: Blockchain,
+        miner: Optional[Any] = None,
+        node: Optional[Any] = None,
+        host: str = "127.0.0.1",
+        port: int = 8545,
+        workers: int = RPC_WORKERS,
+        profiler: Optional[Any] = None
+    ):
+        self.blockchain = blockchain
+        self.miner = miner
+        self.node = node
+        self.profiler = profiler
+        self.host = host
+        self.port = port
+        self.logger = logging.getLogger("triadnet.rpc")
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rpc")
+        self._methods: Dict[str, Tuple[RPCMethod, bool]] = {}
+        self.register("getBalance", self.get_balance)
+        self.register("getBlock", self.get_block)
+        self.register("getTransaction", self.get_transaction)
+        self.register("getMempoolInfo", self.get_mempool_info)
+        self.register("getMiningStatus", self.get_mining_status)
+        self.register("sendTransaction", self.send_transaction, read_only=False)
+        if profiler is not None:
+            self.register("startProfiler", self.start_profiler, read_only=False)
+            self.register("stopProfiler", self.stop_profiler, read_only=False)
+
+    def register(self, name: str, method: RPCMethod, read_only: bool = True) -> None:
+        """
+        Expose a method over RPC.
+
+        Args:
+            name (str): RPC method name
+            method (RPCMethod): Callable taking the request's params; async
+                if ``read_only`` is False
+            read_only (bool): Whether the method only reads state and may
+                run on the worker threads
+        """
+        self._methods[name] = (method, read_only)
+
+    async def start(self) -> None:
+        """Start listening for HTTP requests."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.logger.info(f"RPC listening on {self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """Stop listening and shut down the worker threads."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+    async def handle_request(self, body: Union[str, bytes]) -> Optional[str]:
+        """
+        Answer a raw JSON-RPC request or batch.
+
+        Args:
+            body (Union[str, bytes]): Request body
+
+        Returns:
+            Optional[str]: Response body, or None if every request was a
+            notification
+        """
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            return json.dumps(self._error(None, RPCError(PARSE_ERROR, f"Parse error: {str(e)}")))
+
+        if not isinstance(request, list):
+            response = await self._call(request)
+            return None if response is None else json.dumps(response)
+
+        if not request or len(request) > MAX_BATCH_SIZE:
+            return json.dumps(self._error(None, RPCError(
+                INVALID_REQUEST, f"Batch must hold 1 to {MAX_BATCH_SIZE} requests"
+            )))
+        responses = await asyncio.gather(*(self._call(item) for item in request))
+        responses = [response for response in responses if response is not None]
+        return json.dumps(responses) if responses else None
+
+    async def _call(self, request: Any) -> Optional[Dict[str, Any]]:
+        """Run one request object, returning its response (None for notifications)."""
+        if not isinstance(request, dict) or request.get("jsonrpc") != JSONRPC_VERSION \
+                or not isinstance(request.get("method"), str):
+            return self._error(None, RPCError(INVALID_REQUEST, "Invalid request"))
+
+        request_id = request.get("id")
+        notification = "id" not in request
+        try:
+            result = await self._dispatch(request["method"], request.get("params", []))
+        except RPCError as e:
+            return None if notification else self._error(request_id, e)
+        except Exception as e:
+            self.logger.error(f"RPC method {request['method']} failed: {str(e)}")
+            return None if notification else self._error(request_id, RPCError(INTERNAL_ERROR, "Internal error"))
+
+        if notification:
+            return None
+        return {"jsonrpc": JSONRPC_VERSION, "result": result, "id": request_id}
+
+    async def _dispatch(self, name: str, params: Any) -> Any:
+        entry = self._methods.get(name)
+        if entry is None:
+            raise RPCError(METHOD_NOT_FOUND, f"Method not found: {name}")
+        method, read_only = entry
+
+        if isinstance(params, list):
+            args, kwargs = params, {}
+        elif isinstance(params, dict):
+            args, kwargs = [], params
+        else:
+            raise RPCError(INVALID_PARAMS, "Params must be an array or an object")
+        try:
+            inspect.signature(method).bind(*args, **kwargs)
+        except TypeError as e:
+            raise RPCError(INVALID_PARAMS, f"Invalid params: {str(e)}")
+
+        if read_only:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._executor, lambda: method(*args, **kwargs))
+        return await method(*args, **kwargs)
+
+    @staticmethod
+    def _error(request_id: Any, error: RPCError) -> Dict[str, Any]:
+        return {"jsonrpc": JSONRPC_VERSION, "error": error.to_dict(), "id": request_id}
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve HTTP requests on one connection until it closes."""
+        try:
+            while True:
+                request = await asyncio.wait_for(self._read_http_request(reader), REQUEST_READ_TIMEOUT)
+                if request is None:
+                    break
+                method, headers, body = request
+
+                if method != "POST":
+                    status, response = "405 Method Not Allowed", None
+                elif body is None:
+                    status, response = "413 Payload Too Large", None
+                else:
+                    response = await self.handle_request(body)
+                    status = "200 OK" if response is not None else "204 No Content"
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_http_response(writer, status, response, keep_alive)
+                await writer.drain()
+                if not keep_alive or status.startswith("413"):
+                    break
+
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_http_request(
+        reader: asyncio.StreamReader
+    ) -> Optional[Tuple[str, Dict[str, str], Optional[bytes]]]:
+        """
+        Read one HTTP request.
+
+        Returns:
+            Optional[Tuple[str, Dict[str, str], Optional[bytes]]]: Method,
+            lower-cased headers and body (None if it exceeds
+            MAX_REQUEST_SIZE), or None at end of stream
+
+        Raises:
+            ValueError: If the request is malformed
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3:
+            raise ValueError("Malformed request line")
+
+        headers: Dict[str, str] = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise ValueError("Too many header lines")
+
+        length = int(headers.get("content-length", "0"))
+        if length > MAX_REQUEST_SIZE:
+            return parts[0], headers, None
+        body = await reader.readexactly(length) if length else b""
+        return parts[0], headers, body
+
+    @staticmethod
+    def _write_http_response(
+        writer: asyncio.StreamWriter,
+        status: str,
+        body: Optional[str],
+        keep_alive: bool
+    ) -> None:
+        data = body.encode() if body is not None else b""
+        head = [
+            f"HTTP/1.1 {status}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(data)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + data)
+
+    # RPC methods
+
+    def get_balance(self, address: str) -> float:
+        try:
+            return self.blockchain.get_balance(address)
+        except ValueError as e:
+            raise RPCError(INVALID_PARAMS, str(e))
+
+    def get_block(self, block_id: Union[str, int]) -> Optional[Dict[str, Any]]:
+        if isinstance(block_id, bool) or not isinstance(block_id, (str, int)):
+            raise RPCError(INVALID_PARAMS, "Block ID must be a hash or a height")
+        if isinstance(block_id, int):
+            chain = self.blockchain.chain
+            block = chain[block_id] if 0 <= block_id < len(chain) else None
+        else:
+            block = self.blockchain.get_block_by_hash(block_id)
+        return block.to_dict() if block is not None else None
+
+    def get_transaction(self, tx_id: str) -> Optional[Dict[str, Any]]:
+        found = self.blockchain.find_transaction(str(tx_id))
+        if found is None:
+            return None
+        tx, height = found
+        return {
+            "transaction": tx.to_dict(),
+            "block_height": height,
+            "confirmations": 0 if height is None else len(self.blockchain.chain) - height
+        }
+
+    def get_mempool_info(self) -> Dict[str, Any]:
+        pending = list(self.blockchain.pending_transactions)
+        return {
+            "size": len(pending),
+            "max_size": MAX_PENDING_TRANSACTIONS,
+            "usage": len(pending) / MAX_PENDING_TRANSACTIONS,
+            "total_amount": sum(tx.amount for tx in pending)
+        }
+
+    def get_mining_status(self) -> Dict[str, Any]:
+        if self.miner is None:
+            raise RPCError(MINER_UNAVAILABLE, "No miner is attached to this node")
+        return self.miner.get_status()
+
+    async def send_transaction(self, transaction: Dict[str, Any]) -> str:
+        if not isinstance(transaction, dict):
+            raise RPCError(INVALID_PARAMS, "Transaction must be an object")
+        try:
+            tx = Transaction.from_dict(transaction)
+        except TransactionError as e:
+            raise RPCError(INVALID_PARAMS, str(e))
+
+        if self.node is not None:
+            if not await self.node.submit_transaction(tx):
+                raise RPCError(TRANSACTION_REJECTED, "Transaction is a duplicate or was rejected")
+            return tx.tx_id
+        if self.blockchain.has_pending_transaction(tx.tx_id):
+            raise RPCError(TRANSACTION_REJECTED, "Transaction is already pending")
+        try:
+            if self.miner is not None:
+                self.miner.add_transaction(tx)
+            else:
+                self.blockchain.add_pending_transaction(tx)
+        except Exception as e:
+            raise RPCError(TRANSACTION_REJECTED, str(e))
+        return tx.tx_id
+
+    async def start_profiler(self, mode: str = PROFILE_SAMPLE, subsystems: Optional[List[str]] = None) -> bool:
+        try:
+            if mode == PROFILE_SAMPLE:
+                self.profiler.start_sampling()
+            elif mode == PROFILE_CPROFILE:
+                self.profiler.start_profiling(subsystems)
+            else:
+                raise RPCError(INVALID_PARAMS, f"Unknown profiler mode {mode}")
+        except ProfilingError as e:
+            raise RPCError(PROFILER_ERROR, str(e))
+        return True
+
+    async def stop_profiler(self, mode: str = PROFILE_SAMPLE) -> List[str]:
+        try:
+            if mode == PROFILE_SAMPLE:
+                return [self.profiler.stop_sampling()]
+            if mode == PROFILE_CPROFILE:
+                return self.profiler.stop_profiling()
+        except ProfilingError as e:
+            raise RPCError(PROFILER_ERROR, str(e))
+        raise RPCError(INVALID_PARAMS, f"Unknown profiler mode {mode}")
@@ -0,0 +1,497 @@
+"""
+Local multi-node network simulator.
+
+Runs N ``Node`` instances in one process on loopback, wired into a chosen
+topology, with optional per-link latency, jitter and bandwidth limits. It
+injects transactions and blocks and reports propagation percentiles,
+duplicate-message ratio and traffic per node. No external network is used,
+so it runs anywhere the test suite runs::
+
+    python -m blockchain.network.simulator --nodes 20 --topology random \\
+        --degree 4 --latency 0.02 --bandwidth 1000000 --transactions 500
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+from blockchain.core.block import Block
+from blockchain.core.blockchain import Blockchain, BLOCK_REWARD, MAX_TRANSACTIONS_PER_BLOCK
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.core.transaction import Transaction
+from blockchain.network.inventory import InventoryItem, INV_TX, INV_BLOCK
+from blockchain.network.node import Node
+from blockchain.network.reconcile import RELAY_FLOOD, RELAY_RECONCILE
+
+# Simulator constants
+TOPOLOGIES = ("line", "ring", "star", "random", "full")  # Supported topology names
+CONNECT_TIMEOUT = 10.0  # Seconds to wait for all links to complete the handshake
+POLL_INTERVAL = 0.005  # Seconds between delivery checks
+
+class SimulationError(Exception):
+    """Raised when the simulated network cannot be set up."""
+    pass
+
+@dataclass
+class SimulationConfig:
+    """
+    Parameters of a simulation run.
+
+    Attributes:
+        nodes (int): Number of nodes
+        topology (str): One of TOPOLOGIES
+        degree (int): Average links per node for the random topology
+        latency (float): One-way link latency in seconds
+        jitter (float): Maximum extra random latency in seconds
+        bandwidth (float): Link bandwidth in bytes per second, 0 for unlimited
+        transactions (int): Transactions injected at random nodes
+        tx_rate (float): Transactions injected per second
+        blocks (int): Blocks mined at random nodes after the transactions
+        difficulty (int): Mining difficulty of every node's chain
+        seed (int): Random seed for topology, origins and jitter
+        timeout (float): Seconds to wait for each delivery phase
+        relay (str): Transaction relay mode of every node, RELAY_FLOOD or
+            RELAY_RECONCILE
+    """
+
+    nodes: int = 10
+    topology: str = "random"
+    degree: int = 4
+    latency: float = 0.0
+    jitter: float = 0.0
+    bandwidth: float = 0.0
+    transactions: int = 100
+    tx_rate: float = 500.0
+    blocks: int = 2
+    difficulty: int = 1
+    seed: int = 1
+    timeout: float = 30.0
+    relay: str = RELAY_FLOOD
+
+@dataclass
+class SimulationReport:
+    """
+    Results of a simulation run; times are in seconds.
+
+    Attributes:
+        nodes (int): Number of nodes
+        links (int): Number of links
+        tx_p50 (float): Median transaction propagation time
+        tx_p99 (float): 99th percentile transaction propagation time
+        block_p50 (float): Median block propagation time
+        block_p99 (float): 99th percentile block propagation time
+        coverage (float): Fraction of (item, node) deliveries that happened
+        duplicate_ratio (float): Full objects received that were already
+            known, as a fraction of all full objects received
+        bytes_sent_per_node (float): Mean frame bytes written per node
+        bytes_received_per_node (float): Mean frame bytes read per node
+        messages_per_node (float): Mean frames read per node
+        elapsed (float): Wall-clock duration of the run
+    """
+
+    nodes: int
+    links: int
+    tx_p50: float
+    tx_p99: float
+    block_p50: float
+    block_p99: float
+    coverage: float
+    duplicate_ratio: float
+    bytes_sent_per_node: float
+    bytes_received_per_node: float
+    messages_per_node: float
+    elapsed: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values (List[float]): Samples
+        q (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile, or 0.0 without samples
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def build_topology(
+    name: str,
+    count: int,
+    degree: int = 4,
+    rng: Optional[random.Random] = None
+) -> List[Tuple[int, int]]:
+    """
+    Build the links of a topology as (dialed node, dialing node) pairs.
+
+    The random topology starts from a random spanning tree, so it is always
+    connected, then adds random links until the average degree is reached.
+
+    Args:
+        name (str): One of TOPOLOGIES
+        count (int): Number of nodes
+        degree (int): Average links per node for the random topology
+        rng (Optional[random.Random]): Random source for the random topology
+
+    Returns:
+        List[Tuple[int, int]]: Links with the lower node index first
+
+    Raises:
+        SimulationError: If the topology name is unknown
+    """
+    if name == "line":
+        edges = {(i, i + 1) for i in range(count - 1)}
+    elif name == "ring":
+        edges = {(i, i + 1) for i in range(count - 1)}
+        if count > 2:
+            edges.add((0, count - 1))
+    elif name == "star":
+        edges = {(0, i) for i in range(1, count)}
+    elif name == "full":
+        edges = {(i, j) for i in range(count) for j in range(i + 1, count)}
+    elif name == "random":
+        rng = rng or random.Random()
+        order = list(range(count))
+        rng.shuffle(order)
+        edges: Set[Tuple[int, int]] = set()
+        for position in range(1, count):
+            a, b = order[position], order[rng.randrange(position)]
+            edges.add((min(a, b), max(a, b)))
+        target = min(count * degree // 2, count * (count - 1) // 2)
+        while len(edges) < target:
+            a, b = rng.sample(range(count), 2)
+            edges.add((min(a, b), max(a, b)))
+    else:
+        raise SimulationError(f"Unknown topology {name}; expected one of {', '.join(TOPOLOGIES)}")
+    return sorted(edges)
+
+class LinkShaper:
+    """
+    Delays and rate-limits one direction of a link.
+
+    Writes are serialized at the link bandwidth and delivered after the link
+    latency plus random jitter, without holding back later writes, so a link
+    keeps several batches in flight like a real network path. Delivery order
+    is preserved.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: float = 0.0,
+        jitter: float = 0.0,
+        rng: Optional[random.Random] = None
+    ):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._busy_until = 0.0
+        self._last_delivery = 0.0
+
+    def transmit(self, writer: asyncio.StreamWriter, frames: List[bytes]) -> None:
+        loop = asyncio.get_event_loop()
+        now = loop.time()
+        size = sum(len(frame) for frame in frames)
+
+        start = max(now, self._busy_until)
+        self._busy_until = start + (size / self.bandwidth if self.bandwidth else 0.0)
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        delivery = max(self._busy_until + delay, self._last_delivery)
+        self._last_delivery = delivery
+
+        if delivery <= now:
+            writer.writelines(frames)
+        else:
+            loop.call_at(delivery, self._deliver, writer, frames)
+
+    @staticmethod
+    def _deliver(writer: asyncio.StreamWriter, frames: List[bytes]) -> None:
+        if not writer.is_closing():
+            writer.writelines(frames)
+
+def mine_block(blockchain: Blockchain, miner: str, transactions: List[Transaction]) -> Block:
+    """
+    Mine a block on top of a chain with a plain nonce search.
+
+    Args:
+        blockchain (Blockchain): Chain to extend
+        miner (str): Miner address receiving the reward
+        transactions (List[Transaction]): Transactions to include
+
+    Returns:
+        Block: A block meeting the chain's difficulty
+    """
+    block = Block(
+        index=len(blockchain.chain),
+        timestamp=time.time(),
+        transactions=[],
+        miner=miner,
+        fractal_coord=FractalCoordinate(100, 100, 100),
+        previous_hash=blockchain.last_block.hash
+    )
+    block.transactions.append(
+        Transaction("network", miner, BLOCK_REWARD, timestamp=block.timestamp)
+    )
+    block.transactions.extend(transactions)
+
+    target = "0" * blockchain.difficulty
+    merkle_root = block.merkle_root()
+    while True:
+        block.hash = block.calculate_hash(merkle_root)
+        if block.hash.startswith(target):
+            return block
+        block.nonce += 1
+
+class NetworkSimulator:
+    """
+    Runs a simulated network and collects propagation statistics.
+
+    Attributes:
+        config (SimulationConfig): Run parameters
+        nodes (List[Node]): Simulated nodes, after ``start``
+        edges (List[Tuple[int, int]]): Links between node indexes
+    """
+
+    def __init__(self, config: SimulationConfig):
+        self.config = config
+        self.nodes: List[Node] = []
+        self.edges: List[Tuple[int, int]] = []
+        self._rng = random.Random(config.seed)
+        self._origins: Dict[InventoryItem, Tuple[int, float]] = {}
+        self._arrivals: Dict[InventoryItem, Dict[int, float]] = {}
+        self._started_at = 0.0
+
+    async def start(self) -> None:
+        """
+        Start every node and wait until all links are connected.
+
+        Raises:
+            SimulationError: If the links do not come up in time
+        """
+        config = self.config
+        self._started_at = time.monotonic()
+        self.edges = build_topology(config.topology, config.nodes, config.degree, self._rng)
+
+        for index in range(config.nodes):
+            node = Node(
+                f"sim{index}", Blockchain(difficulty=config.difficulty),
+                port=0, tx_relay=config.relay
+            )
+            node.shaper_factory = self._make_shaper
+            node.accept_listeners.append(
+                lambda item, index=index: self._record_arrival(item, index)
+            )
+            await node.start()
+            self.nodes.append(node)
+
+        for dialed, dialing in self.edges:
+            target = self.nodes[dialed]
+            self.nodes[dialing].add_peer(target.node_id, target.host, target.port)
+
+        links = [0] * config.nodes
+        for a, b in self.edges:
+            links[a] += 1
+            links[b] += 1
+        connected = await self._wait_until(
+            lambda: all(len(node.connected_peers) >= links[i] for i, node in enumerate(self.nodes)),
+            CONNECT_TIMEOUT
+        )
+        if not connected:
+            raise SimulationError("Timed out waiting for simulated links to connect")
+
+    async def stop(self) -> None:
+        """Stop every node."""
+        for node in self.nodes:
+            await node.stop()
+
+    async def inject_transactions(self, count: int, rate: float) -> List[InventoryItem]:
+        """
+        Submit transactions at random nodes at a steady rate.
+
+        Args:
+            count (int): Number of transactions
+            rate (float): Transactions per second
+
+        Returns:
+            List[InventoryItem]: Inventory items of the injected transactions
+        """
+        items = []
+        start = time.monotonic()
+        for i in range(count):
+            origin = self._rng.randrange(len(self.nodes))
+            tx = Transaction(f"user{i}", f"user{self._rng.randrange(count)}", 1.0)
+            item = (INV_TX, tx.tx_id)
+            self._origins[item] = (origin, time.monotonic())
+            await self.nodes[origin].submit_transaction(tx)
+            items.append(item)
+
+            delay = start + (i + 1) / rate - time.monotonic()
+            await asyncio.sleep(max(0.0, delay))
+        return items
+
+    async def mine_and_announce(self) -> InventoryItem:
+        """
+        Mine a block of pending transactions at a random node and announce it.
+
+        Returns:
+            InventoryItem: Inventory item of the block
+        """
+        origin = self._rng.randrange(len(self.nodes))
+        node = self.nodes[origin]
+        pending = node.blockchain.pending_transactions[:MAX_TRANSACTIONS_PER_BLOCK - 1]
+        block = mine_block(node.blockchain, node.node_id, pending)
+
+        item = (INV_BLOCK, block.hash)
+        self._origins[item] = (origin, time.monotonic())
+        node.blockchain.add_block(block)
+        node.blockchain.remove_confirmed_transactions(block)
+        await node.announce_block(block)
+        return item
+
+    async def wait_for_delivery(self, items: List[InventoryItem], timeout: float) -> bool:
+        """
+        Wait until every node has accepted the given items.
+
+        Returns:
+            bool: True if all items reached all nodes before the timeout
+        """
+        expected = len(self.nodes) - 1
+        return await self._wait_until(
+            lambda: all(self._delivered(item) >= expected for item in items),
+            timeout
+        )
+
+    async def run(self) -> SimulationReport:
+        """
+        Run the configured workload end to end.
+
+        Returns:
+            SimulationReport: Collected statistics
+        """
+        config = self.config
+        await self.start()
+        try:
+            tx_items = await self.inject_transactions(config.transactions, config.tx_rate)
+            await self.wait_for_delivery(tx_items, config.timeout)
+
+            block_items = []
+            for _ in range(config.blocks):
+                item = await self.mine_and_announce()
+                block_items.append(item)
+                # Blocks are mined one after another; forks cannot be resolved
+                await self.wait_for_delivery([item], config.timeout)
+
+            return self.report(tx_items, block_items)
+        finally:
+            await self.stop()
+
+    def report(self, tx_items: List[InventoryItem], block_items: List[InventoryItem]) -> SimulationReport:
+        """
+        Summarize the run so far.
+
+        Args:
+            tx_items (List[InventoryItem]): Transactions to report on
+            block_items (List[InventoryItem]): Blocks to report on
+
+        Returns:
+            SimulationReport: Collected statistics
+        """
+        tx_times = self._propagation_times(tx_items)
+        block_times = self._propagation_times(block_items)
+        expected = (len(tx_items) + len(block_items)) * (len(self.nodes) - 1)
+        delivered = sum(self._delivered(item) for item in tx_items + block_items)
+
+        objects = duplicates = received = sent = messages = 0
+        for node in self.nodes:
+            objects += node.stats["objects"]
+            duplicates += node.stats["duplicates"]
+            received += sum(v for k, v in node.stats.items() if k.startswith("bytes."))
+            messages += sum(v for k, v in node.stats.items() if k.startswith("messages."))
+            sent += sum(peer.bytes_sent for peer in node.connected_peers)
+
+        count = len(self.nodes) or 1
+        return SimulationReport(
+            nodes=len(self.nodes),
+            links=len(self.edges),
+            tx_p50=percentile(tx_times, 50),
+            tx_p99=percentile(tx_times, 99),
+            block_p50=percentile(block_times, 50),
+            block_p99=percentile(block_times, 99),
+            coverage=delivered / expected if expected else 1.0,
+            duplicate_ratio=duplicates / objects if objects else 0.0,
+            bytes_sent_per_node=sent / count,
+            bytes_received_per_node=received / count,
+            messages_per_node=messages / count,
+            elapsed=time.monotonic() - self._started_at
+        )
+
+    def _make_shaper(self) -> Optional[LinkShaper]:
+        config = self.config
+        if not (config.latency or config.jitter or config.bandwidth):
+            return None
+        return LinkShaper(config.latency, config.bandwidth, config.jitter, self._rng)
+
+    def _record_arrival(self, item: InventoryItem, index: int) -> None:
+        self._arrivals.setdefault(item, {}).setdefault(index, time.monotonic())
+
+    def _delivered(self, item: InventoryItem) -> int:
+        origin = self._origins.get(item, (-1, 0.0))[0]
+        return sum(1 for index in self._arrivals.get(item, {}) if index != origin)
+
+    def _propagation_times(self, items: List[InventoryItem]) -> List[float]:
+        times = []
+        for item in items:
+            origin, sent_at = self._origins[item]
+            for index, arrived_at in self._arrivals.get(item, {}).items():
+                if index != origin:
+                    times.append(arrived_at - sent_at)
+        return times
+
+    @staticmethod
+    async def _wait_until(condition, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            await asyncio.sleep(POLL_INTERVAL)
+        return True
+
+def main(argv: Optional[List[str]] = None) -> None:
+    defaults = SimulationConfig()
+    parser = argparse.ArgumentParser(description="Simulate block and transaction propagation")
+    parser.add_argument("--nodes", type=int, default=defaults.nodes)
+    parser.add_argument("--topology", choices=TOPOLOGIES, default=defaults.topology)
+    parser.add_argument("--degree", type=int, default=defaults.degree)
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="seconds")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="seconds")
+    parser.add_argument("--bandwidth", type=float, default=defaults.bandwidth, help="bytes/s, 0 = unlimited")
+    parser.add_argument("--transactions", type=int, default=defaults.transactions)
+    parser.add_argument("--tx-rate", type=float, default=defaults.tx_rate)
+    parser.add_argument("--blocks", type=int, default=defaults.blocks)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--timeout", type=float, default=defaults.timeout)
+    parser.add_argument("--relay", choices=(RELAY_FLOOD, RELAY_RECONCILE), default=defaults.relay)
+    args = parser.parse_args(argv)
+
+    config = SimulationConfig(
+        nodes=args.nodes, topology=args.topology, degree=args.degree,
+        latency=args.latency, jitter=args.jitter, bandwidth=args.bandwidth,
+        transactions=args.transactions, tx_rate=args.tx_rate, blocks=args.blocks,
+        seed=args.seed, timeout=args.timeout, relay=args.relay
+    )
+    report = asyncio.run(NetworkSimulator(config).run())
+    print(json.dumps(report.to_dict(), indent=2))
+
+if __name__ == "__main__":
+    main()
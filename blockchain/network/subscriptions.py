@@ -0,0 +1,182 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional, Set
+from blockchain.core.events import Event, EventBus
+
+# Subscription server constants
+MAX_CLIENT_QUEUE = 1000  # Events buffered per client before it is dropped as too slow
+MAX_SUBSCRIPTIONS_PER_CLIENT = 16  # Subscriptions one connection may hold
+MAX_ADDRESSES_PER_SUBSCRIPTION = 1000  # Addresses one subscription may watch
+MAX_COMMAND_SIZE = 64 * 1024  # Longest accepted command line in bytes
+
+class SubscriptionClient:
+    """
+    One connected subscriber.
+
+    Events are queued by ``push``, which may be called from any thread via
+    the event loop, and written by the client's own writer task, so a slow
+    client never holds up the publisher. A client whose queue overflows is
+    disconnected.
+
+    Attributes:
+        subscriptions (Set[int]): EventBus subscription IDs owned by the client
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, queue_size: int = MAX_CLIENT_QUEUE):
+        self.writer = writer
+        self.subscriptions: Set[int] = set()
+        self.overflowed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, subscription_id: int, event: Event) -> None:
+        """Queue an event for the client; must run on the event loop."""
+        if self.overflowed:
+            return
+        # Splice the subscription ID into the event's shared encoding
+        line = b'{"subscription":%d,' % subscription_id + event.to_json_line()[1:]
+        try:
+            self._queue.put_nowait(line)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self.writer.close()
+
+    def reply(self, message: Dict[str, Any]) -> None:
+        self._queue.put_nowait(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+    async def write_loop(self) -> None:
+        try:
+            while True:
+                lines = [await self._queue.get()]
+                while not self._queue.empty():
+                    lines.append(self._queue.get_nowait())
+                self.writer.writelines(lines)
+                await self.writer.drain()
+        except (ConnectionError, OSError):
+            self.writer.close()
+
+class SubscriptionServer:
+    """
+    Streams chain events to clients over long-lived TCP connections.
+
+    The protocol is newline-delimited JSON. Clients send commands:
+
+    - ``{"id": 1, "subscribe": ["block", "transaction"]}`` for every new
+      block and/or pending transaction
+    - ``{"id": 2, "addresses": ["addr1", "addr2"]}`` for pending and mined
+      transactions touching those addresses (may be combined with
+      ``subscribe`` in one command)
+    - ``{"id": 3, "unsubscribe": 7}``
+
+    and get ``{"id": 1, "subscription": 7}``, ``{"id": 3, "result": true}``
+    or ``{"id": ..., "error": "..."}`` back. Matching events are pushed as
+    ``{"subscription": 7, "event": "block", "data": {...}}`` lines as soon
+    as they are published on the EventBus (``Blockchain.events``).
+
+    Attributes:
+        events (EventBus): Bus the server subscribes to
+        host (str): Listen host
+        port (int): Listen port (updated after start if 0 was given)
+    """
+
+    def __init__(self, events: EventBus, host: str = "127.0.0.1", port: int = 8546):
+        self.events = events
+        self.host = host
+        self.port = port
+        self.logger = logging.getLogger("triadnet.subscriptions")
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set[SubscriptionClient] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    async def start(self) -> None:
+        """Start accepting subscribers."""
+        self._loop = asyncio.get_event_loop()
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_COMMAND_SIZE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.logger.info(f"Subscriptions listening on {self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """Stop accepting subscribers and disconnect the current ones."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for client in list(self._clients):
+            client.writer.close()
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        client = SubscriptionClient(writer)
+        self._clients.add(client)
+        write_task = asyncio.ensure_future(client.write_loop())
+        try:
+            while not client.overflowed:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = None
+                try:
+                    command = json.loads(line)
+                    if not isinstance(command, dict):
+                        raise ValueError("Command must be an object")
+                    client.reply(self._handle_command(client, command))
+                except ValueError as e:
+                    request_id = command.get("id") if isinstance(command, dict) else None
+                    client.reply({"id": request_id, "error": str(e)})
+
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for subscription_id in client.subscriptions:
+                self.events.unsubscribe(subscription_id)
+            self._clients.discard(client)
+            write_task.cancel()
+            writer.close()
+            if client.overflowed:
+                self.logger.warning("Dropped a subscriber that fell too far behind")
+
+    def _handle_command(self, client: SubscriptionClient, command: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply one command.
+
+        Raises:
+            ValueError: If the command is invalid
+        """
+        request_id = command.get("id")
+        if "unsubscribe" in command:
+            subscription_id = command["unsubscribe"]
+            if not isinstance(subscription_id, int) or subscription_id not in client.subscriptions:
+                raise ValueError(f"Unknown subscription {subscription_id}")
+            client.subscriptions.discard(subscription_id)
+            self.events.unsubscribe(subscription_id)
+            return {"id": request_id, "result": True}
+
+        kinds = command.get("subscribe", [])
+        addresses = command.get("addresses", [])
+        if not isinstance(kinds, list) or not isinstance(addresses, list) \
+                or not all(isinstance(item, str) for item in kinds + addresses):
+            raise ValueError("subscribe and addresses must be lists of strings")
+        if len(addresses) > MAX_ADDRESSES_PER_SUBSCRIPTION:
+            raise ValueError(f"At most {MAX_ADDRESSES_PER_SUBSCRIPTION} addresses per subscription")
+        if len(client.subscriptions) >= MAX_SUBSCRIPTIONS_PER_CLIENT:
+            raise ValueError(f"At most {MAX_SUBSCRIPTIONS_PER_CLIENT} subscriptions per connection")
+
+        loop = self._loop
+        holder: Dict[str, int] = {}
+
+        def deliver(event: Event) -> None:
+            # Publishers may run on the mining thread; hop onto the loop
+            loop.call_soon_threadsafe(lambda: client.push(holder["id"], event))
+
+        holder["id"] = subscription_id = self.events.subscribe(deliver, kinds, addresses)
+        client.subscriptions.add(subscription_id)
+        return {"id": request_id, "subscription": subscription_id}
@@ -0,0 +1,405 @@
+import time
+import logging
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from blockchain.core.block import Block, BlockHeader
+from blockchain.core.blockchain import Blockchain, BlockchainError
+from blockchain.network.inventory import SeenCache, INV_BLOCK
+from blockchain.network.peer import Peer
+from blockchain.network.protocol import (
+    ProtocolError, MSG_GETHEADERS, MSG_HEADERS, MSG_GETBODIES, MSG_BODIES
+)
+
+# Sync constants
+MAX_HEADERS_PER_RESPONSE = 2000  # Headers sent per getheaders response
+BODY_WINDOW_SIZE = 16  # Consecutive blocks requested in one getbodies message
+MAX_WINDOWS_PER_PEER = 4  # Body windows in flight per peer
+MAX_BUFFERED_BLOCKS = 1024  # Blocks downloaded ahead of the chain tip
+BODY_REQUEST_TIMEOUT = 10.0  # Seconds before an unanswered window is reassigned
+HEADER_REQUEST_TIMEOUT = 10.0  # Seconds before another peer is asked for headers
+PROGRESS_INTERVAL = 5.0  # Seconds between progress log lines
+
+Window = Tuple[int, int]  # First and last height of a body window
+
+class SyncError(Exception):
+    """
+    Raised when a peer's chain cannot be synced from, although the peer did
+    nothing wrong, e.g. because it is on a competing branch.
+    """
+    pass
+
+@dataclass
+class SyncProgress:
+    """
+    Snapshot of initial block download progress.
+
+    Attributes:
+        chain_height (int): Height of the local chain tip
+        header_height (int): Height of the best validated header
+        blocks_downloaded (int): Block bodies received and checked
+        bytes_downloaded (int): Frame bytes of block bodies received
+        elapsed (float): Seconds since the sync started
+    """
+
+    chain_height: int
+    header_height: int
+    blocks_downloaded: int
+    bytes_downloaded: int
+    elapsed: float
+
+    @property
+    def blocks_per_second(self) -> float:
+        return self.blocks_downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes_downloaded / 1_000_000 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "chain_height": self.chain_height,
+            "header_height": self.header_height,
+            "blocks_downloaded": self.blocks_downloaded,
+            "bytes_downloaded": self.bytes_downloaded,
+            "elapsed": self.elapsed,
+            "blocks_per_second": self.blocks_per_second,
+            "megabytes_per_second": self.megabytes_per_second
+        }
+
+class ChainSync:
+    """
+    Headers-first initial block download.
+
+    Sync runs in two overlapping stages:
+
+    1. Headers are requested from one peer with a block locator, so the peer
+       answers from the most recent common block. Every header must extend
+       the previous one and carry valid proof of work before it is kept.
+    2. As headers arrive, the heights they cover are split into windows of
+       BODY_WINDOW_SIZE blocks. Windows are fetched with ``getbodies`` from
+       every peer whose chain is long enough, at most MAX_WINDOWS_PER_PEER at
+       a time per peer. Bodies must hash to their header; they are buffered
+       and applied in height order through ``Blockchain.add_blocks``.
+
+    Windows whose peer disconnects or stays silent for BODY_REQUEST_TIMEOUT
+    are handed to another peer on the next ``tick``.
+
+    The chain cannot reorganize, so headers that fork from the local chain
+    raise SyncError: an honest peer on a competing branch cannot be synced
+    from. Headers and bodies that fail proof of work or do not hash to what
+    they claim raise ProtocolError.
+    """
+
+    def __init__(
+        self,
+        blockchain: Blockchain,
+        get_peers: Callable[[], List[Peer]],
+        seen: Optional[SeenCache] = None,
+        node_id: str = ""
+    ):
+        """
+        Initialize the sync state.
+
+        Args:
+            blockchain (Blockchain): Chain that downloaded blocks are added to
+            get_peers (Callable[[], List[Peer]]): Returns peers that completed
+                the handshake
+            seen (Optional[SeenCache]): Inventory cache to mark applied blocks in
+            node_id (str): Node ID used in log messages
+        """
+        self.blockchain = blockchain
+        self.get_peers = get_peers
+        self.seen = seen
+        self.node_id = node_id
+        self.logger = logging.getLogger("triadnet.sync")
+
+        self._headers: Dict[int, BlockHeader] = {}
+        self._header_tip: Optional[BlockHeader] = None
+        self._header_peer: Optional[Peer] = None
+        self._header_requested_at = 0.0
+        self._next_window = 0
+        self._pending: Deque[Window] = deque()
+        self._in_flight: Dict[int, Tuple[int, Peer, float]] = {}
+        self._bodies: Dict[int, Block] = {}
+
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._last_report = 0.0
+        self.blocks_downloaded = 0
+        self.bytes_downloaded = 0
+
+    @property
+    def syncing(self) -> bool:
+        """Whether headers or bodies are still outstanding."""
+        return bool(self._headers) or self._header_peer is not None
+
+    @property
+    def header_height(self) -> int:
+        """Height of the best validated header."""
+        if self._header_tip is not None:
+            return self._header_tip.index
+        return len(self.blockchain.chain) - 1
+
+    def progress(self) -> SyncProgress:
+        """
+        Report download progress and throughput.
+
+        Returns:
+            SyncProgress: Current progress
+        """
+        end = self._finished_at or time.monotonic()
+        elapsed = end - self._started_at if self._started_at else 0.0
+        return SyncProgress(
+            chain_height=len(self.blockchain.chain) - 1,
+            header_height=self.header_height,
+            blocks_downloaded=self.blocks_downloaded,
+            bytes_downloaded=self.bytes_downloaded,
+            elapsed=elapsed
+        )
+
+    async def request_headers(self, peer: Peer) -> None:
+        """
+        Ask a peer for headers after our best header.
+
+        Only one header request is outstanding at a time; calls made while
+        another peer is answering are ignored.
+
+        Args:
+            peer (Peer): Peer whose chain is longer than ours
+        """
+        if self._header_peer is not None and not self._header_peer.closed:
+            return
+        if self._started_at is None or self._finished_at is not None:
+            self._started_at = time.monotonic()
+            self._finished_at = None
+            self.blocks_downloaded = 0
+            self.bytes_downloaded = 0
+
+        locator = self.blockchain.get_locator()
+        if self._header_tip is not None:
+            locator.insert(0, self._header_tip.hash)
+
+        self._header_peer = peer
+        self._header_requested_at = time.monotonic()
+        try:
+            await peer.send(MSG_GETHEADERS, {
+                "locator": locator,
+                "limit": MAX_HEADERS_PER_RESPONSE
+            })
+        except ConnectionError:
+            self._header_peer = None
+
+    async def tick(self) -> None:
+        """Retry stalled header requests and body windows."""
+        if self._header_peer is not None and (
+            self._header_peer.closed
+            or time.monotonic() - self._header_requested_at > HEADER_REQUEST_TIMEOUT
+        ):
+            self._header_peer = None
+        if self._header_peer is None:
+            await self._request_headers_from_best_peer()
+        if self._headers:
+            await self._schedule()
+
+    async def handle_getheaders(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        start = self.blockchain.find_fork_height(payload.get("locator", [])) + 1
+        limit = min(int(payload.get("limit", MAX_HEADERS_PER_RESPONSE)), MAX_HEADERS_PER_RESPONSE)
+        headers = self.blockchain.get_headers(start, limit)
+        await peer.send(MSG_HEADERS, {"headers": [header.to_dict() for header in headers]})
+
+    async def handle_headers(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        raw_headers = payload.get("headers", [])[:MAX_HEADERS_PER_RESPONSE]
+        if peer is self._header_peer:
+            self._header_peer = None
+
+        tip_height = self.header_height
+        headers = [BlockHeader.from_dict(data) for data in raw_headers]
+        headers = [header for header in headers if header.index > tip_height]
+        if headers:
+            self._add_headers(headers)
+            peer.height = max(peer.height, headers[-1].index + 1)
+            self.logger.debug(
+                f"[{self.node_id}] Validated {len(headers)} headers from {peer}, "
+                f"header height {self.header_height}"
+            )
+
+        if len(raw_headers) >= MAX_HEADERS_PER_RESPONSE:
+            await self.request_headers(peer)
+        else:
+            await self._request_headers_from_best_peer()
+        await self._schedule()
+
+    async def handle_getbodies(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        blocks = []
+        for block_hash in payload.get("hashes", [])[:BODY_WINDOW_SIZE * MAX_WINDOWS_PER_PEER]:
+            block = self.blockchain.get_block_by_hash(block_hash)
+            if block is not None:
+                blocks.append(block.to_dict())
+        await peer.send(MSG_BODIES, {"blocks": blocks})
+
+    async def handle_bodies(self, peer: Peer, payload: Dict[str, Any]) -> None:
+        self.bytes_downloaded += peer.last_message_size
+        for data in payload.get("blocks", []):
+            block = Block.from_dict(data)
+            header = self._headers.get(block.index)
+            if header is None or block.index in self._bodies:
+                continue
+            if block.hash != header.hash or block.calculate_hash() != header.hash:
+                raise ProtocolError(f"Block {block.index} does not match its header")
+            self._bodies[block.index] = block
+            self.blocks_downloaded += 1
+
+        for start, (end, _, _) in list(self._in_flight.items()):
+            if all(height in self._bodies for height in range(start, end + 1)):
+                del self._in_flight[start]
+
+        self._apply()
+        await self._schedule()
+
+    def _add_headers(self, headers: List[BlockHeader]) -> None:
+        """Validate headers that extend the best header and queue their bodies."""
+        target = "0" * self.blockchain.difficulty
+        parent_height = self.header_height
+        parent_hash = (
+            self._header_tip.hash if self._header_tip is not None
+            else self.blockchain.last_block.hash
+        )
+        first_height = parent_height + 1
+
+        # Check the whole response before keeping any of it
+        for header in headers:
+            if header.index != parent_height + 1 or header.previous_hash != parent_hash:
+                raise SyncError(f"Header {header.index} does not connect to our chain")
+            if not header.hash.startswith(target):
+                raise ProtocolError(
+                    f"Header {header.index} doesn't meet difficulty requirement of "
+                    f"{self.blockchain.difficulty}"
+                )
+            if header.calculate_hash() != header.hash:
+                raise ProtocolError(f"Header {header.index} hash is invalid")
+            parent_height, parent_hash = header.index, header.hash
+
+        if self._header_tip is None:
+            self._next_window = first_height
+        for header in headers:
+            self._headers[header.index] = header
+
+        self._header_tip = headers[-1]
+        while self._next_window <= parent_height:
+            end = min(self._next_window + BODY_WINDOW_SIZE - 1, parent_height)
+            self._pending.append((self._next_window, end))
+            self._next_window = end + 1
+
+    async def _request_headers_from_best_peer(self) -> None:
+        peers = [peer for peer in self.get_peers() if not peer.closed]
+        if not peers:
+            return
+        best = max(peers, key=lambda peer: peer.height)
+        if best.height - 1 > self.header_height:
+            await self.request_headers(best)
+        elif not self.syncing:
+            self._finish()
+
+    async def _schedule(self) -> None:
+        """Hand pending windows to peers with spare capacity."""
+        now = time.monotonic()
+        requeued = []
+        for start, (end, peer, sent_at) in list(self._in_flight.items()):
+            if peer.closed or now - sent_at > BODY_REQUEST_TIMEOUT:
+                del self._in_flight[start]
+                requeued.append((start, end))
+        if requeued:
+            self._pending = deque(sorted(list(self._pending) + requeued))
+
+        load = Counter(peer for _, peer, _ in self._in_flight.values())
+        peers = [peer for peer in self.get_peers() if not peer.closed]
+        limit = len(self.blockchain.chain) + MAX_BUFFERED_BLOCKS
+        requests: List[Tuple[Peer, Window]] = []
+
+        while self._pending and self._pending[0][0] < limit:
+            start, end = self._pending[0]
+            candidates = [
+                peer for peer in peers
+                if load[peer] < MAX_WINDOWS_PER_PEER and peer.height > end
+            ]
+            if not candidates:
+                break
+            peer = min(candidates, key=lambda p: load[p])
+            self._pending.popleft()
+            self._in_flight[start] = (end, peer, now)
+            load[peer] += 1
+            requests.append((peer, (start, end)))
+
+        for peer, (start, end) in requests:
+            hashes = [self._headers[height].hash for height in range(start, end + 1)]
+            try:
+                await peer.send(MSG_GETBODIES, {"hashes": hashes})
+            except ConnectionError:
+                pass  # Reassigned on the next tick
+
+    def _apply(self) -> None:
+        """Add buffered bodies that continue the chain."""
+        height = len(self.blockchain.chain)
+        batch = []
+        while height in self._bodies:
+            batch.append(self._bodies.pop(height))
+            height += 1
+        if not batch:
+            return
+
+        first_height = batch[0].index
+        try:
+            self.blockchain.add_blocks(batch)
+        except BlockchainError as e:
+            # Blocks before the failing one stay in the chain
+            self._confirm(batch[:len(self.blockchain.chain) - first_height])
+            self.logger.error(f"[{self.node_id}] Sync failed, restarting: {str(e)}")
+            self._reset()
+            return
+        finally:
+            for block in batch:
+                self._headers.pop(block.index, None)
+
+        self._confirm(batch)
+
+        if not self._headers:
+            self._header_tip = None
+            if self._header_peer is None:
+                self._finish()
+                return
+        now = time.monotonic()
+        if now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            self._log_progress("Syncing")
+
+    def _confirm(self, blocks: List[Block]) -> None:
+        """Prune the pending pool and mark blocks seen once they are in the chain."""
+        if not blocks:
+            return
+        self.blockchain.remove_confirmed_transactions(*blocks)
+        if self.seen is not None:
+            for block in blocks:
+                self.seen.add((INV_BLOCK, block.hash))
+
+    def _finish(self) -> None:
+        if self._started_at is not None and self._finished_at is None:
+            self._finished_at = time.monotonic()
+            self._log_progress("Sync complete")
+
+    def _log_progress(self, label: str) -> None:
+        progress = self.progress()
+        self.logger.info(
+            f"[{self.node_id}] {label}: height {progress.chain_height}/{progress.header_height}, "
+            f"{progress.blocks_downloaded} blocks in {progress.elapsed:.1f}s "
+            f"({progress.blocks_per_second:.1f} blocks/s, "
+            f"{progress.megabytes_per_second:.2f} MB/s)"
+        )
+
+    def _reset(self) -> None:
+        self._headers.clear()
+        self._header_tip = None
+        self._header_peer = None
+        self._pending.clear()
+        self._in_flight.clear()
+        self._bodies.clear()
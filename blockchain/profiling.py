@@ -0,0 +1,378 @@
+"""On-demand stack sampling and scoped cProfile sessions for node subsystems."""
+
+import cProfile
+import functools
+import importlib
+import logging
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Profiling constants
+SAMPLE_INTERVAL = 0.01  # Seconds between stack samples (100 Hz)
+MAX_STACK_DEPTH = 128  # Frames kept per sample, innermost first
+UNTAGGED = "other"  # Tag of samples outside every subsystem
+PROFILE_DIR = "profiles"  # Default directory for profile output
+
+# Entry points whose frames tag a sample with their subsystem; when several
+# are on the stack, the innermost wins (add_block called by the miner is "chain")
+SUBSYSTEM_ENTRY_POINTS = {
+    "mining": ["blockchain.mining.mine:Miner._mine_loop"],
+    "chain": ["blockchain.core.blockchain:Blockchain.add_block", "blockchain.core.blockchain:Blockchain.add_blocks"],
+    "network": ["blockchain.network.node:Node._serve_peer"],
+}
+
+# Synchronous functions wrapped in cProfile during a scoped session
+PROFILE_SCOPES = {
+    "mining": ["blockchain.mining.proof_of_work:ProofOfFractalWork.mine_block"],
+    "chain": ["blockchain.core.blockchain:Blockchain.add_block"],
+    "network": ["blockchain.network.node:Node._accept_block", "blockchain.network.node:Node._accept_transaction"],
+}
+
+logger = logging.getLogger("triadnet.profiling")
+
+class ProfilingError(Exception):
+    """Raised when a profiler is misused or a target cannot be resolved."""
+    pass
+
+def _resolve(target: str) -> Tuple[Any, str]:
+    """
+    Resolve ``"package.module:Class.method"`` to the class and attribute name.
+
+    Raises:
+        ProfilingError: If the module, class or attribute does not exist
+    """
+    try:
+        module_name, qualname = target.split(":")
+        owner: Any = importlib.import_module(module_name)
+        *path, attribute = qualname.split(".")
+        for name in path:
+            owner = getattr(owner, name)
+        getattr(owner, attribute)
+    except (ValueError, ImportError, AttributeError) as e:
+        raise ProfilingError(f"Cannot resolve profiling target {target}: {str(e)}")
+    return owner, attribute
+
+def _code_of(target: str):
+    owner, attribute = _resolve(target)
+    function = getattr(owner, attribute)
+    return getattr(function, "__wrapped__", function).__code__
+
+class StackSampler:
+    """
+    Low-overhead sampling profiler writing collapsed stacks.
+
+    A daemon thread wakes every ``interval`` seconds, reads the current
+    frame of every other thread with ``sys._current_frames`` and counts the
+    stack. Nothing is installed in the profiled code, so the sampler costs
+    nothing while stopped and only the sampling thread's work while
+    running. Each stack is tagged with the subsystem whose entry point is
+    innermost on it, and written in the collapsed format flamegraph tools
+    read: ``tag;outer;...;inner count``.
+
+    Attributes:
+        interval (float): Seconds between samples
+        samples (Counter): Count per collapsed stack
+    """
+
+    def __init__(
+        self,
+        interval: float = SAMPLE_INTERVAL,
+        entry_points: Optional[Dict[str, Sequence[str]]] = None,
+        max_depth: int = MAX_STACK_DEPTH
+    ):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples: Counter = Counter()
+        self._entry_points = SUBSYSTEM_ENTRY_POINTS if entry_points is None else entry_points
+        self._tags: Dict[Any, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """
+        Start sampling.
+
+        Raises:
+            ProfilingError: If already running or an entry point is unknown
+        """
+        if self.running:
+            raise ProfilingError("Sampler is already running")
+        self._tags = {
+            _code_of(target): tag
+            for tag, targets in self._entry_points.items()
+            for target in targets
+        }
+        self.samples.clear()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; the samples are kept until the next start."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def collapsed(self) -> List[str]:
+        """Samples as collapsed-stack lines, most frequent first."""
+        return [f"{stack} {count}" for stack, count in self.samples.most_common()]
+
+    def write(self, path: str) -> str:
+        """
+        Write the samples in collapsed-stack format.
+
+        Args:
+            path (str): Output file
+
+        Returns:
+            str: The path written
+        """
+        with open(path, "w") as f:
+            f.write("\n".join(self.collapsed()) + "\n")
+        return path
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self.samples[self._collapse(frame)] += 1
+
+    def _collapse(self, frame) -> str:
+        names = []
+        tag = None
+        while frame is not None and len(names) < self.max_depth:
+            code = frame.f_code
+            if tag is None:
+                tag = self._tags.get(code)
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        names.append(tag or UNTAGGED)
+        return ";".join(reversed(names))
+
+class ScopedProfiler:
+    """
+    cProfile sessions around chosen subsystem entry points.
+
+    Starting a session replaces each target method with a wrapper that runs
+    the call under a per-thread ``cProfile.Profile``; stopping puts the
+    original method back, so the targets cost nothing outside a session.
+    Calls nested inside an already profiled call are attributed to the
+    outer one, since a thread can only run one profiler at a time.
+
+    Attributes:
+        scopes (Dict[str, Sequence[str]]): Targets per subsystem
+    """
+
+    def __init__(self, scopes: Optional[Dict[str, Sequence[str]]] = None):
+        self.scopes = PROFILE_SCOPES if scopes is None else scopes
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._installed: List[Tuple[Any, str, Any]] = []
+        self._profiles: Dict[Tuple[str, int], cProfile.Profile] = {}
+        self._subsystems: List[str] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._installed)
+
+    def start(self, subsystems: Optional[Sequence[str]] = None) -> None:
+        """
+        Start a session.
+
+        Args:
+            subsystems (Optional[Sequence[str]]): Subsystems to profile,
+                default all scopes
+
+        Raises:
+            ProfilingError: If a session is running or a subsystem or
+                target is unknown
+        """
+        if self.running:
+            raise ProfilingError("A profiling session is already running")
+        subsystems = list(self.scopes) if subsystems is None else list(subsystems)
+        unknown = set(subsystems) - set(self.scopes)
+        if unknown:
+            raise ProfilingError(f"Unknown subsystems: {sorted(unknown)}")
+
+        targets = [(subsystem, _resolve(target)) for subsystem in subsystems for target in self.scopes[subsystem]]
+        self._profiles = {}
+        self._subsystems = subsystems
+        for subsystem, (owner, attribute) in targets:
+            original = owner.__dict__[attribute]
+            setattr(owner, attribute, self._wrap(original, subsystem))
+            self._installed.append((owner, attribute, original))
+        logger.info(f"Profiling session started for {', '.join(subsystems)}")
+
+    def stop(self) -> None:
+        """End the session and restore the original methods."""
+        for owner, attribute, original in reversed(self._installed):
+            setattr(owner, attribute, original)
+        self._installed = []
+
+    def stats(self, subsystem: str) -> Optional[pstats.Stats]:
+        """
+        Combined statistics of a subsystem over all threads.
+
+        Returns:
+            Optional[pstats.Stats]: None if no call was profiled
+        """
+        with self._lock:
+            profiles = [p for (name, _), p in self._profiles.items() if name == subsystem]
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def write(self, directory: str, prefix: str = "cprofile") -> List[str]:
+        """
+        Write one pstats file per profiled subsystem.
+
+        Args:
+            directory (str): Output directory, created if missing
+            prefix (str): File name prefix
+
+        Returns:
+            List[str]: Paths written, named ``<prefix>-<subsystem>.prof``
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for subsystem in self._subsystems:
+            stats = self.stats(subsystem)
+            if stats is not None:
+                path = os.path.join(directory, f"{prefix}-{subsystem}.prof")
+                stats.dump_stats(path)
+                paths.append(path)
+        return paths
+
+    def _wrap(self, original: Callable, subsystem: str) -> Callable:
+        local = self._local
+
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            if getattr(local, "active", False):
+                return original(*args, **kwargs)
+            profile = self._profile_for(subsystem)
+            local.active = True
+            profile.enable()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                profile.disable()
+                local.active = False
+        return wrapper
+
+    def _profile_for(self, subsystem: str) -> cProfile.Profile:
+        key = (subsystem, threading.get_ident())
+        profile = self._profiles.get(key)
+        if profile is None:
+            with self._lock:
+                profile = self._profiles.setdefault(key, cProfile.Profile())
+        return profile
+
+class Profiler:
+    """
+    Opt-in profiling controls for a running node.
+
+    Wraps a StackSampler and a ScopedProfiler behind start/stop calls that
+    write their output under ``output_dir`` with a timestamp, for use from a
+    signal handler (``install_signal_handler``) or RPC
+    (``RPCServer(profiler=...)``).
+
+    Attributes:
+        output_dir (str): Directory profile files are written to
+        sampler (StackSampler): Stack sampler
+        scoped (ScopedProfiler): cProfile sessions
+    """
+
+    def __init__(self, output_dir: str = PROFILE_DIR, interval: float = SAMPLE_INTERVAL):
+        self.output_dir = output_dir
+        self.sampler = StackSampler(interval)
+        self.scoped = ScopedProfiler()
+
+    def start_sampling(self) -> None:
+        self.sampler.start()
+        logger.info(f"Stack sampler started at {1 / self.sampler.interval:.0f} Hz")
+
+    def stop_sampling(self) -> str:
+        """
+        Stop the sampler and write its collapsed stacks.
+
+        Returns:
+            str: Path of the ``.folded`` file
+
+        Raises:
+            ProfilingError: If the sampler is not running
+        """
+        if not self.sampler.running:
+            raise ProfilingError("Sampler is not running")
+        self.sampler.stop()
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = self.sampler.write(os.path.join(self.output_dir, f"samples-{self._timestamp()}.folded"))
+        logger.info(f"Stack sampler stopped, wrote {path}")
+        return path
+
+    def toggle_sampling(self) -> Optional[str]:
+        """Start the sampler, or stop it and return the file written."""
+        if self.sampler.running:
+            return self.stop_sampling()
+        self.start_sampling()
+        return None
+
+    def start_profiling(self, subsystems: Optional[Sequence[str]] = None) -> None:
+        self.scoped.start(subsystems)
+
+    def stop_profiling(self) -> List[str]:
+        """
+        End the cProfile session and write its statistics.
+
+        Returns:
+            List[str]: Paths of the ``.prof`` files
+
+        Raises:
+            ProfilingError: If no session is running
+        """
+        if not self.scoped.running:
+            raise ProfilingError("No profiling session is running")
+        self.scoped.stop()
+        paths = self.scoped.write(self.output_dir, prefix=f"cprofile-{self._timestamp()}")
+        logger.info(f"Profiling session stopped, wrote {', '.join(paths) or 'nothing'}")
+        return paths
+
+    def install_signal_handler(self, signum: Optional[int] = None) -> int:
+        """
+        Toggle the sampler when the process receives a signal.
+
+        Args:
+            signum (Optional[int]): Signal number, default SIGUSR2
+
+        Returns:
+            int: The signal number used
+
+        Raises:
+            ProfilingError: If the platform has no such signal
+        """
+        if signum is None:
+            signum = getattr(signal, "SIGUSR2", None)
+        if signum is None:
+            raise ProfilingError("SIGUSR2 is not available on this platform")
+        signal.signal(signum, lambda received, frame: self.toggle_sampling())
+        return signum
+
+    @staticmethod
+    def _timestamp() -> str:
+        now = time.time()
+        return time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1000) % 1000:03d}"
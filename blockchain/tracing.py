@@ -0,0 +1,218 @@
+"""Per-block lifecycle tracing spans with a ring buffer, JSONL sink and report CLI.
+
+Run the report with ``python tools/trace_report.py trace.jsonl --blocks 100``.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, TextIO
+
+# Tracing constants
+TRACE_BUFFER_SIZE = 10000  # Spans kept in memory
+REPORT_BLOCKS = 100  # Default number of recent blocks a report covers
+PERCENTILES = (50, 95, 99)  # Percentiles reported per phase
+
+# Block lifecycle phases, in order
+PHASE_TEMPLATE = "template"  # ConsensusManager.create_block
+PHASE_HASH_SEARCH = "hash_search"  # ProofOfFractalWork.mine_block
+PHASE_VALIDATE = "validate"  # Blockchain._is_valid_block
+PHASE_APPEND = "append"  # Blockchain._append_block: indexes, stats and events
+PHASE_MEMPOOL_PRUNE = "mempool_prune"  # Blockchain.remove_confirmed_transactions
+PHASES = (PHASE_TEMPLATE, PHASE_HASH_SEARCH, PHASE_VALIDATE, PHASE_APPEND, PHASE_MEMPOOL_PRUNE)
+
+logger = logging.getLogger("triadnet.tracing")
+
+@dataclass
+class Span:
+    """
+    Time spent in one phase of a block's lifecycle.
+
+    Attributes:
+        height (int): Height of the block the phase worked on
+        phase (str): One of PHASES
+        start (float): Unix time the phase started
+        duration (float): Seconds spent in the phase
+    """
+    height: int
+    phase: str
+    start: float
+    duration: float
+
+class Tracer:
+    """
+    Collects block lifecycle spans.
+
+    Spans go to a bounded in-memory ring buffer and, if a sink is open, are
+    appended to it as JSON lines. Callers time phases themselves with
+    ``time.perf_counter`` and call ``record``, which costs a deque append
+    per phase, a handful per block. ``record`` runs inside block processing,
+    so a sink that fails to write is closed and dropped with a single
+    warning rather than failing the block.
+
+    Attributes:
+        enabled (bool): Whether spans are recorded
+    """
+
+    def __init__(self, capacity: int = TRACE_BUFFER_SIZE):
+        self.enabled = True
+        self._spans: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._sink: Optional[TextIO] = None
+
+    def record(self, height: int, phase: str, duration: float) -> None:
+        """
+        Record a phase that just ended.
+
+        Args:
+            height (int): Block height
+            phase (str): Phase name
+            duration (float): Seconds spent in the phase
+        """
+        if not self.enabled:
+            return
+        span = Span(height, phase, time.time() - duration, duration)
+        self._spans.append(span)
+        if self._sink is not None:
+            line = json.dumps(asdict(span)) + "\n"
+            with self._lock:
+                if self._sink is not None:
+                    try:
+                        self._sink.write(line)
+                    except (OSError, ValueError) as e:
+                        self._drop_sink(e)
+
+    def spans(self) -> List[Span]:
+        """Spans in the ring buffer, oldest first."""
+        return list(self._spans)
+
+    def open_sink(self, path: str) -> None:
+        """
+        Append spans to a JSONL file from now on.
+
+        Args:
+            path (str): File to append to; line-buffered so a crash loses
+                at most the current span
+        """
+        with self._lock:
+            if self._sink is not None:
+                self._sink.close()
+            self._sink = open(path, "a", buffering=1)
+
+    def close_sink(self) -> None:
+        with self._lock:
+            if self._sink is not None:
+                self._sink.close()
+                self._sink = None
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def _drop_sink(self, error: Exception) -> None:
+        """Stop writing to a sink that failed; called with the lock held."""
+        sink, self._sink = self._sink, None
+        logger.warning("Trace sink failed, no longer writing spans to it: %s", error)
+        try:
+            sink.close()
+        except (OSError, ValueError):
+            pass
+
+# Process-wide tracer the chain and miner record into
+TRACER = Tracer()
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values (List[float]): Sorted values, not empty
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The value at that percentile
+    """
+    rank = max(1, int(-(-pct * len(values) // 100)))
+    return values[min(rank, len(values)) - 1]
+
+def phase_report(spans: Iterable[Span], blocks: int = REPORT_BLOCKS) -> Dict[str, Dict[str, float]]:
+    """
+    Summarize phase durations over the most recent blocks.
+
+    Args:
+        spans (Iterable[Span]): Spans to summarize
+        blocks (int): Number of most recent block heights to include
+
+    Returns:
+        Dict[str, Dict[str, float]]: Per phase, in lifecycle order: span
+        count and p50/p95/p99/max durations in milliseconds
+    """
+    spans = list(spans)
+    heights = sorted({span.height for span in spans})[-blocks:]
+    included = set(heights)
+    durations: Dict[str, List[float]] = {}
+    for span in spans:
+        if span.height in included:
+            durations.setdefault(span.phase, []).append(span.duration * 1000)
+
+    order = {phase: i for i, phase in enumerate(PHASES)}
+    report = {}
+    for phase in sorted(durations, key=lambda p: (order.get(p, len(PHASES)), p)):
+        values = sorted(durations[phase])
+        summary = {"count": len(values)}
+        for pct in PERCENTILES:
+            summary[f"p{pct}"] = percentile(values, pct)
+        summary["max"] = values[-1]
+        report[phase] = summary
+    return report
+
+def load_spans(path: str) -> List[Span]:
+    """
+    Read spans from a JSONL sink, skipping malformed lines.
+
+    Args:
+        path (str): Sink file
+
+    Returns:
+        List[Span]: Spans in file order
+    """
+    spans = []
+    with open(path) as f:
+        for line in f:
+            try:
+                spans.append(Span(**json.loads(line)))
+            except (ValueError, TypeError):
+                continue
+    return spans
+
+def format_report(report: Dict[str, Dict[str, float]], blocks: int) -> str:
+    header = f"{'phase':<15} {'spans':>7}" + "".join(f" {f'p{p} ms':>10}" for p in PERCENTILES) + f" {'max ms':>10}"
+    lines = [f"Last {blocks} blocks", header]
+    for phase, summary in report.items():
+        lines.append(
+            f"{phase:<15} {summary['count']:>7}"
+            + "".join(f" {summary[f'p{p}']:>10.3f}" for p in PERCENTILES)
+            + f" {summary['max']:>10.3f}"
+        )
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report block lifecycle phase times from a trace file")
+    parser.add_argument("trace", help="JSONL file written by Tracer.open_sink")
+    parser.add_argument("--blocks", type=int, default=REPORT_BLOCKS,
+                        help="Number of most recent blocks to include")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    spans = load_spans(args.trace)
+    if not spans:
+        print(f"No spans in {args.trace}", file=sys.stderr)
+        return 1
+    report = phase_report(spans, args.blocks)
+    blocks = min(args.blocks, len({span.height for span in spans}))
+    print(json.dumps(report, indent=2) if args.json else format_report(report, blocks))
+    return 0
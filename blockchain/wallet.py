@@ -1,11 +0,0 @@
-class Wallet:
-    def __init__(self):
-        self.address = "dummy_address"
-
-    def some_wallet_method(self):
-        pass
-
-    def sign_transaction(self, transaction):
-        # Stub method to simulate signing
-        transaction.signature = "signed"
-        return transaction
@@ -0,0 +1,21 @@
+"""
+Wallets.
+
+``Wallet`` here is the lightweight wallet miners and tests use for reward
+addresses. The RSA wallet with signing and storage is
+``blockchain.wallet.wallet.Wallet`` and the indexed store for many of them is
+``blockchain.wallet.keystore.Keystore``; they need ``cryptography`` and are
+not imported here.
+"""
+
+class Wallet:
+    def __init__(self):
+        self.address = "dummy_address"
+
+    def some_wallet_method(self):
+        pass
+
+    def sign_transaction(self, transaction):
+        # Stub method to simulate signing
+        transaction.signature = "signed"
+        return transaction
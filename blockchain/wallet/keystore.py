@@ -0,0 +1,325 @@
+import os
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from cryptography.fernet import Fernet
+from blockchain.wallet.wallet import Wallet, StorageError, _decrypt_private_key
+
+# Keystore constants
+KEYSTORE_VERSION = 1  # On-disk format version
+INDEX_FILE = "index.json"  # Address index with per-wallet metadata
+KEYS_FILE = "keys.dat"  # Append-only file of encrypted private keys
+IMPORT_CHUNK_SIZE = 64  # Wallet files parsed per worker round trip
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of a bulk wallet import.
+
+    Attributes:
+        imported (List[str]): Addresses added to the keystore
+        skipped (List[str]): Addresses already present in the keystore
+        errors (Dict[str, str]): Error message per wallet file that failed
+    """
+    imported: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+def _read_wallet_file(path: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Parse a wallet JSON file written by Wallet.save, without decrypting it.
+
+    Args:
+        path (str): Wallet file to read
+
+    Returns:
+        Tuple[str, Optional[Dict[str, Any]], Optional[str]]: (path, entry, error)
+    """
+    try:
+        with open(path, 'r') as f:
+            wallet_data = json.load(f)
+
+        required_fields = {
+            "address", "private_key", "public_key", "fractal_coord", "encryption_key"
+        }
+        missing = required_fields - set(wallet_data.keys())
+        if missing:
+            raise StorageError(f"Missing required fields: {missing}")
+
+        return path, {
+            "address": wallet_data["address"],
+            "public_key": wallet_data["public_key"],
+            "fractal_coord": wallet_data["fractal_coord"],
+            "balance": wallet_data.get("balance", 0.0),
+            "private_key": wallet_data["private_key"],
+            "encryption_key": wallet_data["encryption_key"]
+        }, None
+
+    except Exception as e:
+        return path, None, str(e)
+
+def _read_wallet_files(paths: List[str]) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """Parse a chunk of wallet files in a worker process."""
+    return [_read_wallet_file(path) for path in paths]
+
+class Keystore:
+    """
+    Indexed store for many wallets in a single directory.
+
+    The directory holds two files:
+    - ``index.json``: address -> metadata (public key, fractal coordinate,
+      balance) plus the offset and length of the wallet's key record
+    - ``keys.dat``: append-only JSON lines of encrypted private keys
+
+    Opening a keystore reads only the index. Key records are read, decrypted
+    and parsed the first time a wallet signs something.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open or create a keystore directory.
+
+        Args:
+            path (str): Keystore directory
+
+        Raises:
+            StorageError: If the index cannot be read
+        """
+        self.path = path
+        self.logger = logging.getLogger("triadnet.wallet")
+        self._index_path = os.path.join(path, INDEX_FILE)
+        self._keys_path = os.path.join(path, KEYS_FILE)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._wallets: Dict[str, Wallet] = {}
+
+        try:
+            os.makedirs(path, exist_ok=True)
+            if os.path.exists(self._index_path):
+                with open(self._index_path, 'r') as f:
+                    index = json.load(f)
+                if index.get("version") != KEYSTORE_VERSION:
+                    raise StorageError(f"Unsupported keystore version: {index.get('version')}")
+                self._entries = index["wallets"]
+
+            self.logger.info(f"Opened keystore {path} with {len(self._entries)} wallets")
+
+        except Exception as e:
+            self.logger.error(f"Failed to open keystore: {str(e)}")
+            raise StorageError(f"Failed to open keystore: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, address: str) -> bool:
+        return address in self._entries
+
+    def addresses(self) -> List[str]:
+        """
+        Get all addresses in the keystore.
+
+        Returns:
+            List[str]: Stored addresses
+        """
+        return list(self._entries)
+
+    def get_metadata(self, address: str) -> Dict[str, Any]:
+        """
+        Get the stored metadata of a wallet without loading its key.
+
+        Args:
+            address (str): Wallet address
+
+        Returns:
+            Dict[str, Any]: Public key, fractal coordinate and balance
+
+        Raises:
+            StorageError: If the address is unknown
+        """
+        entry = self._get_entry(address)
+        return {
+            "address": address,
+            "public_key": entry["public_key"],
+            "fractal_coord": entry["fractal_coord"],
+            "balance": entry["balance"]
+        }
+
+    def get_wallet(self, address: str) -> Wallet:
+        """
+        Get a wallet whose private key is loaded on first signing use.
+
+        Args:
+            address (str): Wallet address
+
+        Returns:
+            Wallet: Wallet backed by this keystore
+
+        Raises:
+            StorageError: If the address is unknown
+        """
+        wallet = self._wallets.get(address)
+        if wallet is None:
+            entry = self._get_entry(address)
+            wallet = Wallet.from_metadata(
+                address=address,
+                public_pem=entry["public_key"],
+                fractal_coord=entry["fractal_coord"],
+                balance=entry["balance"],
+                key_source=lambda: self._load_private_key(address)
+            )
+            self._wallets[address] = wallet
+        return wallet
+
+    def add_wallet(self, wallet: Wallet) -> None:
+        """
+        Add a wallet to the keystore and persist the index.
+
+        Args:
+            wallet (Wallet): Wallet to store
+
+        Raises:
+            StorageError: If the wallet cannot be stored
+        """
+        try:
+            key = Fernet.generate_key()
+            self._append_entries([{
+                "address": wallet.address,
+                "public_key": wallet.get_public_key_str(),
+                "fractal_coord": wallet.fractal_coord.to_dict(),
+                "balance": wallet.state.balance,
+                "private_key": Fernet(key).encrypt(wallet._get_private_pem()).decode(),
+                "encryption_key": key.decode()
+            }])
+            self._wallets[wallet.address] = wallet
+            self.save_index()
+
+        except Exception as e:
+            self.logger.error(f"Failed to add wallet: {str(e)}")
+            raise StorageError(f"Failed to add wallet: {str(e)}")
+
+    def import_wallet_files(
+        self,
+        paths: Iterable[str],
+        max_workers: Optional[int] = None
+    ) -> ImportResult:
+        """
+        Bulk import wallet files written by Wallet.save.
+
+        Files are parsed in parallel on a process pool. Encrypted keys are
+        copied as-is, so no key is decrypted during import.
+
+        Args:
+            paths (Iterable[str]): Wallet JSON files to import
+            max_workers (Optional[int]): Parser processes (defaults to CPU count)
+
+        Returns:
+            ImportResult: Imported and skipped addresses and per-file errors
+
+        Raises:
+            StorageError: If writing the keystore fails
+        """
+        paths = list(paths)
+        result = ImportResult()
+        chunks = [
+            paths[i:i + IMPORT_CHUNK_SIZE]
+            for i in range(0, len(paths), IMPORT_CHUNK_SIZE)
+        ]
+        workers = max_workers or os.cpu_count() or 1
+
+        if workers <= 1 or len(chunks) <= 1:
+            parsed = [_read_wallet_file(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = [
+                    outcome
+                    for chunk in executor.map(_read_wallet_files, chunks)
+                    for outcome in chunk
+                ]
+
+        entries = []
+        seen = set()
+        for path, entry, error in parsed:
+            if error is not None:
+                result.errors[path] = error
+            elif entry["address"] in self._entries or entry["address"] in seen:
+                result.skipped.append(entry["address"])
+            else:
+                seen.add(entry["address"])
+                entries.append(entry)
+                result.imported.append(entry["address"])
+
+        try:
+            self._append_entries(entries)
+            self.save_index()
+        except Exception as e:
+            self.logger.error(f"Failed to import wallets: {str(e)}")
+            raise StorageError(f"Failed to import wallets: {str(e)}")
+
+        self.logger.info(
+            f"Imported {len(result.imported)} wallets "
+            f"({len(result.skipped)} skipped, {len(result.errors)} failed)"
+        )
+        return result
+
+    def save_index(self) -> None:
+        """
+        Atomically write the address index.
+
+        Raises:
+            StorageError: If writing fails
+        """
+        try:
+            tmp_path = self._index_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(
+                    {"version": KEYSTORE_VERSION, "wallets": self._entries},
+                    f,
+                    separators=(",", ":")
+                )
+            os.replace(tmp_path, self._index_path)
+
+        except Exception as e:
+            raise StorageError(f"Failed to save keystore index: {str(e)}")
+
+    def _append_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """Append key records and record their offsets in the index."""
+        if not entries:
+            return
+
+        with open(self._keys_path, 'ab') as f:
+            offset = f.tell()
+            for entry in entries:
+                record = json.dumps({
+                    "address": entry["address"],
+                    "private_key": entry["private_key"],
+                    "encryption_key": entry["encryption_key"]
+                }, separators=(",", ":")).encode() + b"\n"
+                f.write(record)
+
+                self._entries[entry["address"]] = {
+                    "public_key": entry["public_key"],
+                    "fractal_coord": entry["fractal_coord"],
+                    "balance": entry["balance"],
+                    "offset": offset,
+                    "length": len(record)
+                }
+                offset += len(record)
+
+    def _load_private_key(self, address: str) -> bytes:
+        """Read and decrypt a single key record."""
+        entry = self._get_entry(address)
+        with open(self._keys_path, 'rb') as f:
+            f.seek(entry["offset"])
+            record = json.loads(f.read(entry["length"]))
+
+        if record.get("address") != address:
+            raise StorageError(f"Key record mismatch for {address}")
+
+        return _decrypt_private_key(record["private_key"], record["encryption_key"])
+
+    def _get_entry(self, address: str) -> Dict[str, Any]:
+        entry = self._entries.get(address)
+        if entry is None:
+            raise StorageError(f"Unknown address: {address}")
+        return entry
@@ -4,20 +4,23 @@ import time
 import json
 import base64
 import logging
-from typing import Dict, Tuple, Optional, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple, Optional, List, Any, Iterable, Union, Callable
 from dataclasses import dataclass, field
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.exceptions import InvalidSignature
 from cryptography.fernet import Fernet
-from blockchain.core import FractalCoordinate, Transaction
+from blockchain.core import FractalCoordinate, Transaction, MultiOutputTransaction
 
 # Wallet constants
 KEY_SIZE = 2048  # RSA key size in bits
 PUBLIC_EXPONENT = 65537  # Standard RSA public exponent
 ADDRESS_PREFIX = "TX"  # Prefix for wallet addresses
 ADDRESS_LENGTH = 32  # Length of wallet address (excluding prefix)
-TX_ID_RANDOM_BYTES = 4  # Number of random bytes for transaction IDs
+TX_ID_RANDOM_BYTES = 32  # Number of random bytes for transaction IDs (64 hex chars)
+PARALLEL_SIGN_THRESHOLD = 64  # Batches smaller than this are signed in-process
+SIGN_CHUNK_SIZE = 32  # Messages handed to a signing worker per round trip
 
 class WalletError(Exception):
     """Base exception for wallet-related errors."""
@@ -35,6 +38,117 @@ class StorageError(WalletError):
     """Raised when wallet storage/loading fails."""
     pass
 
+@dataclass
+class BatchItemResult:
+    """
+    Outcome of a single entry in a batch transaction request.
+    
+    Attributes:
+        index (int): Position of the entry in the input batch
+        transaction (Optional[Transaction]): Signed transaction, if successful
+        error (Optional[str]): Error message, if the entry failed
+    """
+    index: int
+    transaction: Optional[Transaction] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the entry produced a signed transaction."""
+        return self.error is None
+
+# Per-process private key used by batch signing workers
+_worker_private_key = None
+
+def _init_signing_worker(private_pem: bytes) -> None:
+    """
+    Load the signing key once per worker process.
+    
+    Args:
+        private_pem (bytes): Unencrypted PKCS8 PEM of the private key
+    """
+    global _worker_private_key
+    _worker_private_key = serialization.load_pem_private_key(
+        private_pem,
+        password=None
+    )
+
+def _sign_messages(messages: List[bytes]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """
+    Sign a chunk of messages with the worker's private key.
+    
+    Args:
+        messages (List[bytes]): Messages to sign
+        
+    Returns:
+        List[Tuple[Optional[str], Optional[str]]]: (signature, error) per message
+    """
+    results = []
+    for message in messages:
+        try:
+            results.append((_rsa_pss_sign(_worker_private_key, message), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+def _rsa_pss_sign(private_key: Any, message: bytes) -> str:
+    """
+    Sign a message with RSA-PSS and return the base64-encoded signature.
+    
+    Args:
+        private_key: RSA private key object
+        message (bytes): Message to sign
+        
+    Returns:
+        str: Base64-encoded signature
+    """
+    signature = private_key.sign(
+        message,
+        padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH
+        ),
+        hashes.SHA256()
+    )
+    return base64.b64encode(signature).decode()
+
+def _signing_message(tx: Transaction) -> bytes:
+    """
+    Build the byte string covered by a transaction signature.
+    
+    Args:
+        tx (Transaction): Transaction to build the message for
+        
+    Returns:
+        bytes: Message to sign or verify
+    """
+    message = f"{tx.tx_id}{tx.sender}{tx.receiver}{tx.amount}{tx.data}{tx.timestamp}"
+    if isinstance(tx, MultiOutputTransaction):
+        message += json.dumps(tx.outputs)
+    return message.encode()
+
+def _decrypt_private_key(encrypted_key: str, encryption_key: str) -> bytes:
+    """
+    Decrypt a Fernet-encrypted private key PEM.
+    
+    Args:
+        encrypted_key (str): Fernet token holding the private key PEM
+        encryption_key (str): Fernet key used to encrypt it
+        
+    Returns:
+        bytes: Unencrypted private key PEM
+    """
+    return Fernet(encryption_key.encode()).decrypt(encrypted_key.encode())
+
+def _new_tx_id() -> str:
+    """
+    Generate a random transaction ID accepted by Transaction validation.
+    
+    Returns:
+        str: 64-character hex transaction ID
+    """
+    return os.urandom(TX_ID_RANDOM_BYTES).hex()
+
 @dataclass
 class WalletState:
     """
@@ -72,6 +186,7 @@ class Wallet:
             KeyGenerationError: If key generation fails
         """
         self.logger = logging.getLogger("triadnet.wallet")
+        self._reset_keys()
         
         try:
             if load_path and os.path.exists(load_path):
@@ -88,6 +203,85 @@ class Wallet:
             self.logger.error(f"Failed to initialize wallet: {str(e)}")
             raise WalletError(f"Wallet initialization failed: {str(e)}")
             
+    def _reset_keys(self) -> None:
+        """Clear key material; keys are then loaded lazily from _key_source."""
+        self._private_key = None
+        self._public_key = None
+        self._private_pem: Optional[bytes] = None
+        self._key_source: Optional[Callable[[], bytes]] = None
+
+    @classmethod
+    def from_metadata(
+        cls,
+        address: str,
+        public_pem: str,
+        fractal_coord: Dict[str, Any],
+        balance: float,
+        key_source: Callable[[], bytes]
+    ) -> 'Wallet':
+        """
+        Build a wallet from stored metadata without touching the private key.
+        
+        The private key is obtained from ``key_source`` and parsed the first
+        time it is needed for signing.
+        
+        Args:
+            address (str): Wallet address
+            public_pem (str): Public key in PEM format
+            fractal_coord (Dict[str, Any]): Fractal coordinate dictionary
+            balance (float): Last known balance
+            key_source (Callable[[], bytes]): Returns the unencrypted private key PEM
+            
+        Returns:
+            Wallet: Wallet with lazily loaded keys
+        """
+        wallet = cls.__new__(cls)
+        wallet.logger = logging.getLogger("triadnet.wallet")
+        wallet._reset_keys()
+        wallet._key_source = key_source
+        wallet._public_pem = public_pem.encode()
+        wallet.address = address
+        wallet.fractal_coord = FractalCoordinate.from_dict(fractal_coord)
+        wallet.state = WalletState(balance=balance)
+        return wallet
+
+    def _get_private_pem(self) -> bytes:
+        """
+        Get the unencrypted private key PEM, decrypting it on first use.
+        
+        Returns:
+            bytes: Private key PEM
+            
+        Raises:
+            StorageError: If no private key is available or decryption fails
+        """
+        if self._private_pem is None:
+            if self._key_source is None:
+                raise StorageError("No private key available")
+            try:
+                self._private_pem = self._key_source()
+                self._key_source = None
+            except Exception as e:
+                raise StorageError(f"Failed to decrypt private key: {str(e)}")
+        return self._private_pem
+
+    @property
+    def private_key(self) -> Any:
+        """RSA private key, parsed on first use."""
+        if self._private_key is None:
+            self._private_key = serialization.load_pem_private_key(
+                self._get_private_pem(),
+                password=None
+            )
+        return self._private_key
+
+    @property
+    def public_key(self) -> Any:
+        """RSA public key, parsed on first use."""
+        if self._public_key is None:
+            self._public_key = serialization.load_pem_public_key(self._public_pem)
+        return self._public_key
+
     def _generate_keypair(self) -> None:
         """
         Generate a new RSA keypair.
@@ -101,8 +295,8 @@ class Wallet:
                 key_size=KEY_SIZE
             )
             
-            self.private_key = private_key
-            self.public_key = private_key.public_key()
+            self._private_key = private_key
+            self._public_key = private_key.public_key()
             
             # Store serialized versions
             self._private_pem = private_key.private_bytes(
@@ -168,23 +362,8 @@ class Wallet:
             if not isinstance(tx, Transaction):
                 raise TransactionError("Invalid transaction type")
                 
-            # Create message from transaction data
-            message = (
-                f"{tx.tx_id}{tx.sender}{tx.receiver}{tx.amount}{tx.data}{tx.timestamp}"
-            ).encode()
-            
-            # Sign with RSA-PSS
-            signature = self.private_key.sign(
-                message,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
-            
-            # Store base64-encoded signature
-            tx.signature = base64.b64encode(signature).decode()
+            # Sign with RSA-PSS and store base64-encoded signature
+            tx.signature = _rsa_pss_sign(self.private_key, _signing_message(tx))
             self.logger.debug(f"Signed transaction {tx.tx_id[:8]}...")
             
             return tx
@@ -223,23 +402,181 @@ class Wallet:
             if self.state.balance < amount:
                 raise TransactionError("Insufficient funds")
                 
-            tx = Transaction(
-                tx_id=f"tx-{int(time.time())}-{os.urandom(TX_ID_RANDOM_BYTES).hex()}",
+            tx = self._build_transaction(receiver, amount, data)
+            
+            self.logger.info(
+                f"Creating transaction: {amount} to {receiver[:8]}..."
+            )
+            return self.sign_transaction(tx)
+            
+        except Exception as e:
+            self.logger.error(f"Transaction creation failed: {str(e)}")
+            raise TransactionError(str(e))
+
+    def _build_transaction(self, receiver: str, amount: float, data: str = "") -> Transaction:
+        """
+        Build an unsigned transaction from this wallet.
+        
+        Args:
+            receiver (str): Recipient's address
+            amount (float): Amount to send
+            data (str): Optional transaction data
+            
+        Returns:
+            Transaction: Unsigned transaction
+            
+        Raises:
+            TransactionError: If the transaction parameters are invalid
+        """
+        if not isinstance(receiver, str) or not receiver:
+            raise TransactionError("Invalid receiver address")
+            
+        if not isinstance(amount, (int, float)) or amount <= 0:
+            raise TransactionError("Amount must be positive")
+            
+        return Transaction(
+            tx_id=_new_tx_id(),
+            sender=self.address,
+            receiver=receiver,
+            amount=amount,
+            data=data,
+            timestamp=time.time()
+        )
+
+    def create_payout_transaction(
+        self,
+        outputs: List[Tuple[str, float]],
+        data: str = ""
+    ) -> MultiOutputTransaction:
+        """
+        Create and sign one transaction paying several receivers.
+        
+        Args:
+            outputs (List[Tuple[str, float]]): (receiver, amount) pairs to pay
+            data (str): Optional transaction data
+            
+        Returns:
+            MultiOutputTransaction: Signed multi-output transaction
+            
+        Raises:
+            TransactionError: If transaction creation fails
+        """
+        try:
+            tx = MultiOutputTransaction(
+                tx_id=_new_tx_id(),
                 sender=self.address,
-                receiver=receiver,
-                amount=amount,
+                outputs=outputs,
                 data=data,
                 timestamp=time.time()
             )
             
+            if self.state.balance < tx.amount:
+                raise TransactionError("Insufficient funds")
+                
             self.logger.info(
-                f"Creating transaction: {amount} to {receiver[:8]}..."
+                f"Creating payout transaction: {tx.amount} to {len(tx.outputs)} receivers"
             )
             return self.sign_transaction(tx)
             
         except Exception as e:
-            self.logger.error(f"Transaction creation failed: {str(e)}")
+            self.logger.error(f"Payout transaction creation failed: {str(e)}")
             raise TransactionError(str(e))
+
+    def create_transactions(
+        self,
+        batch: Iterable[Union[Tuple, Dict[str, Any]]],
+        max_workers: Optional[int] = None
+    ) -> List[BatchItemResult]:
+        """
+        Create and sign many transactions, signing in parallel.
+        
+        Each batch entry is either a ``(receiver, amount[, data])`` tuple or a
+        dict with ``receiver``, ``amount`` and optional ``data`` keys. Entries
+        are checked against the wallet balance cumulatively, in input order.
+        
+        Large batches are signed on a process pool whose workers load the
+        private key once each; small batches are signed in-process.
+        
+        Args:
+            batch (Iterable[Union[Tuple, Dict[str, Any]]]): Transactions to create
+            max_workers (Optional[int]): Signing processes (defaults to CPU count)
+            
+        Returns:
+            List[BatchItemResult]: One result per entry, in input order. Failed
+            entries carry an error message instead of a transaction.
+            
+        Raises:
+            TransactionError: If the worker pool cannot be started
+        """
+        results: List[BatchItemResult] = []
+        pending: List[BatchItemResult] = []
+        remaining = self.state.balance
+        
+        for index, item in enumerate(batch):
+            result = BatchItemResult(index=index)
+            results.append(result)
+            try:
+                if isinstance(item, dict):
+                    receiver = item.get("receiver")
+                    amount = item.get("amount")
+                    data = item.get("data", "")
+                else:
+                    receiver, amount, *rest = item
+                    data = rest[0] if rest else ""
+                    
+                tx = self._build_transaction(receiver, amount, data)
+                if remaining < amount:
+                    raise TransactionError("Insufficient funds")
+                    
+                remaining -= amount
+                result.transaction = tx
+                pending.append(result)
+                
+            except Exception as e:
+                result.error = str(e)
+                
+        workers = max_workers or os.cpu_count() or 1
+        messages = [_signing_message(r.transaction) for r in pending]
+        
+        try:
+            if workers <= 1 or len(pending) < PARALLEL_SIGN_THRESHOLD:
+                signed = []
+                for message in messages:
+                    try:
+                        signed.append((_rsa_pss_sign(self.private_key, message), None))
+                    except Exception as e:
+                        signed.append((None, str(e)))
+            else:
+                chunks = [
+                    messages[i:i + SIGN_CHUNK_SIZE]
+                    for i in range(0, len(messages), SIGN_CHUNK_SIZE)
+                ]
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_signing_worker,
+                    initargs=(self._get_private_pem(),)
+                ) as executor:
+                    signed = [
+                        outcome
+                        for chunk in executor.map(_sign_messages, chunks)
+                        for outcome in chunk
+                    ]
+        except Exception as e:
+            self.logger.error(f"Batch signing failed: {str(e)}")
+            raise TransactionError(f"Batch signing failed: {str(e)}")
+            
+        for result, (signature, error) in zip(pending, signed):
+            if error is not None:
+                result.transaction = None
+                result.error = f"Failed to sign transaction: {error}"
+            else:
+                result.transaction.signature = signature
+                
+        failed = sum(1 for r in results if not r.ok)
+        self.logger.info(
+            f"Created {len(results) - failed} of {len(results)} batch transactions"
+        )
+        return results
     
     def verify_transaction(self, tx: Transaction) -> bool:
         """
@@ -262,10 +599,7 @@ class Wallet:
             if tx.sender != self.address:
                 return False
                 
-            message = (
-                f"{tx.tx_id}{tx.sender}{tx.receiver}{tx.amount}{tx.data}{tx.timestamp}"
-            ).encode()
-            
+            message = _signing_message(tx)
             signature = base64.b64decode(tx.signature)
             
             self.public_key.verify(
@@ -301,7 +635,7 @@ class Wallet:
             
             wallet_data = {
                 "address": self.address,
-                "private_key": cipher_suite.encrypt(self._private_pem).decode(),
+                "private_key": cipher_suite.encrypt(self._get_private_pem()).decode(),
                 "public_key": self._public_pem.decode(),
                 "fractal_coord": self.fractal_coord.to_dict(),
                 "balance": self.state.balance,
@@ -325,6 +659,8 @@ class Wallet:
         """
         Load wallet from encrypted file.
         
+        The private key stays encrypted until it is first needed for signing.
+        
         Args:
             path (str): Path to load wallet from
             
@@ -339,23 +675,11 @@ class Wallet:
             if not key:
                 raise StorageError("Missing encryption key")
                 
-            cipher_suite = Fernet(key.encode())
-            
-            # Load and decrypt keys
-            self._private_pem = cipher_suite.decrypt(
-                wallet_data["private_key"].encode()
-            )
+            # Defer decryption and key parsing until first use
+            encrypted_key = wallet_data["private_key"]
+            self._key_source = lambda: _decrypt_private_key(encrypted_key, key)
             self._public_pem = wallet_data["public_key"].encode()
             
-            # Load key objects
-            self.private_key = serialization.load_pem_private_key(
-                self._private_pem,
-                password=None
-            )
-            self.public_key = serialization.load_pem_public_key(
-                self._public_pem
-            )
-            
             # Load wallet data
             self.address = wallet_data["address"]
             self.fractal_coord = FractalCoordinate.from_dict(
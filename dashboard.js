@@ -1,6 +1,5 @@
 class DashboardController {
   constructor() {
-    this.updateInterval = 3000; // Update every 3 seconds
     this.connectionStatus = 'Disconnected';
     this.ws = null;
     this.reconnectAttempts = 0;
@@ -238,15 +237,9 @@ class DashboardController {
   startUpdates() {
     if (!this.ws || this.ws.readyState !== WebSocket.OPEN) return;
     
-    // Request initial data
+    // The server pushes the full state on connect and then only the
+    // sections that changed, so there is nothing to poll
     this.ws.send(JSON.stringify({ action: 'get_dashboard_data' }));
-    
-    // Set up periodic updates
-    this.updateInterval = setInterval(() => {
-      if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-        this.ws.send(JSON.stringify({ action: 'get_dashboard_data' }));
-      }
-    }, this.updateInterval);
   }
 }
 
@@ -1,153 +1,282 @@
 import asyncio
 import json
+import logging
 import websockets
 import datetime
 from pathlib import Path
 import sys
+from typing import Any, Dict, Optional, Set
 
 # Add the project root to Python path
 project_root = str(Path(__file__).parent.absolute())
 if project_root not in sys.path:
     sys.path.append(project_root)
 
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.events import EVENT_BLOCK, EVENT_TRANSACTION
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.logs import configure_logging
+from blockchain.mining.mine import Miner
+from blockchain.wallet import Wallet
+
+# Dashboard constants
+SNAPSHOT_INTERVAL = 0.25  # Minimum seconds between snapshots; changes in between are coalesced
+REFRESH_INTERVAL = 2.0  # Seconds between snapshots when no chain event arrives
+RECENT_ITEMS = 5  # Pending transactions and blocks shown
+
+logger = logging.getLogger("triadnet.dashboard")
+
+class DashboardClient:
+    """
+    A connected dashboard and the update waiting to be sent to it.
+
+    Updates are section-level diffs of the dashboard data, so a newer diff
+    simply replaces the sections of an older one. If the client is still
+    busy receiving when the next diff arrives, the two are merged and the
+    client gets one message with the latest state instead of a backlog.
+    """
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.pending: Optional[Dict[str, Any]] = None
+        self.encoded: Optional[str] = None
+        self.wakeup = asyncio.Event()
+
+    def queue(self, diff: Dict[str, Any], encoded: str) -> None:
+        if self.pending is None:
+            self.pending, self.encoded = diff, encoded
+        else:
+            self.pending = {**self.pending, **diff}
+            self.encoded = None
+        self.wakeup.set()
+
+    async def send_loop(self):
+        try:
+            while True:
+                await self.wakeup.wait()
+                self.wakeup.clear()
+                diff, encoded = self.pending, self.encoded
+                self.pending = self.encoded = None
+                if diff is not None:
+                    # Shared encoding unless this client needed a merged diff
+                    await self.websocket.send(encoded if encoded is not None else json.dumps(diff))
+        except websockets.exceptions.ConnectionClosed:
+            # The receiving side of handle_websocket cleans up the client
+            logger.debug("Dashboard client closed while sending")
+
 class DashboardServer:
-    def __init__(self):
-        self.active_miners = set()
+    """
+    Serves live chain and miner state to websocket dashboards.
+
+    One snapshot is computed per change, when the chain's event bus
+    publishes a block or transaction (or every REFRESH_INTERVAL for stats
+    that change without events), and at most once per SNAPSHOT_INTERVAL.
+    Each snapshot is diffed against the previous one and only the changed
+    sections are pushed, encoded once for every client. New clients get the
+    full snapshot; ``get_dashboard_data`` requests are answered from it.
+    """
+
+    def __init__(self, blockchain: Optional[Blockchain] = None, miner: Optional[Miner] = None, node=None):
+        self.miner = miner
+        self.blockchain = blockchain or (miner.blockchain if miner else Blockchain())
+        self.node = node
         self.mining_config = {
             'threads': 4,
             'algorithm': 'mandelbrot'
         }
-        # Simulated data for testing
-        self.chain_height = 0
-        self.difficulty = 1
-        self.rewards = 0
-        self.hash_rate = 0
-        self.connected_nodes = 0
-        self.block_time = 0
-        self.network_hashrate = 0
-        self.active_miner_count = 0
-        self.pending_transactions = []
-        self.mining_logs = []
+        self.clients: Set[DashboardClient] = set()
+        self.snapshot: Dict[str, Any] = {}
+        self.snapshots_computed = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._dirty = False
+        self._subscription: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Take the first snapshot and start following chain events."""
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self.refresh()
+        self._subscription = self.blockchain.events.subscribe(
+            self._on_event, kinds=[EVENT_BLOCK, EVENT_TRANSACTION]
+        )
+        self._task = asyncio.ensure_future(self._snapshot_loop())
+
+    async def stop(self):
+        if self._subscription is not None:
+            self.blockchain.events.unsubscribe(self._subscription)
+            self._subscription = None
+        if self._task:
+            self._task.cancel()
+
+    def _on_event(self, event):
+        # Runs on the publishing thread, often the miner's; wake the loop
+        # once per batch of events rather than once per event
+        if not self._dirty:
+            self._dirty = True
+            self._loop.call_soon_threadsafe(self._changed.set)
+
+    def _mark_changed(self):
+        self._dirty = True
+        self._changed.set()
+
+    async def _snapshot_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), REFRESH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+            self._dirty = False
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error("Dashboard snapshot failed: %s", e)
+            await asyncio.sleep(SNAPSHOT_INTERVAL)
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Take a snapshot and push the sections that changed to every client.
+
+        Returns:
+            Dict[str, Any]: The changed sections
+        """
+        snapshot = self.get_dashboard_data()
+        self.snapshots_computed += 1
+        diff = {key: value for key, value in snapshot.items() if self.snapshot.get(key) != value}
+        self.snapshot = snapshot
+        if diff and self.clients:
+            encoded = json.dumps(diff)
+            for client in self.clients:
+                client.queue(diff, encoded)
+        return diff
 
     async def handle_websocket(self, websocket):
+        client = DashboardClient(websocket)
+        client.queue(self.snapshot, json.dumps(self.snapshot))
+        self.clients.add(client)
+        sender = asyncio.ensure_future(client.send_loop())
         try:
             async for message in websocket:
                 data = json.loads(message)
                 response = await self.process_message(data)
                 await websocket.send(json.dumps(response))
         except websockets.exceptions.ConnectionClosed:
-            print("Client disconnected")
+            logger.info("Dashboard client disconnected")
         except Exception as e:
-            print(f"Error: {e}")
+            logger.error("Dashboard client error: %s", e)
+        finally:
+            self.clients.discard(client)
+            sender.cancel()
 
     async def process_message(self, data):
         action = data.get('action')
-        
+
         if action == 'get_dashboard_data':
-            return await self.get_dashboard_data()
-        
+            return self.snapshot
+
         elif action == 'start_mining':
             config = data.get('config', {})
             return await self.start_mining(config)
-        
+
         elif action == 'stop_mining':
             return await self.stop_mining()
-        
+
         elif action == 'update_threads':
             threads = data.get('threads')
             return await self.update_threads(threads)
-        
+
         elif action == 'update_algorithm':
             algorithm = data.get('algorithm')
             return await self.update_algorithm(algorithm)
-        
+
         return {'error': 'Invalid action'}
 
-    async def get_dashboard_data(self):
-        # Simulate changing data
-        self.chain_height += 1
-        self.difficulty = max(1, self.difficulty + 0.1)
-        self.rewards += 0.5
-        self.hash_rate = 1000 + (self.chain_height * 100)
-        self.connected_nodes = min(10, self.chain_height // 10)
-        self.block_time = 60 - min(30, self.chain_height // 10)
-        self.network_hashrate = self.hash_rate * max(1, self.connected_nodes)
-        self.active_miner_count = min(5, self.chain_height // 20)
-
-        # Simulate transactions
-        if len(self.pending_transactions) < 5 and self.chain_height % 3 == 0:
-            tx_hash = f"0x{self.chain_height:064x}"
-            self.pending_transactions.append({
-                'timestamp': datetime.datetime.now(),
-                'hash': tx_hash,
-                'amount': round(0.1 * self.chain_height, 2)
-            })
-
-        # Simulate mining logs
-        if len(self.mining_logs) < 5:
-            log_entry = {
-                'timestamp': datetime.datetime.now(),
-                'hash': f"0x{self.chain_height:064x}",
-                'x': self.chain_height * 0.1,
-                'y': self.chain_height * 0.2,
-                'status': 'Mining...' if self.chain_height % 2 == 0 else 'Found block!'
-            }
-            self.mining_logs.append(log_entry)
-        
+    def get_dashboard_data(self) -> Dict[str, Any]:
+        """
+        Compute the dashboard data from the chain, miner and node.
+
+        Called once per snapshot, never per client request.
+        """
+        chain = self.blockchain.chain
+        stats = self.blockchain.stats
+        mining = self.miner is not None and self.miner.get_status()['active']
+        if self.miner is not None:
+            rewards = self.miner.stats.total_reward
+            hash_rate = self.miner.stats.hash_rate
+        else:
+            rewards, hash_rate = stats.total_rewards, 0.0
+        connected_nodes = len(self.node.connected_peers) if self.node is not None else 0
+
         return {
             'mining_stats': {
-                'chain_height': self.chain_height,
-                'difficulty': round(self.difficulty, 2),
-                'rewards': round(self.rewards, 2),
-                'hash_rate': f"{self.hash_rate:,}"
+                'chain_height': chain[-1].index if chain else 0,
+                'difficulty': self.blockchain.difficulty,
+                'rewards': round(rewards, 2),
+                'hash_rate': f"{hash_rate:,.2f}"
             },
             'network_stats': {
-                'connected_nodes': self.connected_nodes,
-                'avg_block_time': round(self.block_time, 2),
-                'network_hashrate': f"{self.network_hashrate:,}",
-                'active_miners': self.active_miner_count
+                'connected_nodes': connected_nodes,
+                'avg_block_time': round(stats.average_block_time, 2),
+                'network_hashrate': f"{hash_rate:,.2f}",
+                'active_miners': int(mining)
             },
             'transactions': [{
-                'timestamp': tx['timestamp'].strftime('%H:%M:%S'),
-                'hash': tx['hash'][:16] + '...',
-                'amount': tx['amount']
-            } for tx in self.pending_transactions[-5:]],
+                'timestamp': datetime.datetime.fromtimestamp(tx.timestamp).strftime('%H:%M:%S'),
+                'hash': tx.tx_id[:16] + '...',
+                'amount': round(tx.amount, 2)
+            } for tx in self.blockchain.pending_transactions[-RECENT_ITEMS:]],
             'mining_log': [{
-                'timestamp': log['timestamp'].strftime('%H:%M:%S'),
-                'hash': log['hash'][:16] + '...',
-                'coordinates': f"({log['x']:.2f}, {log['y']:.2f})",
-                'status': log['status']
-            } for log in self.mining_logs[-5:]]
+                'timestamp': datetime.datetime.fromtimestamp(block.timestamp).strftime('%H:%M:%S'),
+                'hash': block.hash[:16] + '...',
+                'coordinates': f"({block.fractal_coord.a}, {block.fractal_coord.b}, {block.fractal_coord.c})",
+                'status': f"Block #{block.index}"
+            } for block in reversed(chain[-RECENT_ITEMS:])]
         }
 
     async def start_mining(self, config):
+        if self.miner is None:
+            return {'error': 'No miner attached'}
         threads = config.get('threads', 4)
         algorithm = config.get('algorithm', 'mandelbrot')
-        
+
         self.mining_config['threads'] = threads
         self.mining_config['algorithm'] = algorithm
-        
-        print(f"Started mining with {threads} threads using {algorithm} algorithm")
+
+        self.miner.start()
+        self._mark_changed()
+        logger.info("Started mining with %s threads using %s algorithm", threads, algorithm)
         return {'status': 'Mining started'}
 
     async def stop_mining(self):
-        print("Mining stopped")
+        if self.miner is None:
+            return {'error': 'No miner attached'}
+        # Miner.stop joins the mining thread; keep the event loop serving meanwhile
+        await asyncio.get_running_loop().run_in_executor(None, self.miner.stop)
+        self._mark_changed()
+        logger.info("Mining stopped")
         return {'status': 'Mining stopped'}
 
     async def update_threads(self, threads):
         self.mining_config['threads'] = threads
-        print(f"Updated thread count to {threads}")
+        logger.info("Updated thread count to %s", threads)
         return {'status': 'Thread count updated'}
 
     async def update_algorithm(self, algorithm):
         self.mining_config['algorithm'] = algorithm
-        print(f"Updated algorithm to {algorithm}")
+        logger.info("Updated algorithm to %s", algorithm)
         return {'status': 'Algorithm updated'}
 
 async def main():
-    dashboard = DashboardServer()
+    configure_logging()
+    blockchain = Blockchain()
+    miner = Miner(Wallet(), blockchain, FractalCoordinate(a=100, b=100, c=100))
+    dashboard = DashboardServer(blockchain, miner)
+    await dashboard.start()
     async with websockets.serve(dashboard.handle_websocket, 'localhost', 8765):
-        print("Dashboard WebSocket server started on ws://localhost:8765")
+        logger.info("Dashboard WebSocket server started on ws://localhost:8765")
         await asyncio.Future()  # run forever
 
 if __name__ == '__main__':
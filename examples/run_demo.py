@@ -1,5 +1,6 @@
 from triadnet.core import Wallet, Blockchain, FractalCoordinate, Transaction
 from triadnet.mine import Miner
+from triadnet.logs import configure_logging
 import time
 from datetime import datetime, timezone
 import random
@@ -12,6 +13,7 @@ def print_status_header(user_login: str):
     print("="*50 + "\n")
 
 def main():
+    configure_logging()
     user_login = "littlekickoffkittie"
     print_status_header(user_login)
     
@@ -54,13 +54,8 @@ class Miner:
         self._pending_transactions: Queue = Queue()
         self.stats = MiningStats()
         
-        # Setup logging
+        # Handlers belong to the application (see triadnet.logs.configure_logging)
         self.logger = logging.getLogger('triadnet.miner')
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
         
         self.logger.info(f"Miner initialized with address {wallet.address}")
         self.logger.info(f"Initial fractal coordinates: {fractal_coord}")
@@ -0,0 +1,50 @@
+"""Helpers shared by the test modules."""
+
+import asyncio
+import json
+import time
+from blockchain.core.transaction import Transaction
+from blockchain.core.block import Block
+from blockchain.core.blockchain import Blockchain, BLOCK_REWARD
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.network.rpc import RPCServer
+
+def mine_next(blockchain: Blockchain, transactions: list) -> Block:
+    block = Block(
+        index=len(blockchain.chain),
+        timestamp=time.time(),
+        transactions=[],
+        previous_hash=blockchain.last_block.hash,
+        miner="test_miner",
+        fractal_coord=FractalCoordinate(100, 100, 100)
+    )
+    block.transactions.append(
+        Transaction("network", "test_miner", BLOCK_REWARD, timestamp=block.timestamp)
+    )
+    block.transactions.extend(transactions)
+    merkle_root = block.merkle_root()
+    nonce = 0
+    while True:
+        block.nonce = nonce
+        block.hash = block.calculate_hash(merkle_root)
+        if block.hash.startswith("0" * blockchain.difficulty):
+            return block
+        nonce += 1
+
+async def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+def rpc_request(method: str, params=None, request_id=1) -> dict:
+    request = {"jsonrpc": "2.0", "method": method, "params": params or []}
+    if request_id is not None:
+        request["id"] = request_id
+    return request
+
+async def rpc_call(server: RPCServer, *requests):
+    body = requests[0] if len(requests) == 1 else list(requests)
+    response = await server.handle_request(json.dumps(body))
+    return None if response is None else json.loads(response)
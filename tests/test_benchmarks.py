@@ -0,0 +1,45 @@
+import os
+import pickle
+from benchmarks.fixtures import synthetic_chain, synthetic_mempool
+from benchmarks.suite import HIGHER, compare, metric
+
+def test_synthetic_chain_is_cached_and_repeatable(tmp_path):
+    """Test that synthetic chains are deterministic, cached, and rebuilt when the cache is stale."""
+    chain = synthetic_chain(20, cache_dir=str(tmp_path))
+    assert len(chain.chain) == 21 and chain.is_valid_chain()
+    assert [b.hash for b in synthetic_chain(20, cache_dir=None).chain] == [b.hash for b in chain.chain]
+
+    [path] = [os.path.join(tmp_path, name) for name in os.listdir(tmp_path)]
+    cached = synthetic_chain(20, cache_dir=str(tmp_path))
+    assert [b.hash for b in cached.chain] == [b.hash for b in chain.chain]
+
+    with open(path, "rb") as f:
+        blocks = pickle.load(f)
+    blocks[5].nonce += 1
+    with open(path, "wb") as f:
+        pickle.dump(blocks, f)
+    rebuilt = synthetic_chain(20, cache_dir=str(tmp_path))
+    assert [b.hash for b in rebuilt.chain] == [b.hash for b in chain.chain]
+
+    mempool = synthetic_mempool(50)
+    assert len({tx.tx_id for tx in mempool}) == 50
+    assert not {tx.tx_id for tx in mempool} & chain.stats.processed_tx_ids
+
+def test_compare_flags_regressions():
+    """Test that compare honours each metric's direction and threshold."""
+    def results(*metrics):
+        return {"version": 1, "metrics": {m["name"]: m for m in metrics}}
+
+    baseline = results(
+        metric("hash", 1.0), metric("balance", 1.0), metric("mine", 100.0, "hashes/s", HIGHER, 0.2),
+        metric("gone", 1.0)
+    )
+    current = results(
+        metric("hash", 1.05), metric("balance", 1.5), metric("mine", 50.0, "hashes/s", HIGHER, 0.2),
+        metric("added", 1.0)
+    )
+    statuses = {row["name"]: row["status"] for row in compare(baseline, current)}
+    assert statuses == {"hash": "ok", "balance": "regressed", "mine": "regressed", "gone": "missing", "added": "new"}
+
+    statuses = {row["name"]: row["status"] for row in compare(baseline, current, threshold=1.5)}
+    assert statuses["balance"] == "ok" and statuses["mine"] == "ok"
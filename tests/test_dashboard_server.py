@@ -0,0 +1,124 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+import websockets
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.transaction import Transaction
+from dashboard_server import DashboardClient, DashboardServer
+from tests.helpers import mine_next
+
+def test_dashboard_pushes_coalesced_diffs():
+    """Test that chain changes are pushed to every dashboard as section diffs."""
+    async def run():
+        blockchain = Blockchain(difficulty=1)
+        dashboard = DashboardServer(blockchain)
+        await dashboard.start()
+        server = await websockets.serve(dashboard.handle_websocket, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        clients = [await websockets.connect(f"ws://127.0.0.1:{port}") for _ in range(3)]
+        try:
+            for ws in clients:
+                initial = json.loads(await ws.recv())
+                assert initial["mining_stats"]["chain_height"] == 0
+                assert initial["transactions"] == []
+
+            computed = dashboard.snapshots_computed
+            txs = [Transaction("alice", "bob", float(i + 1)) for i in range(20)]
+            for tx in txs:
+                blockchain.add_pending_transaction(tx)
+
+            for ws in clients:
+                diff = json.loads(await asyncio.wait_for(ws.recv(), 5))
+                # Only the changed section, with the burst folded into one update
+                assert list(diff) == ["transactions"]
+                assert diff["transactions"][-1]["hash"] == txs[-1].tx_id[:16] + "..."
+
+            assert dashboard.snapshots_computed - computed <= 2
+
+            block = mine_next(blockchain, txs)
+            assert blockchain.add_block(block)
+            diff = json.loads(await asyncio.wait_for(clients[0].recv(), 5))
+            assert diff["mining_stats"]["chain_height"] == 1
+            assert diff["mining_log"][0]["hash"] == block.hash[:16] + "..."
+
+            # Requests are answered from the snapshot, not recomputed
+            await clients[1].send(json.dumps({"action": "get_dashboard_data"}))
+            while True:
+                reply = json.loads(await asyncio.wait_for(clients[1].recv(), 5))
+                if set(reply) == set(dashboard.snapshot):
+                    break
+            assert reply == dashboard.snapshot
+        finally:
+            for ws in clients:
+                await ws.close()
+            server.close()
+            await server.wait_closed()
+            await dashboard.stop()
+
+    asyncio.run(run())
+
+def test_slow_dashboard_client_gets_merged_diff():
+    """Test that diffs queued behind a busy client merge into one message."""
+    async def run():
+        client = DashboardClient(websocket=None)
+        client.queue({"transactions": [1]}, '{"transactions": [1]}')
+        client.queue({"mining_stats": {"chain_height": 2}}, "...")
+        client.queue({"transactions": [1, 2]}, "...")
+        assert client.pending == {"transactions": [1, 2], "mining_stats": {"chain_height": 2}}
+        assert client.encoded is None
+
+    asyncio.run(run())
+
+def test_closed_client_ends_send_loop_quietly():
+    """Test that a client closing mid-send ends its send loop without an unhandled error."""
+    class ClosedSocket:
+        async def send(self, message):
+            raise websockets.exceptions.ConnectionClosed(None, None)
+
+    async def run():
+        client = DashboardClient(ClosedSocket())
+        sender = asyncio.ensure_future(client.send_loop())
+        client.queue({"transactions": []}, "{}")
+        assert await asyncio.wait_for(sender, 5) is None
+
+    asyncio.run(run())
+
+def test_stop_mining_keeps_event_loop_responsive():
+    """Test that waiting for the miner to stop does not block other dashboard work."""
+    class SlowMiner:
+        def __init__(self):
+            self.blockchain = Blockchain(difficulty=1)
+            self.stats = SimpleNamespace(total_reward=0.0, hash_rate=0.0)
+            self.stopped_on = None
+
+        def get_status(self):
+            return {"active": False}
+
+        def stop(self):
+            self.stopped_on = threading.get_ident()
+            time.sleep(0.3)
+
+    async def run():
+        miner = SlowMiner()
+        dashboard = DashboardServer(miner=miner)
+        await dashboard.start()
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.ensure_future(tick())
+        try:
+            assert await dashboard.stop_mining() == {"status": "Mining stopped"}
+            assert ticks >= 10
+            assert miner.stopped_on != threading.get_ident()
+        finally:
+            ticker.cancel()
+            await dashboard.stop()
+
+    asyncio.run(run())
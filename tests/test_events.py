@@ -0,0 +1,89 @@
+import asyncio
+import json
+import threading
+import pytest
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.events import EVENT_BLOCK, EVENT_CONFIRMED, EVENT_TRANSACTION
+from blockchain.core.transaction import Transaction
+from blockchain.network.subscriptions import SubscriptionServer
+from tests.helpers import mine_next, wait_for
+
+def test_event_bus_filters_by_kind_and_address():
+    """Test firehose and address subscriptions on a chain's event bus."""
+    blockchain = Blockchain(difficulty=1)
+    received = {"all": [], "bob": [], "other": []}
+    bus = blockchain.events
+    bus.subscribe(lambda e: received["all"].append(e), kinds=[EVENT_BLOCK, EVENT_TRANSACTION])
+    bob = bus.subscribe(lambda e: received["bob"].append(e), addresses=["bob"])
+    bus.subscribe(lambda e: received["other"].append(e), addresses=[f"x{i}" for i in range(1000)])
+
+    def failing(event):
+        raise RuntimeError("subscriber bug")
+
+    bus.subscribe(failing, kinds=[EVENT_TRANSACTION])
+
+    to_bob = Transaction("alice", "bob", 5.0)
+    blockchain.add_pending_transaction(to_bob)
+    blockchain.add_pending_transaction(Transaction("alice", "carol", 1.0))
+    block = mine_next(blockchain, [to_bob])
+    assert blockchain.add_block(block)
+
+    assert [e.kind for e in received["all"]] == [EVENT_TRANSACTION, EVENT_TRANSACTION, EVENT_BLOCK]
+    assert [e.kind for e in received["bob"]] == [EVENT_TRANSACTION, EVENT_CONFIRMED]
+    assert received["bob"][1].data["block_hash"] == block.hash
+    assert received["other"] == []
+    # One shared event object, encoded once, for every matching subscriber
+    assert received["all"][0] is received["bob"][0]
+
+    assert bus.unsubscribe(bob) is True
+    assert bus.unsubscribe(bob) is False
+    assert "bob" not in bus._by_address
+    with pytest.raises(ValueError):
+        bus.subscribe(print, kinds=["nope"])
+    with pytest.raises(ValueError):
+        bus.subscribe(print)
+
+def test_subscription_server_streams_events():
+    """Test that subscribers get events published from another thread."""
+    async def run():
+        blockchain = Blockchain(difficulty=1)
+        server = SubscriptionServer(blockchain.events, port=0)
+        await server.start()
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+
+        async def command(message):
+            writer.write(json.dumps(message).encode() + b"\n")
+            return json.loads(await reader.readline())
+
+        try:
+            blocks = (await command({"id": 1, "subscribe": ["block"]}))["subscription"]
+            watch = (await command({"id": 2, "addresses": ["bob"]}))["subscription"]
+            assert (await command({"id": 3, "subscribe": ["nope"]}))["error"]
+            assert (await command({"id": 4, "unsubscribe": 999}))["error"]
+
+            tx = Transaction("alice", "bob", 5.0)
+            block = mine_next(blockchain, [tx])
+
+            def mine():
+                blockchain.add_pending_transaction(tx)
+                blockchain.add_block(block)
+
+            # Publish from a thread, as the miner does
+            thread = threading.Thread(target=mine)
+            thread.start()
+            thread.join()
+
+            events = [json.loads(await reader.readline()) for _ in range(3)]
+            assert [(e["subscription"], e["event"]) for e in events] == [
+                (watch, EVENT_TRANSACTION), (blocks, EVENT_BLOCK), (watch, EVENT_CONFIRMED)
+            ]
+            assert events[1]["data"]["hash"] == block.hash
+
+            assert (await command({"id": 5, "unsubscribe": watch}))["result"] is True
+            writer.close()
+            await wait_for(lambda: server.client_count == 0 and len(blockchain.events) == 0)
+        finally:
+            writer.close()
+            await server.stop()
+
+    asyncio.run(run())
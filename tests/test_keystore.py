@@ -0,0 +1,80 @@
+import json
+import os
+import shutil
+import pytest
+from blockchain.wallet import keystore
+from blockchain.wallet.keystore import Keystore
+from blockchain.wallet.wallet import StorageError, Wallet
+
+SAVED_WALLETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "saved_wallets")
+
+@pytest.fixture(scope="module")
+def wallets():
+    return [Wallet() for _ in range(3)]
+
+def test_index_is_loaded_without_keys(tmp_path, wallets):
+    """Test that a reopened keystore serves metadata from the index and decrypts a key only to sign."""
+    store = Keystore(str(tmp_path))
+    wallets[0].state.balance = 12.5
+    store.add_wallet(wallets[0])
+
+    reopened = Keystore(str(tmp_path))
+    assert len(reopened) == 1 and wallets[0].address in reopened
+    metadata = reopened.get_metadata(wallets[0].address)
+    assert metadata["public_key"] == wallets[0].get_public_key_str() and metadata["balance"] == 12.5
+
+    wallet = reopened.get_wallet(wallets[0].address)
+    assert wallet is reopened.get_wallet(wallets[0].address)
+    assert wallet._private_pem is None and wallet._private_key is None
+
+    wallet.state.balance = 10.0
+    tx = wallet.create_transaction("TXreceiver", 1.0)
+    assert wallet._private_pem is not None and wallet._key_source is None
+    assert wallets[0].verify_transaction(tx) and wallet.verify_transaction(tx)
+    tx.amount = 2.0
+    assert not wallets[0].verify_transaction(tx)
+
+    with pytest.raises(StorageError):
+        reopened.get_wallet("TXunknown")
+
+def test_bulk_import_of_saved_wallets(tmp_path, wallets, monkeypatch):
+    """Test that saved wallet files are imported in parallel, skipping known addresses and reporting bad files."""
+    saved = tmp_path / "saved_wallets"
+    saved.mkdir()
+    for n, wallet in enumerate(wallets):
+        wallet.save(str(saved / f"wallet_{n}.json"))
+    shutil.copy(os.path.join(SAVED_WALLETS, "wallet.json"), saved / "legacy.json")
+
+    store = Keystore(str(tmp_path / "store"))
+    store.add_wallet(wallets[0])
+    monkeypatch.setattr(keystore, "IMPORT_CHUNK_SIZE", 1)
+    result = store.import_wallet_files(sorted(str(path) for path in saved.glob("*.json")), max_workers=2)
+
+    assert result.imported == [wallets[1].address, wallets[2].address]
+    assert result.skipped == [wallets[0].address]
+    assert list(result.errors) == [str(saved / "legacy.json")]
+
+    reopened = Keystore(str(tmp_path / "store"))
+    assert sorted(reopened.addresses()) == sorted(w.address for w in wallets)
+    tx = reopened.get_wallet(wallets[2].address).sign_transaction(wallets[2]._build_transaction("TXreceiver", 1.0))
+    assert wallets[2].verify_transaction(tx)
+
+def test_failed_index_save_keeps_previous_index(tmp_path, wallets, monkeypatch):
+    """Test that an index write that fails part way leaves the previous index in place."""
+    store = Keystore(str(tmp_path))
+    store.add_wallet(wallets[0])
+    with open(tmp_path / keystore.INDEX_FILE) as f:
+        before = f.read()
+
+    def failing_dump(obj, f, **kwargs):
+        f.write(json.dumps(obj)[:20])
+        raise OSError("disk full")
+
+    monkeypatch.setattr(keystore.json, "dump", failing_dump)
+    with pytest.raises(StorageError):
+        store.add_wallet(wallets[1])
+    monkeypatch.undo()
+
+    with open(tmp_path / keystore.INDEX_FILE) as f:
+        assert f.read() == before
+    assert Keystore(str(tmp_path)).addresses() == [wallets[0].address]
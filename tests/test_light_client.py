@@ -0,0 +1,118 @@
+import pytest
+import time
+from blockchain.core.transaction import Transaction
+from blockchain.core.block import Block
+from blockchain.core.blockchain import Blockchain, BLOCK_REWARD
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.core.light_client import LightClient, HeaderValidationError
+
+def _add_block(blockchain: Blockchain, transactions: list) -> Block:
+    block = Block(
+        index=len(blockchain.chain),
+        timestamp=time.time(),
+        transactions=[],
+        previous_hash=blockchain.last_block.hash,
+        miner="test_miner",
+        fractal_coord=FractalCoordinate(100, 100, 100)
+    )
+    block.transactions.append(
+        Transaction("network", "test_miner", BLOCK_REWARD, timestamp=block.timestamp)
+    )
+    block.transactions.extend(transactions)
+
+    nonce = 0
+    while True:
+        block.nonce = nonce
+        block.hash = block.calculate_hash()
+        if block.hash.startswith("0" * blockchain.difficulty):
+            break
+        nonce += 1
+
+    assert blockchain.add_block(block) is True
+    return block
+
+def _light_client(blockchain: Blockchain) -> LightClient:
+    return LightClient(blockchain.chain[0].header(), blockchain.difficulty)
+
+def test_block_header_hash():
+    """Test that the header alone reproduces the block hash."""
+    blockchain = Blockchain(difficulty=1)
+    block = _add_block(blockchain, [Transaction("alice", "bob", 5.0)])
+    header = block.header()
+    assert header.calculate_hash() == block.hash
+
+    # Changing a transaction changes the Merkle root and so the hash
+    block.transactions[1].amount = 6.0
+    assert block.calculate_hash() != block.hash
+    assert blockchain.is_valid_chain() is False
+
+def test_light_client_sync_and_payment():
+    """Test header sync, payment confirmation and confirmation depth."""
+    blockchain = Blockchain(difficulty=1)
+    payment = Transaction("alice", "bob", 5.0)
+    other = Transaction("carol", "dave", 1.0)
+    for i in range(3):
+        _add_block(blockchain, [Transaction(f"s{i}", f"r{i}", 1.0)])
+    _add_block(blockchain, [payment])
+
+    client = _light_client(blockchain)
+    assert client.sync(blockchain, batch_size=2) == 4
+    assert client.height == 4
+    assert client.tip_hash == blockchain.last_block.hash
+    assert client.get_header(4)["previous_hash"] == blockchain.chain[3].hash
+    assert client.memory_per_header < 100
+
+    assert client.verify_payment(payment, blockchain) is True
+    assert client.verify_payment(payment, blockchain, min_confirmations=2) is False
+    assert client.verify_payment(other, blockchain) is False
+
+    # A proof for a tampered copy of the payment must not verify
+    forged = Transaction.from_dict(payment.to_dict())
+    forged.amount = 500.0
+    assert client.verify_payment(forged, blockchain) is False
+
+    _add_block(blockchain, [])
+    assert client.sync(blockchain) == 1
+    assert client.verify_payment(payment, blockchain, min_confirmations=2) is True
+
+def test_light_client_rejects_invalid_headers():
+    """Test proof of work and linkage checks on incoming headers."""
+    blockchain = Blockchain(difficulty=1)
+    first = _add_block(blockchain, [])
+    second = _add_block(blockchain, [])
+
+    client = _light_client(blockchain)
+    with pytest.raises(HeaderValidationError):
+        client.add_header(second.header())
+
+    tampered = first.header()
+    tampered.nonce += 1
+    with pytest.raises(HeaderValidationError):
+        client.add_header(tampered)
+
+    client.add_header(first.header())
+    assert client.height == 1
+
+def test_proof_position_is_bounded_by_header():
+    """Test that a provider cannot place the duplicated last leaf past the committed transaction count."""
+    blockchain = Blockchain(difficulty=1)
+    payment = Transaction("alice", "bob", 5.0)
+    block = _add_block(blockchain, [Transaction("carol", "dave", 1.0), payment])
+    client = _light_client(blockchain)
+    client.sync(blockchain)
+    assert client.get_header(1)["tx_count"] == 3
+
+    header = block.header()
+    header.tx_count = 4
+    assert header.calculate_hash() != block.hash
+
+    class InflatingProvider:
+        def get_merkle_proof(self, tx_id):
+            proof = blockchain.get_merkle_proof(tx_id)
+            # In a tree of [a, b, c, c] the duplicate sits at index 3 with the same siblings
+            proof["index"] = 3
+            proof["leaf_count"] = 4
+            return proof
+
+    assert client.verify_payment(payment, blockchain) is True
+    assert client.verify_payment(payment, InflatingProvider()) is False
@@ -0,0 +1,54 @@
+import pytest
+from blockchain.core.blockchain import MAX_PENDING_TRANSACTIONS
+from benchmarks.fixtures import synthetic_mempool
+from tools.loadgen import LATENCY_PERCENTILES, SUBMIT_DIRECT, SUBMIT_RPC, LoadGenerator
+
+def test_load_is_confirmed_with_latencies():
+    """Test that offered transactions are signed, accepted, mined and timed."""
+    generator = LoadGenerator([20.0], step=1.5, wallets=2, difficulty=1, drain=3.0, seed=1)
+    assert generator.prepare() == 30
+    generator.run()
+    summary = generator.summary()
+
+    [step] = summary["steps"]
+    assert step["rejected"] == 0 and not step["saturated"]
+    assert summary["saturation_rate"] is None
+    assert step["unconfirmed"] < 30
+    assert set(step["latency_ms"]) == {f"p{pct}" for pct in LATENCY_PERCENTILES}
+    assert 0 < step["latency_ms"]["p50"] <= step["latency_ms"]["p99"]
+    assert summary["samples"] and summary["samples"][-1]["submitted"] == 30
+    mined = [tx for block in generator.blockchain.chain[1:] for tx in block.transactions if tx.sender != "network"]
+    senders = {wallet.address: wallet for wallet in generator._wallets}
+    assert mined and all(senders[tx.sender].verify_transaction(tx) for tx in mined)
+
+@pytest.mark.parametrize("submit", [SUBMIT_DIRECT, SUBMIT_RPC])
+def test_full_pool_is_reported_as_saturation(submit):
+    """Test that rejections from a full pending pool mark the step and time of saturation."""
+    generator = LoadGenerator([20.0], step=1.0, wallets=2, difficulty=1, drain=0.0, submit=submit, seed=1)
+    generator.miner.start = generator.miner.stop = lambda: None
+    for tx in synthetic_mempool(MAX_PENDING_TRANSACTIONS - 5):
+        generator.blockchain.add_pending_transaction(tx)
+    generator.run()
+    summary = generator.summary()
+
+    [step] = summary["steps"]
+    assert step["submitted_rate"] == 5.0
+    assert step["rejected"] == step["pool_full_rejections"] == 15
+    assert step["saturated"] and step["unconfirmed"] == 5
+    assert summary["saturation_rate"] == 20.0
+    assert 0 <= summary["saturation_time"] <= 1.0
+    assert summary["max_sustained_rate"] is None
+
+def test_other_rejections_are_not_pool_full():
+    """Test that rejections for reasons other than a full pool do not count as saturation."""
+    generator = LoadGenerator([20.0], step=1.0, wallets=2, difficulty=1, drain=0.0, seed=1)
+    generator.miner.start = generator.miner.stop = lambda: None
+    generator.prepare()
+    for tx in generator._transactions[:10]:
+        generator.blockchain.stats.processed_tx_ids.add(tx.tx_id)
+    for tx in synthetic_mempool(MAX_PENDING_TRANSACTIONS):
+        generator.blockchain.add_pending_transaction(tx)
+    generator.run()
+
+    [step] = generator.summary()["steps"]
+    assert step["rejected"] == 20 and step["pool_full_rejections"] == 10
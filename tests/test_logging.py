@@ -0,0 +1,75 @@
+import logging
+import threading
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.logs import LOG_RECORDS_DROPPED, LogRateLimiter, configure_logging, stop_logging
+from blockchain.mining.mine import Miner
+from blockchain.wallet import Wallet
+
+class _ListHandler(logging.Handler):
+    def __init__(self, gate=None):
+        super().__init__()
+        self.records = []
+        self.threads = set()
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.records.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+def test_queued_logging_has_one_handler():
+    """Test that records go through a single queue handler and are written on the listener thread."""
+    miner_logger = logging.getLogger("triadnet.miner")
+    blockchain = Blockchain(difficulty=1)
+    for _ in range(2):
+        Miner(Wallet(), blockchain, FractalCoordinate(100, 100, 100))
+    assert miner_logger.handlers == []
+
+    configure_logging(logging.INFO, [_ListHandler()])
+    handler = _ListHandler()
+    configure_logging(logging.INFO, [handler])
+    try:
+        assert len(logging.getLogger("triadnet").handlers) == 1
+        assert len(logging.getLogger("blockchain").handlers) == 1
+        miner_logger.info("Block %d mined", 7)
+        miner_logger.debug("Not written")
+        logging.getLogger("blockchain.core.transaction").warning("Invalid %s", "tx")
+    finally:
+        stop_logging()
+
+    assert [line.split(" - ", 1)[1] for line in handler.records] == [
+        "triadnet.miner - INFO - Block 7 mined",
+        "blockchain.core.transaction - WARNING - Invalid tx",
+    ]
+    assert threading.get_ident() not in handler.threads
+    assert logging.getLogger("triadnet").handlers == []
+
+def test_full_queue_drops_records():
+    """Test that a stalled sink makes logging drop records instead of blocking the caller."""
+    gate = threading.Event()
+    handler = _ListHandler(gate)
+    dropped = LOG_RECORDS_DROPPED.samples()[0][2]
+    configure_logging(logging.INFO, [handler], queue_size=2)
+    try:
+        logger = logging.getLogger("triadnet.miner")
+        for i in range(10):
+            logger.info("Record %d", i)
+        assert LOG_RECORDS_DROPPED.samples()[0][2] - dropped >= 7
+    finally:
+        gate.set()
+        stop_logging()
+    assert 1 <= len(handler.records) <= 3
+
+def test_rate_limiter():
+    """Test that the limiter allows one message per interval and counts the rest."""
+    now = [0.0]
+    limiter = LogRateLimiter(interval=10.0, clock=lambda: now[0])
+    assert limiter.allow() and limiter.suppressed == 0
+    now[0] = 5.0
+    assert not limiter.allow()
+    assert not limiter.allow()
+    now[0] = 10.0
+    assert limiter.allow() and limiter.suppressed == 2
+    assert not limiter.allow()
@@ -0,0 +1,64 @@
+import pytest
+from blockchain.crypto.merkle import (
+    MerkleTree, MerkleError, EMPTY_ROOT, hash_leaf, hash_pair, verify_proof
+)
+
+def _reference_root(leaves: list) -> bytes:
+    level = list(leaves)
+    while len(level) > 1:
+        if len(level) % 2 == 1:
+            level.append(level[-1])
+        level = [hash_pair(level[i], level[i + 1]) for i in range(0, len(level), 2)]
+    return level[0]
+
+def _leaves(n: int) -> list:
+    return [hash_leaf(str(i).encode()) for i in range(n)]
+
+def test_merkle_root_matches_reference():
+    """Test bulk construction against a straightforward level-by-level root."""
+    assert MerkleTree().root == EMPTY_ROOT
+    for n in range(1, 40):
+        leaves = _leaves(n)
+        assert MerkleTree(leaves).root == _reference_root(leaves)
+
+def test_merkle_incremental_append():
+    """Test that appending leaves one at a time matches bulk construction."""
+    tree = MerkleTree()
+    leaves = _leaves(70)
+    for n, leaf in enumerate(leaves, start=1):
+        tree.append(leaf)
+        assert len(tree) == n
+        assert tree.root == MerkleTree(leaves[:n]).root
+
+    extended = MerkleTree(leaves[:5])
+    extended.extend(leaves[5:])
+    assert extended.root == tree.root
+
+def test_merkle_proofs():
+    """Test inclusion proofs for every leaf and rejection of bad proofs."""
+    for n in (1, 2, 3, 7, 16, 33):
+        leaves = _leaves(n)
+        tree = MerkleTree(leaves)
+        for i, leaf in enumerate(leaves):
+            proof = tree.proof(i)
+            assert verify_proof(leaf, i, proof, tree.root, n)
+            if n > 1:
+                assert not verify_proof(hash_leaf(b"other"), i, proof, tree.root, n)
+
+    # The duplicated last leaf must not verify past the end of the tree
+    a, b, c = _leaves(3)
+    tree = MerkleTree([a, b, c])
+    assert tree.root == MerkleTree([a, b, c, c]).root
+    proof = tree.proof(2)
+    assert verify_proof(c, 2, proof, tree.root, 3)
+    assert not verify_proof(c, 3, proof, tree.root, 3)
+    assert not verify_proof(c, 2, proof + [tree.root], tree.root, 3)
+    assert not verify_proof(c, 2, proof[:1], hash_pair(c, c), 3)
+    assert not verify_proof(b, 2, [a] + proof[1:], tree.root, 3)
+    assert not verify_proof(c, 2, proof, tree.root, 2)
+
+    tree = MerkleTree(_leaves(4))
+    with pytest.raises(MerkleError):
+        tree.proof(4)
+    with pytest.raises(MerkleError):
+        MerkleTree([b"short"])
@@ -0,0 +1,84 @@
+import threading
+import urllib.request
+import pytest
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.transaction import Transaction
+from blockchain.metrics import MetricsError, MetricsRegistry, MetricsServer, REGISTRY
+from tests.helpers import mine_next
+
+def test_registry_renders_prometheus_text():
+    """Test counter, gauge and histogram exposition."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests served", ["path"])
+    requests.labels("/a").inc()
+    requests.labels('/"b"').inc(2)
+    depth = registry.gauge("queue_depth", "Items queued")
+    depth.set_function(lambda: 7)
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value)
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{path="/a"} 1.0' in text
+    assert 'requests_total{path="/\\"b\\""} 2.0' in text
+    assert "queue_depth 7.0" in text
+    assert 'latency_seconds_bucket{le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{le="1.0"} 3' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "latency_seconds_count 4" in text
+
+    assert registry.counter("requests_total", "Requests served", ["path"]) is requests
+    with pytest.raises(MetricsError):
+        registry.gauge("requests_total", "Requests served")
+    with pytest.raises(MetricsError):
+        requests.labels()
+    with pytest.raises(MetricsError):
+        requests.labels("/a").inc(-1)
+
+def test_chain_metrics_are_scraped():
+    """Test that chain activity shows up on the metrics endpoint."""
+    admitted = REGISTRY.get("triadnet_mempool_admitted_total").samples()[0][2]
+    blocks = REGISTRY.get("triadnet_blocks_added_total").samples()[0][2]
+
+    blockchain = Blockchain(difficulty=1)
+    tx = Transaction("alice", "bob", 5.0)
+    blockchain.add_pending_transaction(tx)
+    assert blockchain.add_block(mine_next(blockchain, [tx]))
+    blockchain.get_balance("bob")
+
+    server = MetricsServer(port=0)
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            text = response.read().decode()
+    finally:
+        server.stop()
+
+    assert f"triadnet_mempool_admitted_total {admitted + 1}" in text
+    assert f"triadnet_blocks_added_total {blocks + 1}" in text
+    assert "triadnet_chain_height 1.0" in text
+    assert "triadnet_add_block_seconds_count" in text
+    assert "triadnet_get_balance_seconds_count" in text
+
+def test_concurrent_updates_are_not_lost():
+    """Test that updates from several threads all count."""
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits")
+    histogram = registry.histogram("work_seconds", "Work", buckets=(1.0,))
+
+    def work():
+        for _ in range(20000):
+            counter.inc()
+            histogram.observe(0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    text = registry.render()
+    assert "hits_total 80000.0" in text
+    assert "work_seconds_count 80000" in text
+    assert "work_seconds_sum 40000.0" in text
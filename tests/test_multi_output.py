@@ -0,0 +1,124 @@
+import pytest
+import time
+from blockchain.core.transaction import (
+    Transaction, MultiOutputTransaction, TransactionValidationError,
+    MAX_TX_OUTPUTS, MULTI_OUTPUT_RECEIVER
+)
+from blockchain.core.block import Block
+from blockchain.core.blockchain import Blockchain, BlockchainError, BLOCK_REWARD
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.wallet.wallet import TransactionError, Wallet, _signing_message
+
+def _mine(block: Block, difficulty: int) -> Block:
+    nonce = 0
+    while True:
+        block.nonce = nonce
+        block.hash = block.calculate_hash()
+        if block.hash.startswith("0" * difficulty):
+            return block
+        nonce += 1
+
+def _block_with(blockchain: Blockchain, miner: str, transactions: list) -> Block:
+    block = Block(
+        index=len(blockchain.chain),
+        timestamp=time.time(),
+        transactions=[],
+        previous_hash=blockchain.last_block.hash,
+        miner=miner,
+        fractal_coord=FractalCoordinate(100, 100, 100)
+    )
+    block.transactions.append(
+        Transaction("network", miner, BLOCK_REWARD, timestamp=block.timestamp)
+    )
+    block.transactions.extend(transactions)
+    return _mine(block, blockchain.difficulty)
+
+def test_multi_output_creation():
+    """Test total amount, placeholder receiver and output validation."""
+    tx = MultiOutputTransaction(sender="pool", outputs=[("a", 1.0), ("b", 2.5)])
+    assert tx.amount == 3.5
+    assert tx.receiver == MULTI_OUTPUT_RECEIVER
+    assert tx.get_outputs() == [("a", 1.0), ("b", 2.5)]
+    assert len(tx.tx_id) == 64
+
+    # Hash commits to the outputs
+    other = MultiOutputTransaction(
+        sender="pool", outputs=[("a", 1.0), ("c", 2.5)], timestamp=tx.timestamp
+    )
+    assert other.tx_id != tx.tx_id
+
+    with pytest.raises(TransactionValidationError):
+        MultiOutputTransaction(sender="pool", outputs=[])
+    with pytest.raises(TransactionValidationError):
+        MultiOutputTransaction(sender="pool", outputs=[("a", 0)])
+    with pytest.raises(TransactionValidationError):
+        MultiOutputTransaction(sender="pool", outputs=[("", 1.0)])
+    with pytest.raises(TransactionValidationError):
+        MultiOutputTransaction(
+            sender="pool", outputs=[("a", 1.0)] * (MAX_TX_OUTPUTS + 1)
+        )
+
+def test_multi_output_serialization():
+    """Test dictionary round trips through Transaction and Block."""
+    tx = MultiOutputTransaction(sender="pool", outputs=[("a", 1.0), ("b", 2.0)])
+    restored = Transaction.from_dict(tx.to_dict())
+    assert isinstance(restored, MultiOutputTransaction)
+    assert restored.tx_id == tx.tx_id
+    assert restored.get_outputs() == tx.get_outputs()
+
+    plain = Transaction.from_dict(Transaction("x", "y", 1.0).to_dict())
+    assert not isinstance(plain, MultiOutputTransaction)
+
+    blockchain = Blockchain(difficulty=1)
+    block = _block_with(blockchain, "miner", [tx])
+    restored_block = Block.from_dict(block.to_dict())
+    assert isinstance(restored_block.transactions[1], MultiOutputTransaction)
+    assert restored_block.calculate_hash() == block.hash
+
+def test_multi_output_balances():
+    """Test that one payout transaction credits every output."""
+    blockchain = Blockchain(difficulty=1)
+    payees = [(f"worker{i}", 0.25) for i in range(200)]
+    payout = MultiOutputTransaction(sender="pool", outputs=payees)
+
+    assert blockchain.add_block(_block_with(blockchain, "pool", [payout])) is True
+    assert blockchain.get_balance("pool") == BLOCK_REWARD - 50.0
+    assert blockchain.get_balance("worker0") == 0.25
+    assert blockchain.get_balance("worker199") == 0.25
+    assert blockchain.is_valid_chain() is True
+
+def test_multi_output_reward_rejected():
+    """Test that mining rewards must have a single output."""
+    blockchain = Blockchain(difficulty=1)
+    block = Block(
+        index=len(blockchain.chain),
+        timestamp=time.time(),
+        transactions=[
+            MultiOutputTransaction(
+                sender="network", outputs=[("miner", BLOCK_REWARD / 2)] * 2
+            )
+        ],
+        previous_hash=blockchain.last_block.hash,
+        miner="miner",
+        fractal_coord=FractalCoordinate(100, 100, 100)
+    )
+    with pytest.raises(BlockchainError):
+        blockchain.add_block(_mine(block, blockchain.difficulty))
+
+def test_payout_is_signed_over_outputs():
+    """Test that a wallet payout signature covers every output."""
+    wallet = Wallet()
+    wallet.state.balance = 5.0
+    tx = wallet.create_payout_transaction([("TXa", 1.0), ("TXb", 2.5)], data="payout")
+    assert isinstance(tx, MultiOutputTransaction) and tx.sender == wallet.address
+    assert tx.amount == 3.5
+    assert _signing_message(tx).endswith(b'[["TXa", 1.0], ["TXb", 2.5]]')
+    assert wallet.verify_transaction(tx)
+
+    tx.outputs = [("TXa", 1.0), ("TXc", 2.5)]
+    assert not wallet.verify_transaction(tx)
+    tx.outputs = [("TXa", 2.5), ("TXb", 1.0)]
+    assert not wallet.verify_transaction(tx)
+
+    with pytest.raises(TransactionError):
+        wallet.create_payout_transaction([("TXa", 3.0), ("TXb", 2.5)])
@@ -0,0 +1,617 @@
+import asyncio
+import copy
+import time
+import pytest
+from blockchain.core.transaction import Transaction
+from blockchain.core import blockchain as blockchain_module
+from blockchain.core.blockchain import Blockchain, BlockchainError
+from blockchain.network import peer as peer_module
+from blockchain.network.node import Node
+from blockchain.network.peer import Peer
+from blockchain.network.ratelimit import TokenBucket
+from blockchain.network.sync import ChainSync, SyncError
+from blockchain.network.compression import (
+    COMPRESSION_NONE, COMPRESSION_ZLIB, COMPRESSION_LZMA, COMPRESSION_THRESHOLD, negotiate
+)
+from blockchain.network.inventory import INV_BLOCK, SeenCache
+from blockchain.network.reconcile import IBLT, ReconciliationError, RELAY_RECONCILE, short_key
+from blockchain.network.protocol import (
+    encode_message, read_message, ProtocolError, FRAME_HEADER, MSG_BLOCK, MSG_TX, MSG_TXS,
+    MSG_GETBODIES, MSG_GETBLOCKTXN, MSG_GETDATA, MSG_HEADERS, MSG_VERSION, PROTOCOL_VERSION,
+    PRIORITY_HIGH, PRIORITY_LOW
+)
+from tests.helpers import mine_next, wait_for
+
+async def _start_line(count: int, **kwargs) -> list:
+    nodes = [Node(f"node{i}", Blockchain(difficulty=1), port=0, **kwargs) for i in range(count)]
+    for node in nodes:
+        await node.start()
+    for left, right in zip(nodes, nodes[1:]):
+        right.add_peer(left.node_id, left.host, left.port)
+    # Each link is one outbound plus one inbound connection
+    await wait_for(lambda: sum(len(n.connected_peers) for n in nodes) == 2 * (count - 1))
+    return nodes
+
+def test_framing_round_trip():
+    """Test that large messages survive framing intact."""
+    async def run():
+        payload = {"blob": "x" * 100_000}
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_message(MSG_BLOCK, payload))
+        reader.feed_eof()
+        msg_type, decoded, size = await read_message(reader)
+        assert msg_type == MSG_BLOCK
+        assert decoded == payload
+        assert size > 100_000
+
+        bad = asyncio.StreamReader()
+        bad.feed_data(FRAME_HEADER.pack(2, 99, 0) + b"{}")
+        bad.feed_eof()
+        with pytest.raises(ProtocolError):
+            await read_message(bad)
+
+    asyncio.run(run())
+
+def test_transaction_and_block_relay():
+    """Test that transactions and blocks propagate across a line of nodes."""
+    async def run():
+        nodes = await _start_line(3)
+        try:
+            tx = Transaction("alice", "bob", 5.0)
+            assert await nodes[0].submit_transaction(tx) is True
+            await wait_for(lambda: any(
+                p.tx_id == tx.tx_id for p in nodes[2].blockchain.pending_transactions
+            ))
+
+            block = mine_next(nodes[0].blockchain, [tx])
+            assert nodes[0].blockchain.add_block(block)
+            await nodes[0].announce_block(block)
+            await wait_for(lambda: len(nodes[2].blockchain.chain) == 2)
+            assert nodes[2].blockchain.last_block.hash == block.hash
+            assert nodes[2].blockchain.pending_transactions == []
+        finally:
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_new_node_catches_up():
+    """Test that a late joiner downloads the chain headers-first."""
+    async def run():
+        seed_chain, late_chain = Blockchain(difficulty=1), Blockchain(difficulty=1)
+        for _ in range(5):
+            seed_chain.add_block(mine_next(seed_chain, []))
+
+        seed = Node("seed", seed_chain, port=0)
+        late = Node("late", late_chain, port=0)
+        await seed.start()
+        await late.start()
+        try:
+            late.add_peer(seed.node_id, seed.host, seed.port)
+            await wait_for(lambda: len(late.blockchain.chain) == 6)
+            assert late.blockchain.last_block.hash == seed_chain.last_block.hash
+        finally:
+            await late.stop()
+            await seed.stop()
+
+    asyncio.run(run())
+
+def test_broadcast_reuses_persistent_connection():
+    """Test that repeated broadcasts share one queued connection per peer."""
+    async def run():
+        nodes = await _start_line(2)
+        try:
+            for i in range(20):
+                assert await nodes[1].submit_transaction(Transaction(f"s{i}", "bob", 1.0))
+            await wait_for(lambda: len(nodes[0].blockchain.pending_transactions) == 20)
+
+            # Both directions of the link still run over the original connection
+            assert len(nodes[0].connected_peers) == 1
+            outbound = nodes[1].connected_peers[0]
+            assert outbound.outbound is True
+            # version, then one batched inv and one txs answering its getdata
+            assert outbound.messages_sent == 3
+            assert nodes[0].stats["messages.inv"] == 1
+            assert outbound.pending_frames == 0
+        finally:
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_outbound_connection_reconnects():
+    """Test that a dropped outbound connection is re-established."""
+    async def run():
+        nodes = await _start_line(2)
+        try:
+            first = nodes[1].connected_peers[0]
+            await first.close()
+            await wait_for(lambda: any(
+                peer is not first for peer in nodes[1].connected_peers
+            ))
+
+            tx = Transaction("alice", "bob", 5.0)
+            assert await nodes[1].submit_transaction(tx)
+            await wait_for(lambda: len(nodes[0].blockchain.pending_transactions) == 1)
+
+            nodes[1].remove_peer(nodes[0].node_id)
+            await wait_for(lambda: not nodes[1].connected_peers)
+        finally:
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_seen_cache_expiry_and_bound():
+    """Test that the seen cache forgets old and excess entries."""
+    now = [0.0]
+    cache = SeenCache(max_entries=3, ttl=10.0, clock=lambda: now[0])
+    assert cache.add("a") is True
+    assert cache.add("a") is False
+    cache.add("b")
+    cache.add("c")
+    cache.add("d")
+    assert "a" not in cache
+    assert len(cache) == 3
+
+    now[0] = 10.5
+    assert "d" not in cache
+    assert len(cache) == 0
+
+def test_inventory_gossip_sends_each_object_once():
+    """Test that a fully connected mesh delivers each transaction once per node."""
+    async def run():
+        nodes = [Node(f"node{i}", Blockchain(difficulty=1), port=0) for i in range(3)]
+        for node in nodes:
+            await node.start()
+        received = {node.node_id: 0 for node in nodes}
+        for node in nodes:
+            handler = node._handlers[MSG_TXS]
+
+            async def counting(peer, payload, handler=handler, node_id=node.node_id):
+                received[node_id] += len(payload["transactions"])
+                await handler(peer, payload)
+
+            node._handlers[MSG_TXS] = counting
+        try:
+            for i, node in enumerate(nodes):
+                for other in nodes[i + 1:]:
+                    other.add_peer(node.node_id, node.host, node.port)
+            await wait_for(lambda: all(len(n.connected_peers) == 2 for n in nodes))
+
+            tx = Transaction("alice", "bob", 5.0)
+            assert await nodes[0].submit_transaction(tx)
+            await wait_for(lambda: all(n.blockchain.pending_transactions for n in nodes))
+            await asyncio.sleep(0.1)
+            assert received == {"node0": 0, "node1": 1, "node2": 1}
+        finally:
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_add_blocks_batch():
+    """Test that a block batch is applied up to the first invalid block."""
+    source = Blockchain(difficulty=1)
+    for _ in range(4):
+        source.add_block(mine_next(source, []))
+
+    target = Blockchain(difficulty=1)
+    assert target.add_blocks(source.chain[1:3]) == 2
+    assert target.last_block.hash == source.chain[2].hash
+
+    with pytest.raises(BlockchainError):
+        target.add_blocks([source.chain[4]])
+    assert target.add_blocks(source.chain[3:]) == 2
+    assert target.is_valid_chain() is True
+
+def test_headers_first_sync_from_several_peers():
+    """Test that block bodies are fetched from several peers in parallel."""
+    async def run():
+        source = Blockchain(difficulty=1)
+        for _ in range(40):
+            source.add_block(mine_next(source, []))
+
+        seeds = []
+        requests = {}
+        for i in range(2):
+            chain = Blockchain(difficulty=1)
+            chain.add_blocks(source.chain[1:])
+            seed = Node(f"seed{i}", chain, port=0)
+            handler = seed._handlers[MSG_GETBODIES]
+            requests[seed.node_id] = 0
+
+            async def counting(peer, payload, handler=handler, node_id=seed.node_id):
+                requests[node_id] += 1
+                await handler(peer, payload)
+
+            seed._handlers[MSG_GETBODIES] = counting
+            await seed.start()
+            seeds.append(seed)
+
+        late = Node("late", Blockchain(difficulty=1), port=0)
+        await late.start()
+        try:
+            for seed in seeds:
+                late.add_peer(seed.node_id, seed.host, seed.port)
+            await wait_for(lambda: len(late.blockchain.chain) == 41)
+            assert late.blockchain.last_block.hash == source.last_block.hash
+            assert all(count > 0 for count in requests.values())
+
+            progress = late.sync.progress()
+            assert progress.blocks_downloaded == 40
+            assert progress.bytes_downloaded > 0
+            assert progress.blocks_per_second > 0
+            assert late.sync.syncing is False
+        finally:
+            await late.stop()
+            for seed in seeds:
+                await seed.stop()
+
+    asyncio.run(run())
+
+def test_competing_branch_headers_are_not_a_protocol_error():
+    """Test that headers from a competing branch raise SyncError and leave sync state untouched."""
+    ours, theirs = Blockchain(difficulty=1), Blockchain(difficulty=1)
+    ours.add_block(mine_next(ours, []))
+    for _ in range(3):
+        theirs.add_block(mine_next(theirs, []))
+    sync = ChainSync(ours, lambda: [])
+
+    with pytest.raises(SyncError):
+        sync._add_headers([block.header() for block in theirs.chain[2:]])
+    assert sync.header_height == 1 and not sync.syncing
+
+    forged = theirs.chain[1].header()
+    forged.previous_hash = ours.last_block.hash
+    forged.index = 2
+    with pytest.raises(ProtocolError):
+        sync._add_headers([forged])
+    assert sync.header_height == 1 and not sync.syncing
+
+def test_peer_on_competing_branch_is_not_banned():
+    """Test that a natural fork drops the peer without a ban, while invalid headers still ban."""
+    async def run():
+        nodes = await _start_line(2)
+        other, node = nodes
+        try:
+            # A one-block fork, then two more blocks on the other side
+            node.blockchain.add_block(mine_next(node.blockchain, []))
+            for _ in range(3):
+                block = mine_next(other.blockchain, [])
+                assert other.blockchain.add_block(block)
+            await other.announce_block(block)
+
+            await wait_for(lambda: node.stats["sync.diverged"] >= 2)
+            assert not node.is_banned("127.0.0.1") and not other.is_banned("127.0.0.1")
+            assert node.stats["bans"] == 0
+            assert len(node.blockchain.chain) == 2 and not node.sync.syncing
+
+            reader, writer = await asyncio.open_connection(node.host, node.port)
+            try:
+                writer.write(encode_message(MSG_VERSION, {
+                    "node_id": "forger", "version": PROTOCOL_VERSION, "height": 0
+                }))
+                forged = mine_next(node.blockchain, []).header()
+                forged.nonce += 1
+                writer.write(encode_message(MSG_HEADERS, {"headers": [forged.to_dict()]}))
+                await writer.drain()
+                await wait_for(lambda: node.stats["bans"] == 1)
+                assert node.is_banned("127.0.0.1")
+            finally:
+                writer.close()
+        finally:
+            for n in nodes:
+                await n.stop()
+
+    asyncio.run(run())
+
+def test_rejected_objects_do_not_shadow_real_ones(monkeypatch):
+    """Test that a forged block or a rejected transaction under a real ID does not stop the real one, and that the forger is banned."""
+    async def run():
+        nodes = await _start_line(2)
+        victim, honest = nodes
+        reader, writer = await asyncio.open_connection(victim.host, victim.port)
+        try:
+            writer.write(encode_message(MSG_VERSION, {
+                "node_id": "forger", "version": PROTOCOL_VERSION, "height": 0
+            }))
+            block = mine_next(honest.blockchain, [])
+            forged = copy.deepcopy(block.to_dict())
+            forged["transactions"][0]["receiver"] = "forger"
+            tx = Transaction("alice", "bob", 1.0)
+            tx.sign("sig")
+
+            monkeypatch.setattr(blockchain_module, "MAX_PENDING_TRANSACTIONS", 0)
+            objects = victim.stats["objects"]
+            writer.write(encode_message(MSG_TX, tx.to_dict()))
+            writer.write(encode_message(MSG_BLOCK, forged))
+            await writer.drain()
+            await wait_for(lambda: victim.stats["objects"] == objects + 2)
+            monkeypatch.undo()
+            await wait_for(lambda: victim.stats["bans"] == 1)
+            assert victim.is_banned("127.0.0.1")
+            assert len(victim.blockchain.chain) == 1
+            assert not victim.blockchain.has_pending_transaction(tx.tx_id)
+
+            assert honest.blockchain.add_block(block)
+            await honest.announce_block(block)
+            assert await honest.submit_transaction(tx)
+            await wait_for(lambda: len(victim.blockchain.chain) == 2)
+            assert victim.blockchain.last_block.hash == block.hash
+            await wait_for(lambda: victim.blockchain.has_pending_transaction(tx.tx_id))
+        finally:
+            writer.close()
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_sync_batch_failing_part_way_confirms_added_blocks():
+    """Test that blocks applied before a bad one are pruned from the pending pool and marked seen."""
+    source, ours = Blockchain(difficulty=1), Blockchain(difficulty=1)
+    transactions = [Transaction("alice", "bob", float(i + 1)) for i in range(4)]
+    for tx in transactions:
+        tx.sign("sig")
+        ours.add_pending_transaction(tx)
+    blocks = []
+    for tx in transactions:
+        block = mine_next(source, [tx])
+        assert source.add_block(block)
+        blocks.append(block)
+    blocks[2].nonce += 1
+
+    seen = SeenCache()
+    sync = ChainSync(ours, lambda: [], seen)
+    sync._bodies = {block.index: block for block in blocks}
+    sync._apply()
+
+    assert len(ours.chain) == 3
+    assert [tx.tx_id for tx in ours.pending_transactions] == [tx.tx_id for tx in transactions[2:]]
+    assert [(INV_BLOCK, block.hash) in seen for block in blocks] == [True, True, False, False]
+    assert not sync._bodies and not sync.syncing
+
+def test_compact_block_relay_saves_bandwidth():
+    """Test that blocks whose transactions were relayed cost far less than full blocks."""
+    async def run():
+        nodes = await _start_line(3)
+        try:
+            transactions = [Transaction(f"s{i}", "bob", 1.0) for i in range(50)]
+            for tx in transactions:
+                await nodes[0].submit_transaction(tx)
+            await wait_for(lambda: len(nodes[2].blockchain.pending_transactions) == 50)
+
+            before = sum(peer.bytes_received for peer in nodes[2].connected_peers)
+            block = mine_next(nodes[0].blockchain, transactions)
+            assert nodes[0].blockchain.add_block(block)
+            await nodes[0].announce_block(block)
+            await wait_for(lambda: len(nodes[2].blockchain.chain) == 2)
+
+            received = sum(peer.bytes_received for peer in nodes[2].connected_peers) - before
+            full_size = len(encode_message(MSG_BLOCK, block.to_dict()))
+            assert nodes[2].blockchain.last_block.hash == block.hash
+            assert nodes[2].blockchain.pending_transactions == []
+            assert received * 5 < full_size
+        finally:
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_compact_block_fetches_missing_transactions():
+    """Test that transactions missing from the pool are fetched with getblocktxn."""
+    async def run():
+        nodes = await _start_line(2)
+        served = []
+        for msg_type in (MSG_GETBLOCKTXN, MSG_GETDATA):
+            handler = nodes[0]._handlers[msg_type]
+
+            async def recording(peer, payload, handler=handler, msg_type=msg_type):
+                served.append(msg_type)
+                await handler(peer, payload)
+
+            nodes[0]._handlers[msg_type] = recording
+        try:
+            shared = Transaction("alice", "bob", 5.0)
+            await nodes[0].submit_transaction(shared)
+            await wait_for(lambda: len(nodes[1].blockchain.pending_transactions) == 1)
+
+            # Known only to the miner, so the receiver has to ask for it
+            private = Transaction("carol", "dave", 2.0)
+            nodes[0].blockchain.add_pending_transaction(private)
+
+            block = mine_next(nodes[0].blockchain, [shared, private])
+            assert nodes[0].blockchain.add_block(block)
+            served.clear()
+            await nodes[0].announce_block(block)
+            await wait_for(lambda: len(nodes[1].blockchain.chain) == 2)
+            assert nodes[1].blockchain.last_block.hash == block.hash
+            assert served == [MSG_GETBLOCKTXN]
+        finally:
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_iblt_decodes_set_difference():
+    """Test that subtracted sketches decode to the symmetric difference."""
+    salt = b"\x01" * 8
+    shared = [short_key(f"tx{i}", salt) for i in range(500)]
+    ours = {short_key(f"ours{i}", salt) for i in range(10)}
+    theirs = {short_key(f"theirs{i}", salt) for i in range(8)}
+
+    local = IBLT.from_keys(shared + list(ours), 60)
+    remote = IBLT.from_base64(IBLT.from_keys(shared + list(theirs), 60).to_base64())
+    assert local.subtract(remote).decode() == (ours, theirs)
+
+    # A difference far larger than the sketch cannot be peeled
+    small = IBLT.from_keys(ours | theirs, 6)
+    with pytest.raises(ReconciliationError):
+        small.subtract(IBLT(6)).decode()
+    with pytest.raises(ReconciliationError):
+        IBLT.from_base64("not a sketch")
+
+def test_reconciliation_relays_transactions():
+    """Test that reconciling nodes relay transactions without flooding them."""
+    async def run():
+        nodes = await _start_line(3, tx_relay=RELAY_RECONCILE)
+        try:
+            assert all(peer.recon is not None for n in nodes for peer in n.connected_peers)
+            txs = [Transaction("alice", f"bob{i}", 1.0 + i) for i in range(5)]
+            for tx in txs:
+                assert await nodes[0].submit_transaction(tx)
+            await wait_for(lambda: all(len(n.blockchain.pending_transactions) == 5 for n in nodes))
+
+            # Transactions travel towards inbound peers here, which are never
+            # flooded to, so each hop went through a sketch
+            assert nodes[1].stats["messages.sketch"] >= 1
+            assert nodes[2].stats["messages.sketch"] >= 1
+            assert nodes[1].stats["duplicates"] == 0
+            assert nodes[2].stats["duplicates"] == 0
+        finally:
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_compressed_framing():
+    """Test compressed frames, the size threshold and codec negotiation."""
+    async def run():
+        payload = {"blob": "ab" * 50_000}
+        for codec in (COMPRESSION_ZLIB, COMPRESSION_LZMA):
+            frame = encode_message(MSG_BLOCK, payload, codec)
+            assert len(frame) < 10_000
+            reader = asyncio.StreamReader()
+            reader.feed_data(frame)
+            reader.feed_eof()
+            msg_type, decoded, size = await read_message(reader)
+            assert (msg_type, decoded, size) == (MSG_BLOCK, payload, len(frame))
+
+        small = encode_message(MSG_BLOCK, {"x": 1}, COMPRESSION_ZLIB)
+        assert FRAME_HEADER.unpack(small[:FRAME_HEADER.size])[2] == 0
+        assert len(small) - FRAME_HEADER.size < COMPRESSION_THRESHOLD
+
+        # Corrupt compressed payloads are protocol errors
+        frame = bytearray(encode_message(MSG_BLOCK, payload, COMPRESSION_ZLIB))
+        frame[FRAME_HEADER.size + 5:FRAME_HEADER.size + 9] = b"\xff" * 4
+        reader = asyncio.StreamReader()
+        reader.feed_data(bytes(frame))
+        reader.feed_eof()
+        with pytest.raises(ProtocolError):
+            await read_message(reader)
+
+    asyncio.run(run())
+    assert negotiate([COMPRESSION_LZMA, COMPRESSION_ZLIB], ["zlib"]) == COMPRESSION_ZLIB
+    assert negotiate([], ["zlib", "lzma"]) == COMPRESSION_NONE
+    assert negotiate([COMPRESSION_ZLIB], ["brotli"]) == COMPRESSION_NONE
+
+def test_sync_with_compression():
+    """Test that sync compresses bodies and interoperates with plain peers."""
+    async def run():
+        source = Blockchain(difficulty=1)
+        for i in range(10):
+            txs = [Transaction(f"alice{i}", f"bob{j}", 1.0 + j) for j in range(10)]
+            source.add_block(mine_next(source, txs))
+
+        seed = Node("seed", source, port=0)
+        compressed = Node("compressed", Blockchain(difficulty=1), port=0)
+        plain = Node("plain", Blockchain(difficulty=1), port=0, compression=())
+        for node in (seed, compressed, plain):
+            await node.start()
+        try:
+            compressed.add_peer(seed.node_id, seed.host, seed.port)
+            plain.add_peer(seed.node_id, seed.host, seed.port)
+            await wait_for(lambda: len(compressed.blockchain.chain) == 11)
+            await wait_for(lambda: len(plain.blockchain.chain) == 11)
+
+            # The seed compresses for both peers; plain only sends plain frames
+            assert compressed.compression_stats.ratio("bodies") > 2
+            assert plain.compression_stats.ratio("bodies") > 2
+            assert [peer.compression for peer in plain.connected_peers] == [COMPRESSION_NONE]
+            assert {peer.compression for peer in seed.connected_peers} == {COMPRESSION_ZLIB}
+        finally:
+            for node in (seed, compressed, plain):
+                await node.stop()
+
+    asyncio.run(run())
+
+def test_token_bucket():
+    """Test bursts, refill and reservations going into debt."""
+    now = [0.0]
+    bucket = TokenBucket(rate=10.0, capacity=5.0, clock=lambda: now[0])
+    assert all(bucket.consume() for _ in range(5))
+    assert bucket.consume() is False
+
+    now[0] = 0.25
+    assert bucket.consume(2.0) is True
+    assert bucket.reserve(3.0) == pytest.approx(0.25)
+    now[0] = 10.0
+    assert bucket.tokens == 5.0
+
+def test_blocks_overtake_queued_transactions():
+    """Test that high priority frames skip a backlog held up by the upload limit."""
+    async def run():
+        accepted = asyncio.get_event_loop().create_future()
+        server = await asyncio.start_server(
+            lambda r, w: accepted.set_result((r, w)), "127.0.0.1", 0
+        )
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        remote_reader, remote_writer = await accepted
+        peer = Peer(reader, writer, outbound=True)
+        peer.upload_bucket = TokenBucket(rate=20_000, capacity=2_000)
+        peer.start()
+        try:
+            for i in range(20):
+                await peer.send_frame(encode_message(MSG_TXS, {"pad": "x" * 2_000, "i": i}), PRIORITY_LOW)
+            await peer.send_frame(encode_message(MSG_BLOCK, {"hash": "b"}), PRIORITY_HIGH)
+
+            order = []
+            for _ in range(21):
+                msg_type, _, _ = await read_message(remote_reader)
+                order.append(msg_type)
+            assert order.index(MSG_BLOCK) <= 2
+        finally:
+            await peer.close()
+            remote_writer.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
+
+def test_flooding_peer_is_throttled_and_banned(monkeypatch):
+    """Test that a transaction flood neither stalls block relay nor goes unpunished."""
+    monkeypatch.setattr(peer_module, "PEER_MESSAGE_RATE", 200.0)
+    monkeypatch.setattr(peer_module, "PEER_MESSAGE_BURST", 50.0)
+
+    async def run():
+        nodes = await _start_line(2)
+        victim, honest = nodes
+        reader, writer = await asyncio.open_connection(victim.host, victim.port)
+        try:
+            writer.write(encode_message(MSG_VERSION, {
+                "node_id": "flooder", "version": PROTOCOL_VERSION, "height": 0
+            }))
+            writer.writelines(
+                encode_message(MSG_TX, Transaction("spam", f"sink{i}", 1.0).to_dict())
+                for i in range(400)
+            )
+            await writer.drain()
+
+            block = mine_next(honest.blockchain, [])
+            assert honest.blockchain.add_block(block)
+            started = time.monotonic()
+            await honest.announce_block(block)
+            await wait_for(lambda: len(victim.blockchain.chain) == 2)
+            assert time.monotonic() - started < 0.5
+
+            await wait_for(lambda: victim.stats["bans"] == 1)
+            assert victim.stats["throttled"] > 0
+            assert victim.is_banned("127.0.0.1")
+            assert [peer.peer_id for peer in victim.connected_peers] == [honest.node_id]
+        finally:
+            writer.close()
+            for node in nodes:
+                await node.stop()
+
+    asyncio.run(run())
+
@@ -0,0 +1,81 @@
+import asyncio
+import os
+import pstats
+import signal
+import threading
+import time
+import pytest
+from blockchain.core.blockchain import Blockchain
+from blockchain.network.rpc import RPCServer
+from blockchain.profiling import Profiler, ProfilingError, StackSampler
+from tests.helpers import mine_next, rpc_call, rpc_request
+
+def _busy(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(1000))
+
+def test_stack_sampler_tags_subsystems(tmp_path):
+    """Test that samples are collapsed and tagged by entry point."""
+    sampler = StackSampler(interval=0.002, entry_points={"busy": ["tests.test_profiling:_busy"]})
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy, args=(stop,))
+    worker.start()
+    sampler.start()
+    time.sleep(0.3)
+    sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert not sampler.running
+    tagged = [line for line in sampler.collapsed() if line.startswith("busy;")]
+    assert tagged
+    stack, count = tagged[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "_busy (test_profiling.py:" in stack
+    path = sampler.write(str(tmp_path / "out.folded"))
+    assert open(path).read().splitlines() == sampler.collapsed()
+
+    with pytest.raises(ProfilingError):
+        StackSampler(entry_points={"x": ["blockchain.core.blockchain:Blockchain.nope"]}).start()
+
+def test_scoped_profiling_over_rpc_and_signal(tmp_path):
+    """Test cProfile sessions via RPC and sampler toggling via SIGUSR2."""
+    async def run():
+        blockchain = Blockchain(difficulty=1)
+        profiler = Profiler(output_dir=str(tmp_path))
+        server = RPCServer(blockchain, profiler=profiler)
+        original = Blockchain.__dict__["add_block"]
+
+        response = await rpc_call(server, rpc_request("startProfiler", ["cprofile", ["chain"]]))
+        assert response["result"] is True
+        assert Blockchain.__dict__["add_block"] is not original
+        assert (await rpc_call(server, rpc_request("startProfiler", ["cprofile"])))["error"]
+        assert blockchain.add_block(mine_next(blockchain, []))
+
+        paths = (await rpc_call(server, rpc_request("stopProfiler", ["cprofile"])))["result"]
+        # Outside a session the original method is back: no cost when disabled
+        assert Blockchain.__dict__["add_block"] is original
+        assert len(paths) == 1 and paths[0].endswith("-chain.prof")
+        functions = {name for _, _, name in pstats.Stats(paths[0]).stats}
+        assert "_is_valid_block" in functions
+        assert (await rpc_call(server, rpc_request("stopProfiler", ["cprofile"])))["error"]
+        assert (await rpc_call(server, rpc_request("startProfiler", ["bogus"])))["error"]
+
+    asyncio.run(run())
+
+    if not hasattr(signal, "SIGUSR2"):
+        return
+    profiler = Profiler(output_dir=str(tmp_path / "signal"))
+    previous = signal.getsignal(signal.SIGUSR2)
+    try:
+        profiler.install_signal_handler()
+        os.kill(os.getpid(), signal.SIGUSR2)
+        time.sleep(0.05)
+        assert profiler.sampler.running
+        os.kill(os.getpid(), signal.SIGUSR2)
+        time.sleep(0.05)
+        assert not profiler.sampler.running
+        written = os.listdir(tmp_path / "signal")
+        assert len(written) == 1 and written[0].endswith(".folded")
+    finally:
+        signal.signal(signal.SIGUSR2, previous)
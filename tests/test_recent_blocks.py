@@ -0,0 +1,82 @@
+import json
+from blockchain.core.blockchain import Blockchain
+from blockchain.network import dashboard
+from blockchain.network.recent_blocks import RecentBlocks, read_tail_lines
+from tests.helpers import mine_next
+
+def _record(i):
+    return {"hash": f"{i:064x}", "nonce": i, "duration": 0.5, "coord": [1, 2, 3],
+            "block_time": i, "transactions": [{"id": n} for n in range(i % 7)]}
+
+def _write(path, records, mode="a"):
+    with open(path, mode) as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+def test_recent_blocks_follow_block_store(tmp_path):
+    """Test tail reading and incremental following of a block store."""
+    path = tmp_path / "blocks.json"
+    _write(path, [_record(i) for i in range(500)], "w")
+    with open(path, "a") as f:
+        f.write('{"hash": "partial')
+
+    lines = read_tail_lines(str(path), 10, chunk_size=64)
+    assert [json.loads(line)["nonce"] for line in lines] == list(range(490, 500))
+
+    feed = RecentBlocks(capacity=10, path=str(path))
+    feed.refresh()
+    assert [b["nonce"] for b in feed.blocks()] == list(range(490, 500))
+    version = feed.version
+    feed.refresh()
+    assert feed.version == version
+
+    # Complete the partial line and append more; only new bytes are read
+    with open(path, "a") as f:
+        f.write('", "nonce": -1}\n')
+    _write(path, [_record(500), _record(501)])
+    feed.refresh()
+    assert [b["nonce"] for b in feed.blocks()][-3:] == [-1, 500, 501]
+    assert len(feed.blocks()) == 10
+
+    # A replaced store is read from its tail again
+    _write(path, [_record(7)], "w")
+    feed.refresh()
+    assert [b["nonce"] for b in feed.blocks()] == [7]
+
+def test_recent_blocks_from_events():
+    """Test feeding the buffer from block events."""
+    blockchain = Blockchain(difficulty=1)
+    feed = RecentBlocks(capacity=2)
+    feed.attach(blockchain.events)
+    blocks = []
+    for _ in range(3):
+        blocks.append(mine_next(blockchain, []))
+        assert blockchain.add_block(blocks[-1])
+    assert [b["hash"] for b in feed.blocks()] == [b.hash for b in blocks[1:]]
+
+def test_dashboard_serves_cached_page_with_etag(tmp_path, monkeypatch):
+    """Test that the dashboard renders once per change and honours If-None-Match."""
+    path = tmp_path / "blocks.json"
+    _write(path, [_record(i) for i in range(20)], "w")
+    feed = RecentBlocks(path=str(path))
+    monkeypatch.setattr(dashboard, "recent_blocks", feed)
+    renders = []
+    original = feed.render
+    monkeypatch.setattr(feed, "render", lambda renderer: original(lambda b: renders.append(1) or renderer(b)))
+    client = dashboard.app.test_client()
+
+    first = client.get("/")
+    assert first.status_code == 200
+    assert f"{19:064x}"[:20].encode() in first.data
+    etag = first.headers["ETag"]
+
+    again = client.get("/", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert client.get("/").data == first.data
+    assert len(renders) == 1
+
+    _write(path, [_record(20)])
+    changed = client.get("/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert f"{20:064x}"[:20].encode() in changed.data
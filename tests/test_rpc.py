@@ -0,0 +1,120 @@
+import asyncio
+import json
+import threading
+import time
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.transaction import Transaction
+from blockchain.network.rpc import (
+    RPCServer, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, MINER_UNAVAILABLE,
+    PARSE_ERROR, TRANSACTION_REJECTED
+)
+from tests.helpers import mine_next, rpc_call, rpc_request
+
+def test_rpc_methods():
+    """Test every method against a small chain and pending pool."""
+    async def run():
+        blockchain = Blockchain(difficulty=1)
+        block = mine_next(blockchain, [Transaction("alice", "bob", 5.0)])
+        assert blockchain.add_block(block)
+        server = RPCServer(blockchain)
+        try:
+            response = await rpc_call(server, rpc_request("getBalance", ["bob"]))
+            assert response == {"jsonrpc": "2.0", "result": 5.0, "id": 1}
+
+            assert (await rpc_call(server, rpc_request("getBlock", [1])))["result"]["hash"] == block.hash
+            response = await rpc_call(server, rpc_request("getBlock", {"block_id": block.hash}))
+            assert response["result"]["index"] == 1
+            assert (await rpc_call(server, rpc_request("getBlock", [99])))["result"] is None
+
+            tx = Transaction("carol", "dave", 2.0)
+            response = await rpc_call(server, rpc_request("sendTransaction", [tx.to_dict()]))
+            assert response["result"] == tx.tx_id
+            response = await rpc_call(server, rpc_request("sendTransaction", [tx.to_dict()]))
+            assert response["error"]["code"] == TRANSACTION_REJECTED
+
+            found = (await rpc_call(server, rpc_request("getTransaction", [tx.tx_id])))["result"]
+            assert found["block_height"] is None and found["confirmations"] == 0
+            mined = block.transactions[1].tx_id
+            found = (await rpc_call(server, rpc_request("getTransaction", [mined])))["result"]
+            assert found["block_height"] == 1 and found["confirmations"] == 1
+
+            info = (await rpc_call(server, rpc_request("getMempoolInfo")))["result"]
+            assert info["size"] == 1 and info["total_amount"] == 2.0
+            response = await rpc_call(server, rpc_request("getMiningStatus"))
+            assert response["error"]["code"] == MINER_UNAVAILABLE
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+def test_rpc_errors_and_batches():
+    """Test JSON-RPC error codes, notifications and batch responses."""
+    async def run():
+        server = RPCServer(Blockchain(difficulty=1))
+        try:
+            assert (json.loads(await server.handle_request("{oops")))["error"]["code"] == PARSE_ERROR
+            assert (await rpc_call(server, {"method": "getBalance"}))["error"]["code"] == INVALID_REQUEST
+            assert (await rpc_call(server, []))["error"]["code"] == INVALID_REQUEST
+            assert (await rpc_call(server, rpc_request("nope")))["error"]["code"] == METHOD_NOT_FOUND
+            response = await rpc_call(server, rpc_request("getBalance", ["a", "b"]))
+            assert response["error"]["code"] == INVALID_PARAMS
+            response = await rpc_call(server, rpc_request("sendTransaction", [{"sender": "x"}]))
+            assert response["error"]["code"] == INVALID_PARAMS
+
+            # Notifications get no response, alone or in a batch
+            assert await rpc_call(server, rpc_request("getMempoolInfo", request_id=None)) is None
+            responses = await rpc_call(
+                server,
+                rpc_request("getBalance", ["a"], request_id=1),
+                rpc_request("getMempoolInfo", request_id=None),
+                rpc_request("nope", request_id="x")
+            )
+            assert [r["id"] for r in responses] == [1, "x"]
+            assert responses[0]["result"] == 0.0
+            assert responses[1]["error"]["code"] == METHOD_NOT_FOUND
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+def test_rpc_over_http_runs_reads_concurrently():
+    """Test the HTTP transport and that slow reads in a batch overlap."""
+    async def run():
+        server = RPCServer(Blockchain(difficulty=1), port=0)
+        threads = set()
+
+        def slow(delay):
+            threads.add(threading.get_ident())
+            time.sleep(delay)
+            return delay
+
+        server.register("slow", slow)
+        await server.start()
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        try:
+            body = json.dumps([rpc_request("slow", [0.2], request_id=i) for i in range(4)]).encode()
+            started = time.monotonic()
+            for _ in range(2):
+                # Two requests on one keep-alive connection
+                writer.write(
+                    b"POST / HTTP/1.1\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                status = await reader.readline()
+                assert status.startswith(b"HTTP/1.1 200")
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.lower()] = value.strip()
+                responses = json.loads(await reader.readexactly(int(headers["content-length"])))
+                assert sorted(r["id"] for r in responses) == [0, 1, 2, 3]
+            assert time.monotonic() - started < 1.2
+            assert len(threads) > 1
+        finally:
+            writer.close()
+            await server.stop()
+
+    asyncio.run(run())
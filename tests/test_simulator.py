@@ -0,0 +1,54 @@
+import asyncio
+import random
+import pytest
+from blockchain.network.simulator import (
+    NetworkSimulator, SimulationConfig, SimulationError, build_topology, percentile
+)
+
+def _connected(count: int, edges: list) -> bool:
+    reached, frontier = {0}, [0]
+    while frontier:
+        node = frontier.pop()
+        for a, b in edges:
+            for x, y in ((a, b), (b, a)):
+                if x == node and y not in reached:
+                    reached.add(y)
+                    frontier.append(y)
+    return len(reached) == count
+
+def test_topologies():
+    """Test link counts and connectivity of every topology."""
+    assert len(build_topology("line", 5)) == 4
+    assert len(build_topology("ring", 5)) == 5
+    assert build_topology("star", 4) == [(0, 1), (0, 2), (0, 3)]
+    assert len(build_topology("full", 5)) == 10
+
+    edges = build_topology("random", 30, degree=4, rng=random.Random(7))
+    assert len(edges) == 60
+    assert _connected(30, edges)
+    assert all(a < b for a, b in edges)
+
+    with pytest.raises(SimulationError):
+        build_topology("mesh", 5)
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+def test_simulation_reports_propagation():
+    """Test a small shaped network end to end."""
+    config = SimulationConfig(
+        nodes=6, topology="ring", latency=0.005, bandwidth=10_000_000,
+        transactions=30, tx_rate=1000.0, blocks=1, timeout=10.0
+    )
+    report = asyncio.run(NetworkSimulator(config).run())
+    assert report.links == 6
+    assert report.coverage == 1.0
+    # Farthest node in a ring of 6 is 3 hops, each hop adding link latency
+    assert report.tx_p99 >= 0.005
+    assert report.block_p50 <= report.block_p99
+    assert 0.0 <= report.duplicate_ratio < 1.0
+    assert report.bytes_received_per_node > 0
@@ -0,0 +1,62 @@
+import json
+import logging
+from blockchain.core.blockchain import Blockchain
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.core.transaction import Transaction
+from blockchain.mining.proof_of_work import ConsensusManager
+from blockchain.tracing import PHASES, TRACER, Span, main, percentile, phase_report
+
+def test_block_lifecycle_spans(tmp_path, capsys):
+    """Test that mining a block records every phase and the report reads them back."""
+    path = tmp_path / "trace.jsonl"
+    TRACER.clear()
+    TRACER.open_sink(str(path))
+    try:
+        blockchain = Blockchain(difficulty=1)
+        consensus = ConsensusManager(blockchain)
+        for i in range(3):
+            blockchain.add_pending_transaction(Transaction("alice", "bob", float(i + 1)))
+            block = consensus.create_block("miner", FractalCoordinate(100, 100, 100))
+            assert consensus.mine_block(block).success
+    finally:
+        TRACER.close_sink()
+
+    spans = TRACER.spans()
+    for height in (1, 2, 3):
+        assert {span.phase for span in spans if span.height == height} == set(PHASES)
+    assert [Span(**json.loads(line)) for line in open(path)] == spans
+
+    report = phase_report(spans, blocks=2)
+    assert list(report) == list(PHASES)
+    assert all(summary["count"] == 2 for summary in report.values())
+
+    assert main([str(path), "--blocks", "2"]) == 0
+    output = capsys.readouterr().out
+    assert "Last 2 blocks" in output and "hash_search" in output
+
+def test_failing_sink_does_not_fail_blocks(tmp_path, caplog):
+    """Test that a sink write error drops the sink once instead of failing add_block."""
+    TRACER.open_sink(str(tmp_path / "trace.jsonl"))
+    TRACER._sink.close()
+    try:
+        blockchain = Blockchain(difficulty=1)
+        consensus = ConsensusManager(blockchain)
+        with caplog.at_level(logging.WARNING, logger="triadnet.tracing"):
+            for _ in range(2):
+                block = consensus.create_block("miner", FractalCoordinate(100, 100, 100))
+                assert consensus.mine_block(block).success
+    finally:
+        TRACER.close_sink()
+
+    assert len(blockchain.chain) == 3
+    assert TRACER._sink is None
+    assert [r.name for r in caplog.records if "Trace sink failed" in r.getMessage()] == ["triadnet.tracing"]
+    assert {span.height for span in TRACER.spans()} >= {1, 2}
+
+def test_percentile_nearest_rank():
+    """Test nearest-rank percentiles."""
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([7.0], 99) == 7.0
@@ -0,0 +1,64 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from blockchain.wallet import wallet as wallet_module
+from blockchain.wallet.wallet import PARALLEL_SIGN_THRESHOLD, Wallet
+
+@pytest.fixture(scope="module")
+def wallet():
+    return Wallet()
+
+def _check_batch(wallet, batch, results):
+    assert [r.index for r in results] == list(range(len(batch)))
+    for item, result in zip(batch, results):
+        receiver, amount = (item["receiver"], item["amount"]) if isinstance(item, dict) else item[:2]
+        if result.ok:
+            assert (result.transaction.receiver, result.transaction.amount) == (receiver, amount)
+            assert result.transaction.sender == wallet.address
+            assert wallet.verify_transaction(result.transaction)
+
+def test_batch_keeps_order_and_reports_item_errors(wallet):
+    """Test that a small batch is signed in order and bad entries fail alone."""
+    wallet.state.balance = 10.0
+    batch = [
+        ("TXa", 4.0),
+        {"receiver": "TXb", "amount": 0},
+        ("TXc", 5.0, "memo"),
+        {"receiver": "TXd", "amount": 2.0},
+        ("TXe", 1.0),
+        ("", 1.0),
+    ]
+    results = wallet.create_transactions(batch)
+
+    _check_batch(wallet, batch, results)
+    assert [r.ok for r in results] == [True, False, True, False, True, False]
+    assert results[1].error == "Amount must be positive"
+    assert results[3].error == "Insufficient funds"
+    assert results[5].error == "Invalid receiver address"
+    assert results[2].transaction.data == "memo"
+    assert len({r.transaction.tx_id for r in results if r.ok}) == 3
+
+    tampered = results[0].transaction
+    tampered.amount = 3.0
+    assert not wallet.verify_transaction(tampered)
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_large_batch_is_signed_on_a_process_pool(wallet, monkeypatch, start_method):
+    """Test that large batches are signed by pool workers, including under the spawn start method."""
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} is not available")
+    pools = []
+
+    def executor(**kwargs):
+        pools.append(kwargs)
+        return ProcessPoolExecutor(mp_context=multiprocessing.get_context(start_method), **kwargs)
+
+    monkeypatch.setattr(wallet_module, "ProcessPoolExecutor", executor)
+    wallet.state.balance = 1000.0
+    batch = [(f"TX{n:03d}", 1.0 + n % 3) for n in range(PARALLEL_SIGN_THRESHOLD + 6)]
+    batch[10] = ("TXbad", -1.0)
+    results = wallet.create_transactions(batch, max_workers=2)
+
+    assert len(pools) == 1 and pools[0]["max_workers"] == 2
+    _check_batch(wallet, batch, results)
+    assert [n for n, r in enumerate(results) if not r.ok] == [10]
@@ -0,0 +1,448 @@
+"""Synthetic transaction load against a mining node.
+
+Signed transfers between simulated wallets are offered at fixed rates while a
+Miner runs, and the run reports sustained TPS, pending pool depth over time,
+confirmation latency percentiles and the rate at which the pool saturates.
+Step the offered load up to find the saturation point:
+
+    python tools/loadgen.py --rates 10 50 100 200 --step 20
+
+Transactions go straight to ``Blockchain.add_pending_transaction`` or, with
+``--submit rpc``, through ``sendTransaction`` on an in-process RPC server.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain.core.blockchain import MAX_PENDING_TRANSACTIONS, Blockchain, TransactionError
+from blockchain.core.events import EVENT_BLOCK
+from blockchain.core.fractal_coordinate import FractalCoordinate
+from blockchain.core.transaction import Transaction
+from blockchain.mining.mine import Miner
+from blockchain.network.rpc import RPCServer
+from blockchain.tracing import percentile
+from blockchain.wallet import Wallet
+from blockchain.wallet.wallet import Wallet as SigningWallet
+
+# Load generator constants
+DEFAULT_RATES = [10.0]  # Offered transactions per second, one step per rate
+DEFAULT_STEP = 30.0  # Seconds each rate is offered for
+DEFAULT_WALLETS = 10  # Simulated wallets sending and receiving
+DEFAULT_DIFFICULTY = 3  # Mining difficulty, pinned unless --adaptive-difficulty
+DEFAULT_DRAIN = 10.0  # Seconds of mining after the last step, so late confirmations count
+DEFAULT_CONCURRENCY = 1  # Submitting threads
+SAMPLE_INTERVAL = 1.0  # Seconds between pool depth samples
+SATURATION_FRACTION = 0.9  # Pool depth, as a share of its capacity, that counts as saturated
+MAX_AMOUNT = 10.0  # Largest transfer amount
+LATENCY_PERCENTILES = (50, 95, 99)  # Confirmation latency percentiles reported
+SUBMIT_DIRECT = "direct"  # Call Blockchain.add_pending_transaction
+SUBMIT_RPC = "rpc"  # POST sendTransaction to an in-process RPCServer
+POOL_FULL_REASON = "Transaction pool is full"  # Rejection reason of add_pending_transaction, also relayed over RPC
+
+@dataclass
+class Sample:
+    """Pending pool and chain state at one point of the run."""
+    elapsed: float
+    offered_rate: float
+    mempool_depth: int
+    height: int
+    submitted: int
+    rejected: int
+    confirmed: int
+
+@dataclass
+class StepResult:
+    """
+    Outcome of one offered rate.
+
+    Rates are per second of the step. Latencies, in milliseconds, cover the
+    transactions submitted during the step, however late they confirmed.
+    """
+    offered_rate: float
+    submitted_rate: float
+    confirmed_rate: float
+    rejected: int
+    pool_full_rejections: int
+    unconfirmed: int
+    max_mempool_depth: int
+    latency_ms: Dict[str, float]
+    saturated: bool
+
+class _Submission:
+    __slots__ = ("step", "submitted_at", "accepted", "pool_full")
+
+    def __init__(self, step: int):
+        self.step = step
+        self.submitted_at = 0.0
+        self.accepted = False
+        self.pool_full = False
+
+class _RPCClient:
+    """JSON-RPC over a keep-alive HTTP connection, one per submitting thread."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._connection: Optional[http.client.HTTPConnection] = None
+
+    def send_transaction(self, tx: Transaction) -> Optional[str]:
+        """Submit a transaction; returns None if it was accepted, else the RPC error message."""
+        body = json.dumps({"jsonrpc": "2.0", "method": "sendTransaction", "params": [tx.to_dict()], "id": 1})
+        for attempt in range(2):
+            if self._connection is None:
+                self._connection = http.client.HTTPConnection(self.host, self.port)
+            try:
+                self._connection.request("POST", "/", body, {"Content-Type": "application/json"})
+                response = json.loads(self._connection.getresponse().read())
+                if "result" in response:
+                    return None
+                return response.get("error", {}).get("message", "")
+            except (ConnectionError, http.client.HTTPException):
+                # The server closes idle keep-alive connections; reconnect once
+                self._connection.close()
+                self._connection = None
+                if attempt:
+                    raise
+        return ""
+
+class _RPCThread:
+    """Runs an RPCServer on its own event loop in a background thread."""
+
+    def __init__(self, blockchain: Blockchain):
+        self.server = RPCServer(blockchain, port=0)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="loadgen-rpc", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self._loop).result()
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+class LoadGenerator:
+    """
+    Offers signed transactions to a chain at stepped rates while it is mined.
+
+    Transactions are signed before the run starts, so signing never limits
+    the offered rate. Submission is open loop: each transaction is due at a
+    fixed time, whether or not earlier ones were accepted, and a submitting
+    thread that falls behind shows up as a submitted rate below the offered
+    one. Confirmations are taken from the chain's block events.
+
+    Attributes:
+        blockchain (Blockchain): Chain whose pending pool is loaded
+        miner (Miner): Miner running during the load
+        samples (List[Sample]): Pool depth over time
+    """
+
+    def __init__(
+        self,
+        rates: Sequence[float],
+        step: float,
+        wallets: int = DEFAULT_WALLETS,
+        difficulty: int = DEFAULT_DIFFICULTY,
+        adaptive_difficulty: bool = False,
+        submit: str = SUBMIT_DIRECT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        drain: float = DEFAULT_DRAIN,
+        seed: Optional[int] = None
+    ):
+        if not rates or any(rate <= 0 for rate in rates) or step <= 0:
+            raise ValueError("Rates and step length must be positive")
+        if submit not in (SUBMIT_DIRECT, SUBMIT_RPC):
+            raise ValueError(f"Unknown submit mode {submit}")
+        self.rates = list(rates)
+        self.step = step
+        self.submit = submit
+        self.concurrency = max(1, concurrency)
+        self.drain = drain
+        self.samples: List[Sample] = []
+
+        self.blockchain = Blockchain(difficulty=difficulty)
+        self.miner = Miner(Wallet(), self.blockchain, FractalCoordinate(100, 100, 100), auto_adjust_coords=False)
+        if not adaptive_difficulty:
+            # Keep block times at the chosen difficulty instead of retargeting to a minute
+            self.miner.consensus.pofw._adjust_difficulty = lambda duration, score: None
+
+        self._rng = random.Random(seed)
+        self._wallets = [SigningWallet() for _ in range(max(2, wallets))]
+        self._schedule: List[float] = []
+        self._submissions: List[_Submission] = []
+        self._by_id: Dict[str, _Submission] = {}
+        self._confirmed: Dict[str, float] = {}
+        self._transactions: List[Transaction] = []
+        self._start = 0.0
+
+    def prepare(self, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Sign every transaction of the run.
+
+        Each wallet signs its share in one ``Wallet.create_transactions``
+        batch, so large runs are signed on a process pool.
+
+        Args:
+            progress (Optional[Callable[[int, int], None]]): Called with
+                (signed, total) after each wallet's batch
+
+        Returns:
+            int: Number of transactions
+
+        Raises:
+            RuntimeError: If a transaction could not be signed
+        """
+        slots = []
+        for step, rate in enumerate(self.rates):
+            for i in range(int(rate * self.step)):
+                sender, receiver = self._rng.sample(range(len(self._wallets)), 2)
+                amount = round(self._rng.uniform(0.01, MAX_AMOUNT), 2)
+                slots.append((step, step * self.step + i / rate, sender, receiver, amount))
+
+        transactions: List[Optional[Transaction]] = [None] * len(slots)
+        signed = 0
+        for sender, wallet in enumerate(self._wallets):
+            positions = [n for n, slot in enumerate(slots) if slot[2] == sender]
+            batch = [(self._wallets[slots[n][3]].address, slots[n][4]) for n in positions]
+            # The load wallets hold no coins on the fresh chain and the pool
+            # does not check balances, so give each wallet just enough for
+            # create_transactions to sign its whole batch
+            wallet.state.balance = len(batch) * MAX_AMOUNT
+            for n, result in zip(positions, wallet.create_transactions(batch)):
+                if not result.ok:
+                    raise RuntimeError(f"Could not sign load transaction: {result.error}")
+                transactions[n] = result.transaction
+            signed += len(batch)
+            if progress:
+                progress(signed, len(slots))
+
+        for (step, due, _, _, _), tx in zip(slots, transactions):
+            submission = _Submission(step)
+            self._schedule.append(due)
+            self._submissions.append(submission)
+            self._transactions.append(tx)
+            self._by_id[tx.tx_id] = submission
+        return len(slots)
+
+    def run(self) -> None:
+        """Mine and offer the load, then keep mining for the drain period."""
+        if not self._transactions:
+            self.prepare()
+        rpc = _RPCThread(self.blockchain) if self.submit == SUBMIT_RPC else None
+        subscription = self.blockchain.events.subscribe(self._on_block, [EVENT_BLOCK])
+        if rpc:
+            rpc.start()
+        self.miner.start()
+        self._start = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._submit_loop, args=(k, rpc), name=f"loadgen-{k}", daemon=True)
+            for k in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            load_end = len(self.rates) * self.step
+            while True:
+                elapsed = time.perf_counter() - self._start
+                self._sample(elapsed)
+                if elapsed >= load_end + self.drain:
+                    break
+                time.sleep(SAMPLE_INTERVAL - (elapsed % SAMPLE_INTERVAL))
+        finally:
+            for thread in threads:
+                thread.join()
+            self.miner.stop()
+            self.blockchain.events.unsubscribe(subscription)
+            if rpc:
+                rpc.stop()
+
+    def results(self) -> List[StepResult]:
+        """Per-step outcome of the run."""
+        capacity = MAX_PENDING_TRANSACTIONS * SATURATION_FRACTION
+        results = []
+        for step, rate in enumerate(self.rates):
+            begin, end = step * self.step, (step + 1) * self.step
+            submissions = [(tx, s) for tx, s in zip(self._transactions, self._submissions) if s.step == step]
+            accepted = [(tx, s) for tx, s in submissions if s.accepted]
+            latencies = sorted(
+                (self._confirmed[tx.tx_id] - s.submitted_at) * 1000
+                for tx, s in accepted if tx.tx_id in self._confirmed
+            )
+            confirmed_in_step = sum(
+                1 for tx, s in accepted
+                if tx.tx_id in self._confirmed and self._confirmed[tx.tx_id] - self._start < end
+            )
+            depths = [sample.mempool_depth for sample in self.samples if begin <= sample.elapsed <= end]
+            pool_full = sum(1 for _, s in submissions if s.pool_full)
+            max_depth = max(depths, default=0)
+            results.append(StepResult(
+                offered_rate=rate,
+                submitted_rate=len(accepted) / self.step,
+                confirmed_rate=confirmed_in_step / self.step,
+                rejected=len(submissions) - len(accepted),
+                pool_full_rejections=pool_full,
+                unconfirmed=len(accepted) - len(latencies),
+                max_mempool_depth=max_depth,
+                latency_ms={f"p{pct}": percentile(latencies, pct) for pct in LATENCY_PERCENTILES} if latencies else {},
+                saturated=pool_full > 0 or max_depth >= capacity
+            ))
+        return results
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Whole-run figures.
+
+        Returns:
+            Dict[str, Any]: Sustained TPS (confirmed load transactions per
+            second of load), the first saturated rate and when the pool first
+            saturated, and the highest rate sustained before it, with the
+            step results and samples
+        """
+        steps = self.results()
+        load_seconds = len(self.rates) * self.step
+        confirmed = sum(1 for at in self._confirmed.values() if at - self._start <= load_seconds)
+        saturated = next((step for step in steps if step.saturated), None)
+        capacity = MAX_PENDING_TRANSACTIONS * SATURATION_FRACTION
+        saturated_at = next((s.elapsed for s in self.samples if s.mempool_depth >= capacity), None)
+        full_times = [s.submitted_at - self._start for s in self._submissions if s.pool_full]
+        if full_times:
+            saturated_at = min(full_times + ([saturated_at] if saturated_at is not None else []))
+        sustained = [step.offered_rate for step in steps[:steps.index(saturated)]] if saturated else self.rates
+        return {
+            "sustained_tps": confirmed / load_seconds,
+            "saturation_rate": saturated.offered_rate if saturated else None,
+            "saturation_time": saturated_at,
+            "max_sustained_rate": max(sustained, default=None),
+            "blocks": len(self.blockchain.chain) - 1,
+            "submit": self.submit,
+            "steps": [asdict(step) for step in steps],
+            "samples": [asdict(sample) for sample in self.samples],
+        }
+
+    def _submit_loop(self, worker: int, rpc: Optional[_RPCThread]) -> None:
+        client = _RPCClient(rpc.server.host, rpc.server.port) if rpc else None
+        for index in range(worker, len(self._transactions), self.concurrency):
+            delay = self._start + self._schedule[index] - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            tx, submission = self._transactions[index], self._submissions[index]
+            submission.submitted_at = time.perf_counter()
+            if client is not None:
+                reason = client.send_transaction(tx)
+            else:
+                try:
+                    self.blockchain.add_pending_transaction(tx)
+                    reason = None
+                except TransactionError as e:
+                    reason = str(e)
+            # Judge by the rejection itself; the pool may have drained since
+            submission.accepted = reason is None
+            submission.pool_full = reason == POOL_FULL_REASON
+
+    def _on_block(self, event) -> None:
+        # Runs on the mining thread as the block is appended
+        now = time.perf_counter()
+        for tx in event.data["transactions"]:
+            if tx["tx_id"] in self._by_id:
+                self._confirmed.setdefault(tx["tx_id"], now)
+
+    def _sample(self, elapsed: float) -> None:
+        step = min(int(elapsed // self.step), len(self.rates) - 1)
+        submitted = [s for s in self._submissions if s.submitted_at]
+        self.samples.append(Sample(
+            elapsed=elapsed,
+            offered_rate=self.rates[step] if elapsed < len(self.rates) * self.step else 0.0,
+            mempool_depth=len(self.blockchain.pending_transactions),
+            height=len(self.blockchain.chain) - 1,
+            submitted=len(submitted),
+            rejected=sum(1 for s in submitted if not s.accepted),
+            confirmed=len(self._confirmed)
+        ))
+
+def format_report(summary: Dict[str, Any]) -> str:
+    columns = "".join(f" {f'p{pct} ms':>9}" for pct in LATENCY_PERCENTILES)
+    lines = [f"{'offered/s':>10} {'accepted/s':>11} {'confirmed/s':>12} {'rejected':>9} {'unconfirmed':>12}"
+             f"{columns} {'max pool':>9}"]
+    for step in summary["steps"]:
+        latencies = "".join(
+            f" {step['latency_ms'][f'p{pct}']:>9.0f}" if step["latency_ms"] else f" {'-':>9}"
+            for pct in LATENCY_PERCENTILES
+        )
+        lines.append(
+            f"{step['offered_rate']:>10.1f} {step['submitted_rate']:>11.1f} {step['confirmed_rate']:>12.1f} "
+            f"{step['rejected']:>9} {step['unconfirmed']:>12}{latencies} {step['max_mempool_depth']:>9}"
+            + ("  saturated" if step["saturated"] else "")
+        )
+
+    lines.append(f"\nSustained: {summary['sustained_tps']:.1f} confirmed tx/s over {summary['blocks']} blocks")
+    if summary["saturation_rate"] is None:
+        lines.append("Pending pool never saturated")
+    else:
+        lines.append(
+            f"Pending pool saturated at {summary['saturation_rate']:g} tx/s offered, "
+            f"{summary['saturation_time']:.1f}s into the run"
+        )
+        if summary["max_sustained_rate"] is not None:
+            lines.append(f"Highest rate sustained without saturating: {summary['max_sustained_rate']:g} tx/s")
+
+    lines.append(f"\n{'time s':>7} {'offered/s':>10} {'pool':>6} {'height':>7} {'submitted':>10} {'confirmed':>10}")
+    for sample in summary["samples"]:
+        lines.append(
+            f"{sample['elapsed']:>7.1f} {sample['offered_rate']:>10.1f} {sample['mempool_depth']:>6} "
+            f"{sample['height']:>7} {sample['submitted']:>10} {sample['confirmed']:>10}"
+        )
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offer synthetic transaction load to a mining node")
+    parser.add_argument("--rates", type=float, nargs="+", default=DEFAULT_RATES,
+                        help="Offered transactions per second, one step per rate")
+    parser.add_argument("--step", type=float, default=DEFAULT_STEP, help="Seconds per rate")
+    parser.add_argument("--wallets", type=int, default=DEFAULT_WALLETS, help="Simulated wallets")
+    parser.add_argument("--difficulty", type=int, default=DEFAULT_DIFFICULTY, help="Mining difficulty")
+    parser.add_argument("--adaptive-difficulty", action="store_true",
+                        help="Let proof of work retarget toward its block time instead of pinning the difficulty")
+    parser.add_argument("--submit", choices=[SUBMIT_DIRECT, SUBMIT_RPC], default=SUBMIT_DIRECT,
+                        help="Submit to the pending pool directly or through RPC sendTransaction")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Submitting threads")
+    parser.add_argument("--drain", type=float, default=DEFAULT_DRAIN,
+                        help="Seconds to keep mining after the load so late confirmations count")
+    parser.add_argument("--seed", type=int, help="Seed of the wallet and amount choices")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    # Rejections are counted in the report; logging each one would flood the output
+    for name in ("triadnet", "blockchain"):
+        logging.getLogger(name).setLevel(logging.CRITICAL)
+
+    generator = LoadGenerator(
+        args.rates, args.step, args.wallets, args.difficulty, args.adaptive_difficulty,
+        args.submit, args.concurrency, args.drain, args.seed
+    )
+    total = generator.prepare(lambda done, total: print(f"Signed {done}/{total} transactions", flush=True))
+    print(f"Offering {total} transactions from {args.wallets} wallets at {', '.join(f'{r:g}' for r in args.rates)} tx/s, "
+          f"{args.step:g}s each, difficulty {args.difficulty}", flush=True)
+    generator.run()
+    summary = generator.summary()
+    print(format_report(summary))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,12 @@
 from triadnet.core import Wallet, Blockchain, Transaction, FractalCoordinate
 from triadnet.core.mining_manager import MiningManager
 from triadnet.consensus.proof_of_work import ProofOfFractalWork, ConsensusManager
+from triadnet.logs import configure_logging
 import time
 import random
 
 def main():
+    configure_logging()
     # Create wallet and blockchain
     print("Initializing wallet and blockchain...")
     wallet = Wallet()
@@ -0,0 +1,12 @@
+"""Report p50/p95/p99 block lifecycle phase times from a trace file."""
+
+import os
+import sys
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain.tracing import main
+
+if __name__ == "__main__":
+    sys.exit(main())